@@ -18,6 +18,7 @@ from .__meta__ import (
 #
 
 from .arrays import (
+    SortedList,
     append,
     cat,
     chunk,
@@ -99,6 +100,7 @@ from .collections import (
     all_,
     any_,
     at,
+    bottom_k,
     collect,
     contains,
     count_by,
@@ -124,6 +126,8 @@ from .collections import (
     mapiter,
     max_,
     min_,
+    nlargest_by,
+    nsmallest_by,
     partition,
     pluck,
     reduce_,
@@ -140,6 +144,7 @@ from .collections import (
     sort_by_all,
     sort_by_order,
     to_list,
+    top_k,
     where,
 )
 
@@ -157,6 +162,7 @@ from .functions import (
     curry,
     curry_right,
     debounce,
+    defer,
     delay,
     disjoin,
     flow,
@@ -182,6 +188,8 @@ from .functions import (
 #
 
 from .numerical import (
+    QuantileSketch,
+    Stats,
     add,
     average,
     avg,
@@ -192,12 +200,21 @@ from .numerical import (
     median,
     moving_average,
     moving_avg,
+    moving_iter,
+    moving_max,
+    moving_min,
+    moving_sum,
+    moving_variance,
+    percentile,
     pow_,
     power,
+    quantile_sketch,
+    quantiles,
     round_,
     scale,
     sigma,
     slope,
+    stats,
     std_deviation,
     sum_,
     transpose,
@@ -215,6 +232,7 @@ from .objects import (
     callables,
     clone,
     clone_deep,
+    compile_path,
     deep_get,
     deep_has,
     deep_map_values,
@@ -318,6 +336,7 @@ from .predicates import (
 
 from .strings import (
     camel_case,
+    camel_case_many,
     capitalize,
     chars,
     chop,
@@ -335,18 +354,21 @@ from .strings import (
     explode,
     has_substr,
     human_case,
+    human_case_many,
     implode,
     insert_substr,
     join,
     js_match,
     js_replace,
     kebab_case,
+    kebab_case_many,
     lines,
     number_format,
     pad,
     pad_left,
     pad_right,
     pascal_case,
+    pascal_case_many,
     predecessor,
     prune,
     quote,
@@ -354,12 +376,16 @@ from .strings import (
     repeat,
     replace,
     separator_case,
+    separator_case_many,
     series_phrase,
     series_phrase_serial,
     slugify,
+    slugify_many,
     snake_case,
+    snake_case_many,
     split,
     start_case,
+    start_case_many,
     starts_with,
     strip_tags,
     substr_left,
@@ -418,6 +444,7 @@ from .utilities import (
 #
 
 from .exceptions import (
+    CancelledError,
     InvalidMethod
 )
 
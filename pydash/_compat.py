@@ -40,6 +40,7 @@ if PY3:
     def iteritems(d): return iter(d.items())
 
     _range = range
+    unichr = chr
 
     implements_to_string = _identity
     izip = zip
@@ -64,6 +65,7 @@ else:
     def iteritems(d): return d.iteritems()
 
     _range = xrange
+    unichr = unichr
     _cmp = cmp
 
     def implements_to_string(cls):
@@ -108,3 +110,20 @@ except ImportError:
             def __hash__(self):
                 raise TypeError('hash not implemented')
         return K
+
+try:
+    import tracemalloc
+except ImportError:
+    # This module is missing before PY34.
+    tracemalloc = None
+
+try:
+    import asyncio
+except ImportError:
+    # This module is missing before PY34.
+    asyncio = None
+    ensure_future = None
+else:
+    # Renamed from asyncio.async in PY34.
+    ensure_future = (getattr(asyncio, 'ensure_future', None) or
+                     getattr(asyncio, 'async'))
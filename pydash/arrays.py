@@ -7,14 +7,16 @@
 from __future__ import absolute_import
 
 from bisect import bisect_left, bisect_right
+from itertools import chain, islice
 from math import ceil
 
 import pydash as pyd
-from .helpers import itercallback, get_item
+from .helpers import itercallback, get_item, SeenSet
 from ._compat import cmp_to_key
 
 
 __all__ = (
+    'SortedList',
     'append',
     'cat',
     'chunk',
@@ -75,6 +77,491 @@ __all__ = (
 )
 
 
+class SortedList(object):
+    """List that keeps its values in sorted order as values are added and
+    removed. If `callback` is provided, values are ordered by the result of
+    calling it on each value. The callback is invoked with one argument:
+    ``(value)``. If a property name is passed for callback, the created
+    :func:`pydash.collections.pluck` style callback will return the property
+    value of the given element. Values with equal sort keys are kept in the
+    order they were added.
+
+    Values are stored in sublists of at most ``2 * load`` values along with a
+    binary indexed tree of the sublist lengths so that adding, removing,
+    bisecting, and indexing a value costs ``O(log n)`` comparisons plus a
+    small bounded amount of list shifting instead of moving every value of one
+    large list.
+
+    Args:
+        iterable (list, optional): Values to initialize list with.
+        callback (mixed, optional): Callback to determine sort key.
+
+    Example:
+
+        >>> scores = SortedList([5, 1, 4], lambda x: -x)
+        >>> list(scores)
+        [5, 4, 1]
+        >>> scores.add(3)
+        >>> scores[2]
+        3
+        >>> scores.bisect_left(4)
+        1
+        >>> sorted_index(scores, 2)
+        3
+        >>> list(scores.irange(4, 1))
+        [4, 3, 1]
+
+    .. versionadded:: 3.4.0
+    """
+    #: Target sublist size. Sublists are split in half once they grow past
+    #: twice this size.
+    load = 1000
+
+    def __init__(self, iterable=None, callback=None):
+        self.callback = None if callback is None else pyd.iteratee(callback)
+        self._len = 0
+        self._lists = []
+        self._keys = self._lists if self.callback is None else []
+        self._maxes = []
+        self._index = None
+
+        if iterable is not None:
+            self.update(iterable)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        return chain.from_iterable(reversed(values)
+                                   for values in reversed(self._lists))
+
+    def __contains__(self, value):
+        return self._find(value) is not None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+
+            if step == 1:
+                return list(self._iter_range(start, stop))
+
+            return list(self)[index]
+
+        pos, idx = self._locate(index)
+        return self._lists[pos][idx]
+
+    def __delitem__(self, index):
+        pos, idx = self._locate(index)
+        self._delete(pos, idx)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, list(self))
+
+    def add(self, value):
+        """Add `value` to the list while maintaining sort order.
+
+        Args:
+            value (mixed): Value to add.
+        """
+        key = self._key(value)
+        lists, keys, maxes = self._lists, self._keys, self._maxes
+
+        if not maxes:
+            lists.append([value])
+
+            if keys is not lists:
+                keys.append([key])
+
+            maxes.append(key)
+            self._index = None
+        else:
+            pos = bisect_right(maxes, key)
+
+            if pos == len(maxes):
+                pos -= 1
+                lists[pos].append(value)
+
+                if keys is not lists:
+                    keys[pos].append(key)
+
+                maxes[pos] = key
+            else:
+                idx = bisect_right(keys[pos], key)
+                lists[pos].insert(idx, value)
+
+                if keys is not lists:
+                    keys[pos].insert(idx, key)
+
+            self._update_index(pos, 1)
+            self._split(pos)
+
+        self._len += 1
+
+    def update(self, iterable):
+        """Add all values from `iterable` to the list.
+
+        Args:
+            iterable (list): Values to add.
+        """
+        values = list(self)
+        values.extend(iterable)
+
+        if self.callback is None:
+            values.sort()
+        else:
+            values.sort(key=self.callback)
+
+        self._rebuild(values)
+
+    def remove(self, value):
+        """Remove first occurrence of `value` from the list.
+
+        Args:
+            value (mixed): Value to remove.
+
+        Raises:
+            ValueError: If `value` isn't in the list.
+        """
+        location = self._find(value)
+
+        if location is None:
+            raise ValueError('{0!r} not in list'.format(value))
+
+        self._delete(*location)
+
+    def discard(self, value):
+        """Remove first occurrence of `value` from the list if it's present.
+
+        Args:
+            value (mixed): Value to remove.
+        """
+        location = self._find(value)
+
+        if location is not None:
+            self._delete(*location)
+
+    def pop(self, index=-1):
+        """Remove and return value at `index`.
+
+        Args:
+            index (int, optional): Index of value to remove. Defaults to last
+                value.
+
+        Returns:
+            mixed: Removed value.
+        """
+        pos, idx = self._locate(index)
+        value = self._lists[pos][idx]
+        self._delete(pos, idx)
+        return value
+
+    def clear(self):
+        """Remove all values from the list."""
+        self._rebuild([])
+
+    def bisect_left(self, value):
+        """Return the smallest index at which `value` could be inserted while
+        maintaining sort order.
+
+        Args:
+            value (mixed): Value to evaluate.
+
+        Returns:
+            int: Smallest index.
+        """
+        return self.bisect_key_left(self._key(value))
+
+    def bisect_right(self, value):
+        """Return the highest index at which `value` could be inserted while
+        maintaining sort order.
+
+        Args:
+            value (mixed): Value to evaluate.
+
+        Returns:
+            int: Highest index.
+        """
+        return self.bisect_key_right(self._key(value))
+
+    def bisect_key_left(self, key):
+        """Like :meth:`bisect_left` except that `key` is an already computed
+        sort key.
+        """
+        pos = bisect_left(self._maxes, key)
+
+        if pos == len(self._maxes):
+            return self._len
+
+        return self._offset(pos) + bisect_left(self._keys[pos], key)
+
+    def bisect_key_right(self, key):
+        """Like :meth:`bisect_right` except that `key` is an already computed
+        sort key.
+        """
+        pos = bisect_right(self._maxes, key)
+
+        if pos == len(self._maxes):
+            return self._len
+
+        return self._offset(pos) + bisect_right(self._keys[pos], key)
+
+    def count(self, value):
+        """Return number of occurrences of `value`.
+
+        Args:
+            value (mixed): Value to count.
+
+        Returns:
+            int: Number of occurrences.
+        """
+        key = self._key(value)
+        start = self.bisect_key_left(key)
+        stop = self.bisect_key_right(key)
+
+        return sum(1 for item in self._iter_range(start, stop)
+                   if item == value)
+
+    def index(self, value):
+        """Return index of first occurrence of `value`, i.e., its rank.
+
+        Args:
+            value (mixed): Value to find.
+
+        Returns:
+            int: Index of `value`.
+
+        Raises:
+            ValueError: If `value` isn't in the list.
+        """
+        location = self._find(value)
+
+        if location is None:
+            raise ValueError('{0!r} not in list'.format(value))
+
+        pos, idx = location
+
+        return self._offset(pos) + idx
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """Return an iterator over values whose sort keys are between the sort
+        keys of `minimum` and `maximum`. A `minimum` or `maximum` of ``None``
+        leaves that end of the range unbounded.
+
+        Args:
+            minimum (mixed, optional): Lower bound value.
+            maximum (mixed, optional): Upper bound value.
+            inclusive (tuple, optional): Pair of booleans indicating whether
+                the lower and upper bounds are included. Defaults to
+                ``(True, True)``.
+
+        Returns:
+            iterator: Values within range.
+        """
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_left(minimum)
+        else:
+            start = self.bisect_right(minimum)
+
+        if maximum is None:
+            stop = self._len
+        elif inclusive[1]:
+            stop = self.bisect_right(maximum)
+        else:
+            stop = self.bisect_left(maximum)
+
+        return self._iter_range(start, stop)
+
+    def _key(self, value):
+        """Return sort key for `value`."""
+        return value if self.callback is None else self.callback(value)
+
+    def _rebuild(self, values):
+        """Rebuild sublists from sorted `values`."""
+        load = self.load
+
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+
+        if self.callback is None:
+            self._keys = self._lists
+        else:
+            self._keys = [[self.callback(value) for value in values]
+                          for values in self._lists]
+
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._len = len(values)
+        self._index = None
+
+    def _split(self, pos):
+        """Split sublist at `pos` in half if it has grown too large."""
+        lists, keys = self._lists, self._keys
+
+        if len(lists[pos]) <= 2 * self.load:
+            return
+
+        load = self.load
+        values = lists[pos]
+        lists.insert(pos + 1, values[load:])
+        del values[load:]
+
+        if keys is not lists:
+            sort_keys = keys[pos]
+            keys.insert(pos + 1, sort_keys[load:])
+            del sort_keys[load:]
+
+        self._maxes.insert(pos, keys[pos][-1])
+        self._index = None
+
+    def _delete(self, pos, idx):
+        """Delete value at `idx` of sublist at `pos`."""
+        lists, keys = self._lists, self._keys
+
+        del lists[pos][idx]
+
+        if keys is not lists:
+            del keys[pos][idx]
+
+        if lists[pos]:
+            self._maxes[pos] = keys[pos][-1]
+            self._update_index(pos, -1)
+        else:
+            del lists[pos]
+
+            if keys is not lists:
+                del keys[pos]
+
+            del self._maxes[pos]
+            self._index = None
+
+        self._len -= 1
+
+    def _find(self, value):
+        """Return ``(pos, idx)`` location of first occurrence of `value` or
+        ``None`` if not found.
+        """
+        key = self._key(value)
+        lists, keys, maxes = self._lists, self._keys, self._maxes
+        pos = bisect_left(maxes, key)
+
+        if pos == len(maxes):
+            return None
+
+        idx = bisect_left(keys[pos], key)
+
+        # Values with equal sort keys may not be equal to each other and may
+        # span multiple sublists so scan through them.
+        while pos < len(lists):
+            values, sort_keys = lists[pos], keys[pos]
+
+            while idx < len(values):
+                if sort_keys[idx] != key:
+                    return None
+
+                if values[idx] == value:
+                    return pos, idx
+
+                idx += 1
+
+            pos += 1
+            idx = 0
+
+        return None
+
+    def _build_index(self):
+        """Return binary indexed tree of sublist lengths, building it if it
+        was invalidated by a change to the number of sublists.
+        """
+        if self._index is None:
+            size = len(self._lists)
+            tree = [0] + [len(values) for values in self._lists]
+
+            for i in range(1, size + 1):
+                parent = i + (i & -i)
+
+                if parent <= size:
+                    tree[parent] += tree[i]
+
+            self._index = tree
+
+        return self._index
+
+    def _update_index(self, pos, delta):
+        """Adjust length of sublist at `pos` by `delta` in the index."""
+        tree = self._index
+
+        if tree is None:
+            return
+
+        i = pos + 1
+        size = len(tree) - 1
+
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, pos):
+        """Return index of first value of sublist at `pos`."""
+        tree = self._build_index()
+        total = 0
+
+        while pos > 0:
+            total += tree[pos]
+            pos -= pos & -pos
+
+        return total
+
+    def _locate(self, index):
+        """Return ``(pos, idx)`` location of value at `index`."""
+        if index < 0:
+            index += self._len
+
+        if not 0 <= index < self._len:
+            raise IndexError('list index out of range')
+
+        tree = self._build_index()
+        size = len(tree) - 1
+        pos = 0
+        step = 1
+
+        while step * 2 <= size:
+            step *= 2
+
+        # Walk down the tree to find the last sublist whose starting index is
+        # at most index.
+        while step:
+            if pos + step <= size and tree[pos + step] <= index:
+                pos += step
+                index -= tree[pos]
+
+            step //= 2
+
+        return pos, index
+
+    def _iter_range(self, start, stop):
+        """Iterate over values from index `start` up to `stop`."""
+        if start >= stop:
+            return
+
+        pos, idx = self._locate(start)
+        remaining = stop - start
+
+        for values in islice(self._lists, pos, None):
+            chunk = values[idx:idx + remaining]
+
+            for value in chunk:
+                yield value
+
+            remaining -= len(chunk)
+            idx = 0
+
+            if remaining <= 0:
+                break
+
+
 def cat(*arrays):
     """Concatenates zero or more lists into one.
 
@@ -1027,7 +1514,14 @@ def sorted_index(array, value, callback=None):
         1
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Use ``O(log n)`` bisection of :class:`SortedList` instances when no
+        `callback` is given.
     """
+    if isinstance(array, SortedList) and not callback:
+        return array.bisect_left(value)
+
     if callback:
         # Generate array of sorted keys computed using callback.
         callback = pyd.iteratee(callback)
@@ -1056,7 +1550,14 @@ def sorted_last_index(array, value, callback=None):
         3
 
     .. versionadded:: 1.1.0
+
+    .. versionchanged:: 3.4.0
+        Use ``O(log n)`` bisection of :class:`SortedList` instances when no
+        `callback` is given.
     """
+    if isinstance(array, SortedList) and not callback:
+        return array.bisect_right(value)
+
     if callback:
         # Generate array of sorted keys computed using callback.
         callback = pyd.iteratee(callback)
@@ -1579,17 +2080,15 @@ def iterintersperse(iterable, separator):
 
 def iterunique(array):
     """Return iterator to find unique list."""
-    seen = []
+    seen = SeenSet()
     for i, item in enumerate(array):
-        if item not in seen:
-            seen.append(item)
+        if seen.add(item):
             yield (i, item)
 
 
 def iterduplicates(array):
-    seen = []
+    """Return iterator to find duplicates in list."""
+    seen = SeenSet()
     for i, item in enumerate(array):
-        if item in seen:
+        if not seen.add(item):
             yield (i, item)
-        else:
-            seen.append(item)
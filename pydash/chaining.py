@@ -6,8 +6,13 @@
 
 from __future__ import absolute_import, print_function
 
+from itertools import islice
+from threading import Lock
+from timeit import default_timer
+
 import pydash as pyd
-from .helpers import NoValue
+from .helpers import NoValue, SeenSet, itercallback
+from ._compat import integer_types, tracemalloc
 
 
 __all__ = (
@@ -26,17 +31,25 @@ class Chain(object):
     def __init__(self, value=NoValue):
         self._value = value
 
-    def value(self):
+    def value(self, lazy=False):
         """Return current value of the chain operations.
 
+        Args:
+            lazy (bool, optional): Whether to evaluate consecutive streamable
+                methods lazily in a single pass. See :meth:`__call__`.
+                Defaults to ``False``.
+
         Returns:
             mixed: Current value of chain operations.
 
         See Also:
             - :meth:`value` (main definition)
             - :meth:`value_of` (alias)
+
+        .. versionchanged:: 3.4.0
+            Added `lazy` argument.
         """
-        return self(self._value)
+        return self(self._value, lazy=lazy)
 
     value_of = value
     run = value
@@ -49,6 +62,72 @@ class Chain(object):
         """
         return self.module.to_string(self.value())
 
+    def profile(self, value=NoValue, hook=None, trace_memory=False):
+        """Evaluate the chain while recording the wall time, input and output
+        sizes, and optionally the peak memory allocated by each chained
+        method.
+
+        Args:
+            value (mixed, optional): Initial value to pass through chained
+                methods. Defaults to the chain's value.
+            hook (callable, optional): Function called with a ``dict`` that
+                describes each evaluated method as soon as it finishes. See
+                :class:`ChainProfile`.
+            trace_memory (bool, optional): Whether to measure peak memory
+                allocation of each method with :mod:`tracemalloc`. Defaults to
+                ``False``.
+
+        Returns:
+            ChainProfile: Profile whose :attr:`ChainProfile.value` is the
+                result of the chain.
+
+        Example:
+
+            >>> chained = chain([3, 1, 2]).map(lambda x: x * 2).sort_by()
+            >>> profile = chained.profile()
+            >>> profile.value
+            [2, 4, 6]
+            >>> [(step['method'], step['calls'], step['output_size'])
+            ...  for step in profile.report()]
+            [('map_', 1, 3), ('sort_by', 1, 3)]
+
+        .. versionadded:: 3.4.0
+        """
+        profile = ChainProfile(hook=hook, trace_memory=trace_memory)
+        profile.value = self.compile(profile=profile)(value)
+
+        return profile
+
+    def compile(self, lazy=False, profile=None):
+        """Return a :class:`CompiledChain` which evaluates the chained methods
+        on the value it is called with. The chain is flattened into a tuple of
+        steps once so that calling the compiled chain doesn't walk or copy
+        the :class:`ChainWrapper` objects of the chain. A compiled chain can
+        be pickled if all of the arguments passed to the chained methods can
+        be pickled.
+
+        Args:
+            lazy (bool, optional): Whether to evaluate consecutive streamable
+                methods lazily in a single pass. See :meth:`__call__`.
+                Defaults to ``False``.
+            profile (bool|ChainProfile, optional): Whether to record a profile
+                of each call in :attr:`CompiledChain.profile`. A
+                :class:`ChainProfile` can be passed to customize profiling.
+                Defaults to ``None``.
+
+        Returns:
+            CompiledChain: Compiled chain.
+
+        .. versionadded:: 3.4.0
+        """
+        if isinstance(self._value, ChainWrapper):
+            # pylint: disable=maybe-no-member
+            value, steps = self._value.flatten()
+        else:
+            value, steps = self._value, []
+
+        return CompiledChain(steps, value, lazy=lazy, profile=profile)
+
     def commit(self):
         """Executes the chained sequence and returns the wrapped result.
 
@@ -127,18 +206,34 @@ class Chain(object):
         """
         return ChainWrapper(self._value, self.get_method(attr))
 
-    def __call__(self, value):
+    def __call__(self, value, lazy=False):
         """Return result of passing `value` through chained methods.
 
+        When `lazy` is ``True``, consecutive methods found in
+        :data:`LAZY_METHODS` (e.g. ``map_``, ``filter_``, and ``take``) are
+        fused into a single generator pipeline so that no intermediate lists
+        are built and iteration stops as soon as a method like ``take`` has
+        all the items it needs. A pipeline is only started for ``list`` and
+        iterator values and is converted to a ``list`` before any other method
+        is evaluated. Since no intermediate lists exist, callbacks which
+        accept the collection as their third argument receive the iterator of
+        the previous method instead of its list of results.
+
         Args:
             value (mixed): Initial value to pass through chained methods.
+            lazy (bool, optional): Whether to evaluate consecutive streamable
+                methods lazily in a single pass. Defaults to ``False``.
 
         Returns:
             mixed: Result of method chain evaluation of `value`.
+
+        .. versionchanged:: 3.4.0
+            Added `lazy` argument.
         """
         if isinstance(self._value, ChainWrapper):
             # pylint: disable=maybe-no-member
-            value = self._value.unwrap(value)
+            value, steps = self._value.flatten(value)
+            value = evaluate(value, fuse_all_steps(steps), lazy=lazy)
         return value
 
 
@@ -169,6 +264,7 @@ class ChainWrapper(object):
         # Otherwise, we'd locked the chain wrapper value permanently and not be
         # able to reuse it.
         wrapper = self._generate()
+        wrapper.fuse()
 
         if isinstance(wrapper._value, ChainWrapper):
             # pylint: disable=no-member,maybe-no-member
@@ -182,6 +278,42 @@ class ChainWrapper(object):
 
         return wrapper.method(value, *wrapper.args, **wrapper.kargs)
 
+    def fuse(self):
+        """Replace this wrapper's method and the method of the
+        :class:`ChainWrapper` it wraps with a single method that computes the
+        same result more efficiently if one exists in :data:`FUSED_METHODS`.
+        """
+        inner = self._value
+
+        if not isinstance(inner, ChainWrapper):
+            return
+
+        fused = fuse_steps((inner.method, inner.args, inner.kargs),
+                           (self.method, self.args, self.kargs))
+
+        if fused is not None:
+            self._value = inner._value
+            self.method, self.args, self.kargs = fused
+
+    def flatten(self, value=NoValue):
+        """Return the initial chain value and the list of ``(method, args,
+        kargs)`` steps from the first chained method to this one. If `value` is
+        given, it overrides the initial chain value.
+        """
+        steps = []
+        wrapper = self
+
+        while isinstance(wrapper, ChainWrapper):
+            steps.append((wrapper.method, wrapper.args, wrapper.kargs))
+            wrapper = wrapper._value
+
+        steps.reverse()
+
+        if value is NoValue or isinstance(value, ChainWrapper):
+            value = wrapper
+
+        return value, steps
+
     def __call__(self, *args, **kargs):
         """Invoke the :attr:`method` with :attr:`value` as the first argument
         and return a new :class:`Chain` object with the return value.
@@ -195,6 +327,166 @@ class ChainWrapper(object):
         return Chain(self)
 
 
+class CompiledChain(object):
+    """Callable that evaluates a flattened sequence of chain methods. Created
+    by :meth:`Chain.compile`.
+
+    Args:
+        steps (list): List of ``(method, args, kargs)`` tuples to evaluate in
+            order.
+        value (mixed, optional): Initial value used when the compiled chain is
+            called without a value.
+        lazy (bool, optional): Whether to evaluate consecutive streamable
+            methods lazily in a single pass. Defaults to ``False``.
+        profile (bool|ChainProfile, optional): Whether to record a profile of
+            each call in :attr:`profile`. Profiled calls are always evaluated
+            eagerly so that the time of each method can be measured. Defaults
+            to ``None``.
+    """
+    def __init__(self, steps, value=NoValue, lazy=False, profile=None):
+        self.steps = tuple(fuse_all_steps(steps))
+        self.value = value
+        self.lazy = lazy
+
+        if profile is True:
+            profile = ChainProfile()
+
+        self.profile = profile or None
+
+    def __repr__(self):
+        return '{0}({1})'.format(self.__class__.__name__,
+                                 ', '.join(getattr(method, '__name__',
+                                                   repr(method))
+                                           for method, _, _ in self.steps))
+
+    def __call__(self, value=NoValue):
+        """Return result of passing `value`, or the initial chain value if
+        `value` isn't given, through the compiled methods.
+        """
+        if value is NoValue:
+            value = self.value
+
+        if self.profile is not None:
+            return self.profile.evaluate(value, self.steps)
+
+        return evaluate(value, self.steps, lazy=self.lazy)
+
+
+class ChainProfile(object):
+    """Per-method profile of chain evaluations. Each evaluated method is
+    described by a ``dict`` with the keys:
+
+    - ``index``: Position of the method in the chain.
+    - ``method``: Name of the method.
+    - ``time``: Wall time in seconds.
+    - ``input_size``: Length of the value passed to the method or ``None`` if
+      it has no length.
+    - ``output_size``: Length of the value returned by the method or ``None``
+      if it has no length.
+    - ``memory_peak``: Peak memory in bytes allocated while the method ran or
+      ``None`` if memory isn't traced. Memory is only traced while nothing
+      else is tracing it so that the peaks of other :mod:`tracemalloc` users
+      aren't reset.
+
+    These are passed to `hook` after each method finishes. :meth:`report`
+    combines them per method over every evaluation where ``time`` is the
+    total time, ``memory_peak`` is the largest peak, the sizes are from the
+    last evaluation, and ``calls`` is the number of evaluations.
+
+    Args:
+        hook (callable, optional): Function called with the ``dict``
+            describing each evaluated method.
+        trace_memory (bool, optional): Whether to measure peak memory
+            allocation of each method with :mod:`tracemalloc`. Ignored if
+            :mod:`tracemalloc` isn't available or can't reset its peak
+            (Python < 3.9). Defaults to ``False``.
+
+    Attributes:
+        value (mixed): Result of the last evaluation.
+    """
+    def __init__(self, hook=None, trace_memory=False):
+        self.hook = hook
+        self.trace_memory = (trace_memory and
+                             hasattr(tracemalloc, 'reset_peak'))
+        self.value = NoValue
+        self._records = []
+        self._lock = Lock()
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self.report())
+
+    def report(self):
+        """Return list of ``dict`` profiles for each method of the chain."""
+        with self._lock:
+            return [dict(record) for record in self._records]
+
+    def evaluate(self, value, steps):
+        """Return result of evaluating each chain step of `steps` on `value`
+        while profiling each step.
+        """
+        started_tracing = False
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+
+        try:
+            for index, (method, args, kargs) in enumerate(steps):
+                event = {
+                    'index': index,
+                    'method': getattr(method, '__name__', repr(method)),
+                    'input_size': sizeof(value),
+                    'memory_peak': None,
+                }
+
+                if started_tracing:
+                    memory_start = reset_traced_memory_peak()
+
+                start = default_timer()
+                value = method(value, *args, **kargs)
+                event['time'] = default_timer() - start
+
+                if started_tracing:
+                    event['memory_peak'] = max(
+                        tracemalloc.get_traced_memory()[1] - memory_start, 0)
+
+                event['output_size'] = sizeof(value)
+                self.record(event)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        return value
+
+    def record(self, event):
+        """Add evaluated method `event` to profile and pass it to
+        :attr:`hook`.
+        """
+        with self._lock:
+            while len(self._records) <= event['index']:
+                self._records.append({'index': len(self._records),
+                                      'method': None,
+                                      'calls': 0,
+                                      'time': 0.0,
+                                      'input_size': None,
+                                      'output_size': None,
+                                      'memory_peak': None})
+
+            record = self._records[event['index']]
+            record['method'] = event['method']
+            record['calls'] += 1
+            record['time'] += event['time']
+            record['input_size'] = event['input_size']
+            record['output_size'] = event['output_size']
+
+            if event['memory_peak'] is not None:
+                record['memory_peak'] = max(record['memory_peak'] or 0,
+                                            event['memory_peak'])
+
+        if self.hook is not None:
+            self.hook(event)
+
+
 class _Dash(object):
     """Class that provides attribute access to valid :mod:`pydash` methods and
     callable access to :mod:`pydash` method chaining.
@@ -311,3 +603,251 @@ def thru(value, interceptor):
     .. versionadded:: 2.0.0
     """
     return interceptor(value)
+
+
+#
+# Utility methods not a part of the main API
+#
+
+def pydash_method_name(method):
+    """Return name of `method` if it is a :mod:`pydash` function or ``None``
+    otherwise.
+    """
+    name = getattr(method, '__name__', None)
+
+    if name is None or getattr(pyd, name, None) is not method:
+        name = None
+
+    return name
+
+
+def fuse_steps(inner, outer):
+    """Return single ``(method, args, kargs)`` step which computes the same
+    result as the consecutive steps `inner` and `outer` if they can be fused
+    using :data:`FUSED_METHODS` or ``None`` otherwise.
+    """
+    fuser = FUSED_METHODS.get((pydash_method_name(inner[0]),
+                               pydash_method_name(outer[0])))
+
+    if fuser is None:
+        return None
+
+    return fuser(inner, outer)
+
+
+def fuse_all_steps(steps):
+    """Return list of `steps` with each pair of consecutive steps that can be
+    fused replaced by their fused step.
+    """
+    fused = []
+
+    for step in steps:
+        step_fused = fuse_steps(fused[-1], step) if fused else None
+
+        if step_fused is None:
+            fused.append(step)
+        else:
+            fused[-1] = step_fused
+
+    return fused
+
+
+def fuse_sort_by_take(sort_by_step, take_step):
+    """Return step which selects the first items of a sorted collection with
+    :func:`pydash.collections.nsmallest_by` or
+    :func:`pydash.collections.nlargest_by` instead of sorting the entire
+    collection. Returns ``None`` to leave the steps unfused unless the number
+    of items to take is a non-negative ``int``.
+    """
+    def sort_by_options(callback=None, reverse=False):
+        # pylint: disable=missing-docstring
+        return callback, reverse
+
+    def take_options(n=1):  # pylint: disable=missing-docstring
+        return n
+
+    callback, reverse = sort_by_options(*sort_by_step[1], **sort_by_step[2])
+    n = take_options(*take_step[1], **take_step[2])
+
+    if not is_index(n):
+        return None
+
+    method = pyd.nlargest_by if reverse else pyd.nsmallest_by
+
+    return method, (n, callback), {}
+
+
+#: Functions which fuse consecutive chain methods keyed by the names of the
+#: methods in the order they are chained.
+FUSED_METHODS = {
+    ('sort_by', 'take'): fuse_sort_by_take,
+}
+
+
+def evaluate(value, steps, lazy=False):
+    """Return result of evaluating each chain step of `steps` on `value` in
+    order.
+    """
+    if lazy:
+        return evaluate_lazy(value, steps)
+
+    for method, args, kargs in steps:
+        value = method(value, *args, **kargs)
+
+    return value
+
+
+def evaluate_lazy(value, steps):
+    """Evaluate chain `steps` on `value` while streaming consecutive steps
+    found in :data:`LAZY_METHODS` through a single generator pipeline.
+    """
+    stream = None
+
+    for method, args, kargs in steps:
+        lazy_method = LAZY_METHODS.get(pydash_method_name(method))
+
+        if kargs.get('parallel'):
+            # Parallel methods need their whole input up front.
+            lazy_method = None
+
+        if lazy_method is not None and stream is None:
+            if isinstance(value, list) or is_iterator(value):
+                stream = value
+
+        if lazy_method is not None and stream is not None:
+            stream = lazy_method(stream, *args, **kargs)
+            continue
+
+        if stream is not None:
+            value = list(stream)
+            stream = None
+
+        value = method(value, *args, **kargs)
+
+    if stream is not None:
+        value = list(stream)
+
+    return value
+
+
+def reset_traced_memory_peak():
+    """Reset the peak traced by :mod:`tracemalloc` and return the size of the
+    currently traced memory.
+    """
+    tracemalloc.reset_peak()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def sizeof(value):
+    """Return length of `value` or ``None`` if it has no length."""
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+def is_index(value):
+    """Return whether `value` is a non-negative ``int``."""
+    return isinstance(value, integer_types) and value >= 0
+
+
+def is_iterator(value):
+    """Return whether `value` is an iterator."""
+    return hasattr(value, '__next__') or hasattr(value, 'next')
+
+
+def lazy_compact(array):
+    """Lazy version of :func:`pydash.arrays.compact`."""
+    return (item for item in array if item)
+
+
+def lazy_drop(array, n=1):
+    """Lazy version of :func:`pydash.arrays.drop`."""
+    if not isinstance(n, integer_types):
+        return iter(pyd.drop(list(array), n))
+    return islice(array, max(n, 0), None)
+
+
+def lazy_drop_while(array, callback=None):
+    """Lazy version of :func:`pydash.arrays.drop_while`."""
+    items = iter(array)
+
+    for is_true, value, _, _ in itercallback(items, callback):
+        if not is_true:
+            yield value
+            break
+
+    for value in items:
+        yield value
+
+
+def lazy_filter(collection, callback=None):
+    """Lazy version of :func:`pydash.collections.filter_`."""
+    return (value
+            for is_true, value, _, _ in itercallback(collection, callback)
+            if is_true)
+
+
+def lazy_flatten(array, is_deep=False):
+    """Lazy version of :func:`pydash.arrays.flatten`."""
+    return pyd.arrays.iterflatten(array, is_deep=is_deep)
+
+
+def lazy_map(collection, callback=None):
+    """Lazy version of :func:`pydash.collections.map_`."""
+    return pyd.mapiter(collection, callback)
+
+
+def lazy_mapcat(array, callback=None):
+    """Lazy version of :func:`pydash.arrays.mapcat`."""
+    return pyd.arrays.iterflatten(pyd.mapiter(array, callback))
+
+
+def lazy_reject(collection, callback=None):
+    """Lazy version of :func:`pydash.collections.reject`."""
+    return (value
+            for is_true, value, _, _ in itercallback(collection, callback)
+            if not is_true)
+
+
+def lazy_take(array, n=1):
+    """Lazy version of :func:`pydash.arrays.take`."""
+    if not isinstance(n, integer_types):
+        return iter(pyd.take(list(array), n))
+    return islice(array, max(n, 0))
+
+
+def lazy_take_while(array, callback=None):
+    """Lazy version of :func:`pydash.arrays.take_while`."""
+    for is_true, value, _, _ in itercallback(array, callback):
+        if not is_true:
+            break
+        yield value
+
+
+def lazy_uniq(array, callback=None):
+    """Lazy version of :func:`pydash.arrays.uniq`."""
+    cbk = pyd.iteratee(callback) if callback else None
+    seen = SeenSet()
+
+    for item in array:
+        if seen.add(cbk(item) if cbk else item):
+            yield item
+
+
+#: Lazy generator versions of chain methods keyed by method name. Each takes
+#: the same arguments as the method it replaces but accepts and returns an
+#: iterable.
+LAZY_METHODS = {
+    'compact': lazy_compact,
+    'drop': lazy_drop,
+    'drop_while': lazy_drop_while,
+    'filter_': lazy_filter,
+    'flatten': lazy_flatten,
+    'map_': lazy_map,
+    'mapcat': lazy_mapcat,
+    'reject': lazy_reject,
+    'take': lazy_take,
+    'take_while': lazy_take_while,
+    'uniq': lazy_uniq,
+}
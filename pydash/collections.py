@@ -6,18 +6,22 @@
 
 from __future__ import absolute_import
 
+import heapq
+import multiprocessing
 import random
 
 import pydash as pyd
 
-from .helpers import itercallback, iterator, call_callback
-from ._compat import cmp_to_key, _cmp
+from .helpers import (NoValue, getargcount, itercallback, iterator,
+                      call_callback)
+from ._compat import _range, iteritems, izip
 
 
 __all__ = (
     'all_',
     'any_',
     'at',
+    'bottom_k',
     'collect',
     'contains',
     'count_by',
@@ -43,6 +47,8 @@ __all__ = (
     'mapiter',
     'max_',
     'min_',
+    'nlargest_by',
+    'nsmallest_by',
     'partition',
     'pluck',
     'reduce_',
@@ -59,6 +65,7 @@ __all__ = (
     'sort_by_all',
     'sort_by_order',
     'to_list',
+    'top_k',
     'where',
 )
 
@@ -128,17 +135,25 @@ def contains(collection, target, from_index=0):
 include = contains
 
 
-def count_by(collection, callback=None):
+def count_by(collection, callback=None, parallel=None):
     """Creates an object composed of keys generated from the results of running
     each element of `collection` through the callback.
 
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        parallel (bool|int|Pool, optional): Number of worker processes to
+            run `callback` in, ``True`` for one per CPU, or an existing
+            ``multiprocessing.Pool`` to reuse. Defaults to ``None`` which runs
+            `callback` in the current process.
 
     Returns:
         dict: Dict containing counts by key.
 
+    Raises:
+        ValueError: If `parallel` is used with a callback that takes the
+            collection as third argument.
+
     Example:
 
         >>> results = count_by([1, 2, 1, 2, 3, 4])
@@ -149,7 +164,20 @@ def count_by(collection, callback=None):
         >>> assert results == {1: 2, 3: 2}
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `parallel` argument.
     """
+    if parallel:
+        ret = {}
+
+        for counts in parallel_chunks(iterator(collection), callback,
+                                      parallel, 'count'):
+            for key, count in iteritems(counts):
+                ret[key] = ret.get(key, 0) + count
+
+        return ret
+
     ret = {}
 
     for result in itercallback(collection, callback):
@@ -231,17 +259,25 @@ def every(collection, callback=None):
 all_ = every
 
 
-def filter_(collection, callback=None):
+def filter_(collection, callback=None, parallel=None):
     """Iterates over elements of a collection, returning a list of all elements
     the callback returns truthy for.
 
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        parallel (bool|int|Pool, optional): Number of worker processes to
+            run `callback` in, ``True`` for one per CPU, or an existing
+            ``multiprocessing.Pool`` to reuse. Defaults to ``None`` which runs
+            `callback` in the current process.
 
     Returns:
         list: Filtered list.
 
+    Raises:
+        ValueError: If `parallel` is used with a callback that takes the
+            collection as third argument.
+
     Example:
 
         >>> results = filter_([{'a': 1}, {'b': 2}, {'a': 1, 'b': 3}], {'a': 1})
@@ -254,7 +290,15 @@ def filter_(collection, callback=None):
         - :func:`filter_` (alias)
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `parallel` argument.
     """
+    if parallel:
+        return [value for value, is_true
+                in parallel_mask(collection, callback, parallel)
+                if is_true]
+
     return [value
             for is_true, value, _, _ in itercallback(collection, callback)
             if is_true]
@@ -397,13 +441,17 @@ def for_each_right(collection, callback):
 each_right = for_each_right
 
 
-def group_by(collection, callback=None):
+def group_by(collection, callback=None, parallel=None):
     """Creates an object composed of keys generated from the results of running
     each element of a `collection` through the callback.
 
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        parallel (bool|int|Pool, optional): Number of worker processes to
+            run `callback` in, ``True`` for one per CPU, or an existing
+            ``multiprocessing.Pool`` to reuse. Defaults to ``None`` which runs
+            `callback` in the current process.
 
     Returns:
         dict: Results of grouping by `callback`.
@@ -417,7 +465,24 @@ def group_by(collection, callback=None):
                                True: [{'a': 1, 'b': 2}]}
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `parallel` argument.
     """
+    if parallel:
+        items = list(collection)
+        ret = {}
+
+        # Workers only return the indexes of each group's items so that the
+        # items themselves don't have to be pickled a second time.
+        for groups in parallel_chunks(enumerate(items), callback, parallel,
+                                      'group', argcount=1):
+            for key, indexes in iteritems(groups):
+                ret.setdefault(key, []).extend(items[index]
+                                               for index in indexes)
+
+        return ret
+
     ret = {}
     cbk = pyd.iteratee(callback)
 
@@ -497,7 +562,7 @@ def invoke(collection, method_name, *args, **kargs):
     return lst
 
 
-def map_(collection, callback=None):
+def map_(collection, callback=None, parallel=None):
     """Creates an array of values by running each element in the collection
     through the callback. The callback is invoked with three arguments:
     ``(value, index|key, collection)``. If a property name is passed for
@@ -506,13 +571,29 @@ def map_(collection, callback=None):
     created :func:`where` style callback will return ``True`` for elements that
     have the properties of the given object, else ``False``.
 
+    When `parallel` is given, the collection is split into chunks which are
+    sent to a pool of worker processes and the results are reassembled in
+    order. Both `callback` and the elements must be picklable (e.g. a module
+    level function or a property name or object shorthand, but not a
+    ``lambda``) and `callback` is only invoked with up to two arguments:
+    ``(value, index|key)``. This only pays off when `callback` is expensive
+    enough to outweigh the cost of pickling the elements.
+
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        parallel (bool|int|Pool, optional): Number of worker processes to
+            run `callback` in, ``True`` for one per CPU, or an existing
+            ``multiprocessing.Pool`` to reuse. Defaults to ``None`` which runs
+            `callback` in the current process.
 
     Returns:
         list: Mapped list.
 
+    Raises:
+        ValueError: If `parallel` is used with a callback that takes the
+            collection as third argument.
+
     Example:
 
         >>> map_([1, 2, 3, 4], str)
@@ -523,7 +604,16 @@ def map_(collection, callback=None):
         - :func:`collect` (alias)
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `parallel` argument.
     """
+    if parallel:
+        return [result
+                for results in parallel_chunks(iterator(collection), callback,
+                                               parallel, 'map')
+                for result in results]
+
     return list(mapiter(collection, callback))
 
 
@@ -606,7 +696,81 @@ def min_(collection, callback=None):
     return min(collection, key=pyd.iteratee(callback))
 
 
-def partition(collection, callback=None):
+def nlargest_by(collection, n, callback=None):
+    """Retrieves the `n` largest values of a `collection` ordered from largest
+    to smallest. Equivalent to ``sort_by(collection, callback, True)[:n]`` but
+    only the `n` largest values are held in memory while iterating so that any
+    iterable, including generators, can be processed in ``O(len(collection)
+    * log(n))`` time.
+
+    Args:
+        collection (list|dict|iterable): Collection to iterate over.
+        n (int): Number of values to retrieve.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        list: Largest values.
+
+    Example:
+
+        >>> nlargest_by([4, 1, 3, 2], 2)
+        [4, 3]
+        >>> nlargest_by(iter([{'a': 1}, {'a': 3}, {'a': 2}]), 2, 'a')
+        [{'a': 3}, {'a': 2}]
+
+    See Also:
+        - :func:`nlargest_by` (main definition)
+        - :func:`top_k` (alias)
+
+    .. versionadded:: 3.4.0
+    """
+    if isinstance(collection, dict):
+        collection = collection.values()
+
+    return heapq.nlargest(n, collection, key=pyd.iteratee(callback))
+
+
+top_k = nlargest_by
+
+
+def nsmallest_by(collection, n, callback=None):
+    """Retrieves the `n` smallest values of a `collection` ordered from
+    smallest to largest. Equivalent to ``sort_by(collection, callback)[:n]``
+    but only the `n` smallest values are held in memory while iterating so that
+    any iterable, including generators, can be processed in
+    ``O(len(collection) * log(n))`` time.
+
+    Args:
+        collection (list|dict|iterable): Collection to iterate over.
+        n (int): Number of values to retrieve.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        list: Smallest values.
+
+    Example:
+
+        >>> nsmallest_by([4, 1, 3, 2], 2)
+        [1, 2]
+        >>> nsmallest_by(iter([{'a': 1}, {'a': 3}, {'a': 2}]), 2, 'a')
+        [{'a': 1}, {'a': 2}]
+
+    See Also:
+        - :func:`nsmallest_by` (main definition)
+        - :func:`bottom_k` (alias)
+
+    .. versionadded:: 3.4.0
+    """
+    if isinstance(collection, dict):
+        collection = collection.values()
+
+    return heapq.nsmallest(n, collection, key=pyd.iteratee(callback))
+
+
+bottom_k = nsmallest_by
+
+
+def partition(collection, callback=None, parallel=None):
     """Creates an array of elements split into two groups, the first of which
     contains elements the `callback` returns truthy for, while the second of
     which contains elements the `callback` returns falsey for. The `callback`
@@ -622,21 +786,38 @@ def partition(collection, callback=None):
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        parallel (bool|int|Pool, optional): Number of worker processes to
+            run `callback` in, ``True`` for one per CPU, or an existing
+            ``multiprocessing.Pool`` to reuse. Defaults to ``None`` which runs
+            `callback` in the current process.
 
     Returns:
         list: List of grouped elements.
 
+    Raises:
+        ValueError: If `parallel` is used with a callback that takes the
+            collection as third argument.
+
     Example:
 
         >>> partition([1, 2, 3, 4], lambda x: x >= 3)
         [[3, 4], [1, 2]]
 
     .. versionadded:: 1.1.0
+
+    .. versionchanged:: 3.4.0
+        Added `parallel` argument.
     """
     trues = []
     falses = []
 
-    for is_true, value, _, _ in itercallback(collection, callback):
+    if parallel:
+        results = parallel_mask(collection, callback, parallel)
+    else:
+        results = ((value, is_true) for is_true, value, _, _
+                   in itercallback(collection, callback))
+
+    for value, is_true in results:
         if is_true:
             trues.append(value)
         else:
@@ -666,17 +847,29 @@ def pluck(collection, key):
     return map_(collection, pyd.prop(key))
 
 
-def reduce_(collection, callback=None, accumulator=None):
+def reduce_(collection, callback=None, accumulator=None, parallel=None):
     """Reduces a collection to a value which is the accumulated result of
     running each element in the collection through the callback, where each
     successive callback execution consumes the return value of the previous
     execution.
 
+    Passing `parallel` declares that `callback` is associative, i.e. that
+    ``callback(callback(a, b), c) == callback(a, callback(b, c))`` like
+    addition, set union, or merging dicts of counts. The collection is then
+    reduced as a tree: chunks of it are reduced by a pool of workers and the
+    chunk results are combined pairwise in parallel. `callback` is only
+    invoked with two arguments, ``(total, value)``, and it and the elements
+    must be picklable when a process pool is used.
+
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed): Callback applied per iteration.
         accumulator (mixed, optional): Initial value of aggregator. Default is
             to use the result of the first iteration.
+        parallel (bool|int|Pool, optional): Number of worker processes to
+            reduce with, ``True`` for one per CPU, or an existing
+            ``multiprocessing.Pool`` (or ``ThreadPool``) to reuse. Defaults to
+            ``None`` which reduces sequentially in the current process.
 
     Returns:
         mixed: Accumulator object containing results of reduction.
@@ -692,6 +885,9 @@ def reduce_(collection, callback=None, accumulator=None):
         - :func:`inject` (alias)
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `parallel` argument.
     """
     iterable = iterator(collection)
 
@@ -702,6 +898,10 @@ def reduce_(collection, callback=None, accumulator=None):
             raise TypeError(
                 'reduce_() of empty sequence with no initial value')
 
+    if parallel:
+        return parallel_reduce([item for _, item in iterable], callback,
+                               accumulator, parallel)
+
     result = accumulator
 
     if callback is None:
@@ -717,7 +917,8 @@ foldl = reduce_
 inject = reduce_
 
 
-def reduce_right(collection, callback=None, accumulator=None):
+def reduce_right(collection, callback=None, accumulator=None,
+                 parallel=None):
     """This method is like :func:`reduce_` except that it iterates over
     elements of a `collection` from right to left.
 
@@ -726,6 +927,8 @@ def reduce_right(collection, callback=None, accumulator=None):
         callback (mixed): Callback applied per iteration.
         accumulator (mixed, optional): Initial value of aggregator. Default is
             to use the result of the first iteration.
+        parallel (bool|int|Pool, optional): Reduce an associative `callback`
+            in parallel. See :func:`reduce_`.
 
     Returns:
         mixed: Accumulator object containing results of reduction.
@@ -743,25 +946,43 @@ def reduce_right(collection, callback=None, accumulator=None):
 
     .. versionchanged:: 3.2.1
         Fix bug where collection was not reversed correctly.
+
+    .. versionchanged:: 3.4.0
+        Added `parallel` argument.
     """
     if not isinstance(collection, dict):
         collection = list(collection)[::-1]
 
-    return reduce_(collection, callback, accumulator)
+    return reduce_(collection, callback, accumulator, parallel=parallel)
 
 
 foldr = reduce_right
 
 
-def reductions(collection, callback=None, accumulator=None, from_right=False):
+def reductions(collection, callback=None, accumulator=None, from_right=False,
+               parallel=None):
     """This function is like :func:`reduce_` except that it returns a list of
     every intermediate value in the reduction operation.
 
+    Passing `parallel` declares that `callback` is associative and computes
+    the results as a parallel prefix scan: chunks of the collection are first
+    reduced in parallel, the chunk results are combined to find the value each
+    chunk starts from, and then every chunk is scanned in parallel. This calls
+    `callback` about twice as often as a sequential scan so it only pays off
+    with enough worker processes. See :func:`reduce_` for the restrictions on
+    `callback`.
+
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed): Callback applied per iteration.
         accumulator (mixed, optional): Initial value of aggregator. Default is
             to use the result of the first iteration.
+        from_right (bool, optional): Whether to iterate from right to left.
+            Defaults to ``False``.
+        parallel (bool|int|Pool, optional): Number of worker processes to
+            scan with, ``True`` for one per CPU, or an existing
+            ``multiprocessing.Pool`` (or ``ThreadPool``) to reuse. Defaults to
+            ``None`` which scans sequentially in the current process.
 
     Returns:
         list: Results of each reduction operation.
@@ -776,7 +997,27 @@ def reductions(collection, callback=None, accumulator=None, from_right=False):
         :func:`reduce_`.
 
     .. versionadded:: 2.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `parallel` argument.
     """
+    if parallel:
+        if from_right and not isinstance(collection, dict):
+            collection = list(collection)[::-1]
+
+        items = [item for _, item in iterator(collection)]
+
+        if accumulator is None:
+            if not items:
+                raise TypeError(
+                    'reduce_() of empty sequence with no initial value')
+            accumulator = items.pop(0)
+
+        if not items:
+            return []
+
+        return parallel_scan(items, callback, accumulator, parallel)
+
     if callback is None:
         callback = pyd.identity
 
@@ -793,7 +1034,8 @@ def reductions(collection, callback=None, accumulator=None, from_right=False):
     return results
 
 
-def reductions_right(collection, callback=None, accumulator=None):
+def reductions_right(collection, callback=None, accumulator=None,
+                     parallel=None):
     """This method is like :func:`reductions` except that it iterates over
     elements of a `collection` from right to left.
 
@@ -802,6 +1044,8 @@ def reductions_right(collection, callback=None, accumulator=None):
         callback (mixed): Callback applied per iteration.
         accumulator (mixed, optional): Initial value of aggregator. Default is
             to use the result of the first iteration.
+        parallel (bool|int|Pool, optional): Scan an associative `callback` in
+            parallel. See :func:`reductions`.
 
     Returns:
         list: Results of each reduction operation.
@@ -816,8 +1060,12 @@ def reductions_right(collection, callback=None, accumulator=None):
         :func:`reduce_`.
 
     .. versionadded:: 2.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `parallel` argument.
     """
-    return reductions(collection, callback, accumulator, from_right=True)
+    return reductions(collection, callback, accumulator, from_right=True,
+                      parallel=parallel)
 
 
 def reject(collection, callback=None):
@@ -997,7 +1245,8 @@ def sort_by(collection, callback=None, reverse=False):
     return sorted(collection, key=pyd.iteratee(callback), reverse=reverse)
 
 
-def sort_by_all(collection, keys, orders=None, reverse=False):
+def sort_by_all(collection, keys, orders=None, reverse=False,
+                none_position=None):
     """This method is like :func:`sort_by` except that it sorts by key names
     instead of an iteratee function. Keys can be sorted in descending order by
     prepending a ``"-"`` to the key name (e.g. ``"name"`` would become
@@ -1015,10 +1264,18 @@ def sort_by_all(collection, keys, orders=None, reverse=False):
             descending. Defaults to ``None``.
         reverse (bool, optional): Whether to reverse the sort. Defaults to
             ``False``.
+        none_position (str, optional): Whether ``None`` key values are
+            placed ``'first'`` or ``'last'`` in the sorted list regardless of
+            sort order. Defaults to ``None`` which compares ``None`` like any
+            other value.
 
     Returns:
         list: Sorted list.
 
+    Raises:
+        ValueError: If `none_position` isn't ``None``, ``'first'``, or
+            ``'last'``.
+
     Example:
 
         >>> items = [{'a': 2, 'b': 1}, {'a': 3, 'b': 2}, {'a': 1, 'b': 3}]
@@ -1038,6 +1295,9 @@ def sort_by_all(collection, keys, orders=None, reverse=False):
         >>> assert results == [{'a': 3, 'b': 2},\
                                {'a': 2, 'b': 1},\
                                {'a': 1, 'b': 3}]
+        >>> items = [{'a': None}, {'a': 2}, {'a': 1}]
+        >>> results = sort_by_all(items, ['-a'], none_position='last')
+        >>> assert results == [{'a': 2}, {'a': 1}, {'a': None}]
 
     See Also:
         - :func:`sort_by_all` (main definition)
@@ -1050,6 +1310,10 @@ def sort_by_all(collection, keys, orders=None, reverse=False):
 
     .. verionchanged:: 3.2.0
         Added :func:`sort_by_order` as alias.
+
+    .. versionchanged:: 3.4.0
+        Extract each item's sort keys once instead of comparing items with a
+        comparison function and added `none_position` argument.
     """
     if isinstance(collection, dict):
         collection = collection.values()
@@ -1059,36 +1323,35 @@ def sort_by_all(collection, keys, orders=None, reverse=False):
         reverse = orders
         orders = None
 
-    comparers = []
+    if none_position not in SORT_NONE_POSITIONS:
+        raise ValueError('none_position must be one of {0}'
+                         .format(SORT_NONE_POSITIONS))
 
-    if orders:
-        for i, key in enumerate(keys):
-            if pyd.has(orders, i):
-                order = 1 if orders[i] else -1
-            else:
-                order = 1
+    getters = []
+    ascending = []
 
-            comparers.append((pyd.deep_prop(key), order))
-    else:
-        for key in keys:
-            if key.startswith('-'):
-                order = -1
-                key = key[1:]
-            else:
-                order = 1
-
-            comparers.append((pyd.deep_prop(key), order))
-
-    def comparison(left, right):
-        # pylint: disable=useless-else-on-loop,missing-docstring
-        for func, mult in comparers:
-            result = _cmp(func(left), func(right))
-            if result:
-                return mult * result
+    for i, key in enumerate(keys):
+        if orders:
+            order = orders[i] if pyd.has(orders, i) else True
+        elif key.startswith('-'):
+            order = False
+            key = key[1:]
         else:
-            return 0
+            order = True
+
+        # Reversing the sort is the same as flipping the order of every key
+        # since stable sorts keep equal items in their original order.
+        order = bool(order) != bool(reverse)
+        getter = pyd.deep_prop(key)
+
+        if none_position is not None:
+            getter = none_sort_key(getter,
+                                   (none_position == 'last') == order)
 
-    return sorted(collection, key=cmp_to_key(comparison), reverse=reverse)
+        getters.append(getter)
+        ascending.append(order)
+
+    return sort_by_keys(collection, getters, ascending)
 
 
 sort_by_order = sort_by_all
@@ -1139,3 +1402,260 @@ def where(collection, properties):
     .. versionadded:: 1.0.0
     """
     return filter_(collection, pyd.matches(properties))
+
+
+#
+# Utility methods not a part of the main API
+#
+
+#: Valid `none_position` values of :func:`sort_by_all`.
+SORT_NONE_POSITIONS = (None, 'first', 'last')
+
+
+def none_sort_key(getter, none_high):
+    """Return key function which wraps the value returned by `getter` so that
+    ``None`` sorts above every other value if `none_high` is ``True`` or
+    below every other value otherwise.
+    """
+    def key(item):  # pylint: disable=missing-docstring
+        value = getter(item)
+        return ((value is None) == none_high, value)
+    return key
+
+
+def sort_by_keys(collection, getters, ascending):
+    """Sort `collection` by the keys returned by each key function of
+    `getters` where the corresponding item of `ascending` determines whether
+    that key is sorted in ascending or descending order. Keys are extracted
+    once per item. Consecutive keys with the same order are sorted together in
+    a single pass and the passes are applied from least to most significant
+    so that the stable sort preserves the order of earlier passes.
+    """
+    if isinstance(collection, dict):
+        collection = collection.values()
+
+    if not getters:
+        return list(collection)
+
+    if len(getters) == 1:
+        return sorted(collection, key=getters[0], reverse=not ascending[0])
+
+    keyed = [([getter(item) for getter in getters], item)
+             for item in collection]
+
+    runs = []
+    start = 0
+
+    for end in _range(1, len(getters) + 1):
+        if end == len(getters) or ascending[end] != ascending[start]:
+            runs.append((start, end, ascending[start]))
+            start = end
+
+    for start, end, order in reversed(runs):
+        keyed.sort(key=lambda pair, start=start, end=end: pair[0][start:end],
+                   reverse=not order)
+
+    return [item for _, item in keyed]
+
+
+#: Number of chunks per worker process that the parallel versions of the
+#: collection methods split their collection into. Using several chunks per
+#: process keeps every process busy when the callback's cost varies between
+#: elements.
+PARALLEL_CHUNKS_PER_PROCESS = 4
+
+
+def parallel_chunks(items, callback, parallel, mode, argcount=2):
+    """Split the ``(key, value)`` pairs of `items` into chunks, evaluate
+    `callback` on each chunk in a worker process using
+    :func:`parallel_chunk_worker`, and return the list of results for each
+    chunk in order. `parallel` is the number of worker processes, ``True`` for
+    one per CPU, or a pool object whose ``map`` method is used instead of
+    starting a new ``multiprocessing.Pool``.
+
+    With an `argcount` of 2, the sequential versions of the methods also pass
+    the collection as a third argument. The collection isn't sent to the
+    workers so callbacks that take it raise a ``ValueError`` rather than give
+    different results in parallel.
+    """
+    if (argcount == 2 and callback is not None and
+            getargcount(pyd.iteratee(callback), 3) == 3):
+        raise ValueError('Callbacks that take the collection as third '
+                         'argument can\'t be run in parallel')
+
+    if not isinstance(items, list):
+        items = list(items)
+
+    if not items:
+        return []
+
+    pool, processes = parallel_pool(parallel)
+    size = parallel_chunk_size(len(items), processes)
+    tasks = [(mode, callback, argcount, start, items[start:start + size])
+             for start in _range(0, len(items), size)]
+
+    try:
+        return pool.map(parallel_chunk_worker, tasks)
+    finally:
+        release_pool(pool, parallel)
+
+
+def parallel_chunk_worker(task):
+    """Evaluate a task created by :func:`parallel_chunks` and return its
+    result. Depending on the task's mode, the result is the list of callback
+    results (``'map'``), the list of their truthiness (``'mask'``), a ``dict``
+    of the indexes of the chunk's items grouped by callback result
+    (``'group'``), or a ``dict`` of counts by callback result (``'count'``).
+    The callback is resolved with :func:`pydash.utilities.iteratee` inside the
+    worker so that shorthand callbacks are pickled in their original form.
+    """
+    mode, callback, argcount, start, items = task
+    cbk = pyd.iteratee(callback)
+    argcount = getargcount(cbk, argcount)
+
+    if argcount == 2:
+        results = [cbk(value, key) for key, value in items]
+    elif argcount == 1:
+        results = [cbk(value) for _, value in items]
+    else:
+        results = [cbk() for _ in items]
+
+    if mode == 'mask':
+        return [bool(result) for result in results]
+    elif mode == 'group':
+        groups = {}
+        for index, result in enumerate(results, start):
+            groups.setdefault(result, []).append(index)
+        return groups
+    elif mode == 'count':
+        counts = {}
+        for result in results:
+            counts[result] = counts.get(result, 0) + 1
+        return counts
+    else:
+        return results
+
+
+def parallel_chunk_size(count, processes):
+    """Return the size of the chunks that `count` items are split into when
+    evaluated by `processes` worker processes.
+    """
+    return max(-(-count // (processes * PARALLEL_CHUNKS_PER_PROCESS)), 1)
+
+
+def parallel_fold(items, callback, initial=NoValue, scan=False):
+    """Left fold `items` with `callback` starting from `initial` or from the
+    first item if `initial` isn't given. Returns the result of the fold or, if
+    `scan` is ``True``, the list of every intermediate result.
+    """
+    if callback is None:
+        callback = pyd.identity
+
+    items = iter(items)
+    result = next(items) if initial is NoValue else initial
+    results = []
+
+    for item in items:
+        result = call_callback(callback, result, item)
+        if scan:
+            results.append(result)
+
+    return results if scan else result
+
+
+def parallel_fold_worker(task):
+    """Evaluate a :func:`parallel_fold` task in a worker process. Since
+    :data:`pydash.helpers.NoValue` doesn't survive pickling, whether the fold
+    has an initial value is passed separately.
+    """
+    callback, has_initial, initial, items, scan = task
+    return parallel_fold(items, callback, initial if has_initial else NoValue,
+                         scan=scan)
+
+
+def parallel_mask(collection, callback, parallel):
+    """Return generator of ``(value, is_true)`` pairs for each value of
+    `collection` where `is_true` is the truthiness of the value's callback
+    result evaluated in parallel.
+    """
+    items = list(iterator(collection))
+    masks = parallel_chunks(items, callback, parallel, 'mask')
+    return ((value, is_true)
+            for (_, value), is_true
+            in izip(items, (is_true for mask in masks for is_true in mask)))
+
+
+def parallel_pool(parallel):
+    """Return tuple of the pool described by `parallel` and its number of
+    worker processes. A new ``multiprocessing.Pool`` is started unless
+    `parallel` is already a pool object.
+    """
+    if hasattr(parallel, 'map'):
+        return parallel, cpu_count()
+
+    processes = cpu_count() if parallel is True else parallel
+
+    return multiprocessing.Pool(processes), processes
+
+
+def parallel_reduce(items, callback, initial, parallel):
+    """Reduce `items` with the associative `callback` starting from `initial`
+    by folding chunks of `items` in parallel and then folding the results of
+    adjacent chunks in parallel until a single result is left.
+    """
+    pool, processes = parallel_pool(parallel)
+
+    try:
+        while len(items) > 1:
+            size = max(parallel_chunk_size(len(items), processes), 2)
+            tasks = [(callback, False, None, items[start:start + size], False)
+                     for start in _range(0, len(items), size)]
+            items = pool.map(parallel_fold_worker, tasks)
+    finally:
+        release_pool(pool, parallel)
+
+    return parallel_fold(items, callback, initial)
+
+
+def parallel_scan(items, callback, initial, parallel):
+    """Return the list of intermediate results of reducing `items` with the
+    associative `callback` starting from `initial`. Each chunk of `items` is
+    first reduced in parallel. The chunk results are then folded in order to
+    get the value each chunk starts from, and finally each chunk is scanned
+    from its starting value in parallel.
+    """
+    pool, processes = parallel_pool(parallel)
+    size = parallel_chunk_size(len(items), processes)
+    chunks = [items[start:start + size]
+              for start in _range(0, len(items), size)]
+
+    try:
+        totals = pool.map(parallel_fold_worker,
+                          [(callback, False, None, chunk, False)
+                           for chunk in chunks[:-1]])
+        starts = [initial]
+        starts.extend(parallel_fold(totals, callback, initial, scan=True))
+        scans = pool.map(parallel_fold_worker,
+                         [(callback, True, start, chunk, True)
+                          for start, chunk in izip(starts, chunks)])
+    finally:
+        release_pool(pool, parallel)
+
+    return [result for results in scans for result in results]
+
+
+def release_pool(pool, parallel):
+    """Shut down `pool` if it was started by :func:`parallel_pool` for
+    `parallel`.
+    """
+    if pool is not parallel:
+        pool.terminate()
+        pool.join()
+
+
+def cpu_count():
+    """Return the number of CPUs or ``1`` if it can't be determined."""
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:  # pragma: no cover
+        return 1
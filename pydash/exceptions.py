@@ -5,6 +5,14 @@
 """
 
 
+class CancelledError(Exception):
+    """Raised when getting the result of a scheduled call that was cancelled.
+
+    .. versionadded:: 3.4.0
+    """
+    pass
+
+
 class InvalidMethod(Exception):
     """Raised when an invalid pydash method is invoked through
     :func:`pydash.chaining.chain`.
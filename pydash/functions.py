@@ -7,10 +7,13 @@
 from __future__ import absolute_import
 
 import inspect
-import time
+import sys
+from threading import RLock
+from timeit import default_timer
 
 import pydash as pyd
-from ._compat import _range
+from .helpers import get_scheduler
+from ._compat import _range, asyncio, ensure_future
 
 
 __all__ = (
@@ -22,6 +25,7 @@ __all__ = (
     'curry',
     'curry_right',
     'debounce',
+    'defer',
     'delay',
     'disjoin',
     'flow',
@@ -95,23 +99,63 @@ class Before(After):
 
 
 class Compose(object):
-    """Wrap a function in a compose context."""
+    """Wrap a function in a compose context. The functions are arranged in the
+    order they're called in :attr:`stages` when the context is created and
+    the stages of nested :class:`Compose` contexts without a :attr:`hook` are
+    flattened into it. If :attr:`hook` is given, it's called after each
+    stage with a ``dict`` of the stage's ``index``, ``func``, ``result``, and
+    wall ``time`` in seconds.
+    """
     def __init__(self, *funcs, **kargs):
         self.funcs = funcs
         self.from_right = kargs.get('from_right', True)
+        self.hook = kargs.get('hook')
+
+        stages = []
+
+        for func in (reversed(funcs) if self.from_right else funcs):
+            if (isinstance(func, Compose) and func.hook is None and
+                    func.stages):
+                stages.extend(func.stages)
+            else:
+                stages.append(func)
+
+        self.stages = tuple(stages)
 
     def __call__(self, *args, **kargs):
         """Return results of composing :attr:`funcs`."""
-        funcs = list(self.funcs)
-        from_index = -1 if self.from_right else 0
+        if self.hook is not None:
+            return self._call_with_hook(args, kargs)
+
+        if not self.stages:
+            return None
 
+        stages = iter(self.stages)
+        result = next(stages)(*args, **kargs)
+
+        for func in stages:
+            result = func(result)
+
+        return result
+
+    def _call_with_hook(self, args, kargs):
+        """Return results of composing :attr:`funcs` while passing each stage
+        to :attr:`hook`.
+        """
         result = None
 
-        while funcs:
-            result = funcs.pop(from_index)(*args, **kargs)
+        for index, func in enumerate(self.stages):
+            start = default_timer()
+            result = func(*args, **kargs)
+            elapsed = default_timer() - start
             args = (result,)
             kargs = {}
 
+            self.hook({'index': index,
+                       'func': func,
+                       'result': result,
+                       'time': elapsed})
+
         return result
 
 
@@ -164,37 +208,178 @@ class CurryRight(Curry):
 
 
 class Debounce(object):
-    """Wrap a function in a debounce context."""
-    def __init__(self, func, wait, max_wait=False):
+    """Wrap a function in a debounce context. Pending trailing calls are run by
+    `scheduler` which is an :mod:`asyncio` event loop or any object with a
+    compatible ``call_later`` method. It defaults to the running event loop
+    if there is one or `func` is a coroutine function and to the shared
+    scheduler thread otherwise.
+    """
+    def __init__(self, func, wait, max_wait=False, leading=True,
+                 trailing=True, scheduler=None):
         self.func = func
         self.wait = wait
-        self.max_wait = max_wait
+        self.max_wait = (max(max_wait, wait) if pyd.is_number(max_wait)
+                         else None)
+        self.leading = leading
+        self.trailing = trailing
+        self.scheduler = scheduler
 
         self.last_result = None
-
-        # Initialize last_* times to be prior to the wait periods so that func
-        # is primed to be executed on first call.
-        self.last_call = pyd.now() - self.wait
-        self.last_execution = (pyd.now() - max_wait if pyd.is_number(max_wait)
-                               else None)
+        self.last_args = None
+        self.last_call = None
+        self.last_execution = 0
+        self.timer = None
+        self.timer_count = 0
+        self.lock = RLock()
 
     def __call__(self, *args, **kargs):
-        """Execute :attr:`func` if function hasn't been called witinin last
-        :attr:`wait` milliseconds or in last :attr:`max_wait` milliseconds.
-        Return results of last successful call.
+        """Execute :attr:`func` on the leading edge if function hasn't been
+        called within last :attr:`wait` milliseconds or in last
+        :attr:`max_wait` milliseconds and schedule its execution on the
+        trailing edge otherwise. Return results of last successful call.
+        """
+        with self.lock:
+            present = pyd.now()
+
+            if (self.timer is not None and
+                    present - self.last_call >= self.wait):
+                # The trailing call is due but its timer hasn't fired yet so
+                # run it first as if it had.
+                self.timer.cancel()
+                self._trailing_edge(present)
+
+            is_invoking = self._should_invoke(present)
+
+            self.last_args = (args, kargs)
+            self.last_call = present
+
+            if is_invoking:
+                if self.timer is None:
+                    return self._leading_edge(present)
+
+                if self.max_wait is not None:
+                    self.timer.cancel()
+                    self._start_timer(self.wait)
+                    return self._invoke(present)
+
+            if self.timer is None:
+                self._start_timer(self.wait)
+
+            return self.last_result
+
+    def cancel(self):
+        """Cancel the pending trailing call."""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+
+            self.last_execution = 0
+            self.last_args = self.last_call = self.timer = None
+
+    def flush(self):
+        """Execute the pending trailing call immediately and return the results
+        of the last successful call.
+        """
+        with self.lock:
+            if self.timer is None:
+                return self.last_result
+
+            self.timer.cancel()
+            return self._trailing_edge(pyd.now())
+
+    def pending(self):
+        """Return whether a trailing call is pending."""
+        return self.timer is not None
+
+    def _invoke(self, present):
+        """Execute :attr:`func` with the last arguments it was called with."""
+        args, kargs = self.last_args
+        self.last_args = None
+        self.last_execution = present
+        self.last_result = self.func(*args, **kargs)
+
+        if asyncio is not None and asyncio.iscoroutine(self.last_result):
+            self.last_result = ensure_future(self.last_result)
+
+        return self.last_result
+
+    def _leading_edge(self, present):
+        """Start the wait period and execute :attr:`func` if :attr:`leading`.
         """
-        present = pyd.now()
+        self.last_execution = present
+        self._start_timer(self.wait)
 
-        if any([(present - self.last_call) >= self.wait,
-                (self.max_wait and
-                 (present - self.last_execution) >= self.max_wait)]):
-            self.last_result = self.func(*args, **kargs)
-            self.last_execution = present
+        if self.leading:
+            return self._invoke(present)
 
-        self.last_call = present
+        return self.last_result
+
+    def _trailing_edge(self, present):
+        """End the wait period and execute :attr:`func` if :attr:`trailing` and
+        it was called since it was last executed.
+        """
+        self.timer = None
+
+        if self.trailing and self.last_args is not None:
+            return self._invoke(present)
+
+        self.last_args = None
 
         return self.last_result
 
+    def _should_invoke(self, present):
+        """Return whether :attr:`func` should be executed at `present`."""
+        if self.last_call is None:
+            return True
+
+        since_last_call = present - self.last_call
+
+        return any([since_last_call >= self.wait,
+                    # The clock went backwards.
+                    since_last_call < 0,
+                    (self.max_wait is not None and
+                     present - self.last_execution >= self.max_wait)])
+
+    def _remaining_wait(self, present):
+        """Return milliseconds left until :attr:`func` should be executed."""
+        remaining = self.wait - (present - self.last_call)
+
+        if self.max_wait is not None:
+            remaining = min(remaining,
+                            self.max_wait - (present - self.last_execution))
+
+        return remaining
+
+    def _start_timer(self, wait):
+        """Schedule :meth:`_timer_expired` after `wait` milliseconds."""
+        scheduler = self.scheduler or get_scheduler(self.func)
+
+        # Number the timers so that a timer which already fired while it was
+        # being cancelled can tell that it was replaced.
+        self.timer_count += 1
+        self.timer = scheduler.call_later(wait / 1000.0, self._timer_expired,
+                                          self.timer_count)
+
+    def _timer_expired(self, timer_count):
+        """Execute the trailing call if it's due or reschedule it otherwise.
+        Nothing waits on the timer's result so exceptions raised by the
+        trailing call are passed to ``sys.excepthook`` instead.
+        """
+        with self.lock:
+            if self.timer is None or timer_count != self.timer_count:
+                return
+
+            present = pyd.now()
+
+            if not self._should_invoke(present):
+                self._start_timer(self._remaining_wait(present))
+                return
+
+            try:
+                self._trailing_edge(present)
+            except Exception:  # pylint: disable=broad-except
+                sys.excepthook(*sys.exc_info())
+
 
 class Disjoin(object):
     """Wrap a set of functions in a disjoin context."""
@@ -346,26 +531,13 @@ class Spread(object):
         return self.func(args)
 
 
-class Throttle(object):
+class Throttle(Debounce):
     """Wrap a function in a throttle context."""
-    def __init__(self, func, wait):
-        self.func = func
-        self.wait = wait
-
-        self.last_result = None
-        self.last_execution = pyd.now() - self.wait
-
-    def __call__(self, *args, **kargs):
-        """Execute :attr:`func` if function hasn't been called witinin last
-        :attr:`wait` milliseconds. Return results of last successful call.
-        """
-        present = pyd.now()
-
-        if (present - self.last_execution) >= self.wait:
-            self.last_result = self.func(*args, **kargs)
-            self.last_execution = present
-
-        return self.last_result
+    def __init__(self, func, wait, leading=True, trailing=True,
+                 scheduler=None):
+        super(Throttle, self).__init__(func, wait, max_wait=wait,
+                                       leading=leading, trailing=trailing,
+                                       scheduler=scheduler)
 
 
 def after(func, n):
@@ -544,29 +716,88 @@ def curry_right(func, arity=None):
     return CurryRight(func, arity)
 
 
-def debounce(func, wait, max_wait=False):
+def debounce(func, wait, max_wait=False, leading=True, trailing=True,
+             scheduler=None):
     """Creates a function that will delay the execution of `func` until after
     `wait` milliseconds have elapsed since the last time it was invoked.
     Subsequent calls to the debounced function will return the result of the
     last `func` call.
 
+    If `leading` is ``True``, `func` is executed immediately when called after
+    at least `wait` milliseconds of inactivity. If `trailing` is ``True``,
+    `func` is executed again with the latest arguments once the calls have
+    stopped for `wait` milliseconds, provided it was called again after its
+    last execution. The trailing call runs in the background on `scheduler`.
+    The returned :class:`Debounce` can ``cancel()`` the pending trailing call,
+    ``flush()`` it to execute it immediately, and report whether one is
+    ``pending()``.
+
     Args:
         func (function): Function to execute.
         wait (int): Milliseconds to wait before executing `func`.
         max_wait (optional): Maximum time to wait before executing `func`.
+        leading (bool, optional): Whether to execute `func` on the leading
+            edge of the wait period. Defaults to ``True``.
+        trailing (bool, optional): Whether to execute `func` on the trailing
+            edge of the wait period. Defaults to ``True``.
+        scheduler (optional): :mod:`asyncio` event loop or other object with a
+            ``call_later(delay, callback)`` method which schedules the
+            trailing calls. Defaults to the running event loop if there is
+            one or `func` is a coroutine function and to a shared background
+            thread otherwise, which runs trailing calls on a small shared
+            pool of worker threads so that slow calls don't delay other
+            timers.
 
     Returns:
         Debounce: Function wrapped in a :class:`Debounce` context.
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `leading`, `trailing`, and `scheduler` arguments and execute
+        pending calls on the trailing edge.
+    """
+    return Debounce(func, wait, max_wait=max_wait, leading=leading,
+                    trailing=trailing, scheduler=scheduler)
+
+
+def defer(func, *args, **kargs):
+    """Executes the `func` function as soon as possible without blocking the
+    caller. Additional arguments will be provided to `func` when it is
+    invoked. See :func:`delay`.
+
+    Args:
+        func (function): Function to execute.
+        *args (optional): Arguments to pass to `func`.
+        **kargs (optional): Keyword arguments to pass to `func`.
+
+    Returns:
+        ScheduledCall|asyncio.Future: Handle of the scheduled call.
+
+    Example:
+
+        >>> defer(lambda x: x + 1, 1).result()
+        2
+
+    .. versionadded:: 3.4.0
     """
-    return Debounce(func, wait, max_wait=max_wait)
+    return delay(func, 0, *args, **kargs)
 
 
 def delay(func, wait, *args, **kargs):
     """Executes the `func` function after `wait` milliseconds. Additional
     arguments will be provided to `func` when it is invoked.
 
+    The call is scheduled without blocking the caller. Outside of
+    :mod:`asyncio`, every delayed call is waited on by a single shared
+    background thread and runs on a small shared pool of worker threads once
+    it's due so that a slow call doesn't hold up the others. The returned
+    :class:`pydash.helpers.ScheduledCall` can ``cancel()`` the call before it
+    runs and wait for its ``result()``. When called while an :mod:`asyncio`
+    event loop is running or with a coroutine function, the call is scheduled
+    on the event loop instead and an :class:`asyncio.Future` of its result is
+    returned.
+
     Args:
         func (function): Function to execute.
         wait (int): Milliseconds to wait before executing `func`.
@@ -574,12 +805,27 @@ def delay(func, wait, *args, **kargs):
         **kargs (optional): Keyword arguments to pass to `func`.
 
     Returns:
-        mixed: Return from `func`.
+        ScheduledCall|asyncio.Future: Handle of the scheduled call.
+
+    Example:
+
+        >>> call = delay(lambda x, y: x * y, 10, 6, y=7)
+        >>> call.result()
+        42
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Schedule the call on a shared scheduler and return a handle of it
+        instead of blocking until it's done.
     """
-    time.sleep(wait / 1000.0)
-    return func(*args, **kargs)
+    if kargs:
+        callback = Partial(func, args, kargs)
+        args = ()
+    else:
+        callback = func
+
+    return get_scheduler(func).call_later(wait / 1000.0, callback, *args)
 
 
 def disjoin(*funcs):
@@ -609,14 +855,21 @@ def disjoin(*funcs):
     return Disjoin(*funcs)
 
 
-def flow(*funcs):
+def flow(*funcs, **kargs):
     """Creates a function that is the composition of the provided functions,
     where each successive invocation is supplied the return value of the
     previous. For example, composing the functions ``f()``, ``g()``, and
     ``h()`` produces ``h(g(f()))``.
 
+    Nested compositions are flattened when the function is created so
+    ``flow(flow(f, g), h)`` calls ``f``, ``g``, and ``h`` directly in turn.
+
     Args:
         *funcs (function): Function(s) to compose.
+        hook (function, optional): Function called after each composed
+            function with a ``dict`` of the function's ``index``, ``func``,
+            ``result``, and wall ``time`` in seconds. Passed as a keyword
+            argument.
 
     Returns:
         Compose: Function(s) wrapped in a :class:`Compose` context.
@@ -629,6 +882,12 @@ def flow(*funcs):
         >>> ops = flow(sum, mult_5, div_10, pow_2)
         >>> ops([1, 2, 3, 4])
         25.0
+        >>> stages = []
+        >>> ops = flow(flow(sum, mult_5), div_10, hook=stages.append)
+        >>> ops([1, 2, 3, 4])
+        5.0
+        >>> [stage['result'] for stage in stages]
+        [10, 50, 5.0]
 
     See Also:
         - :func:`flow` (main definition)
@@ -638,14 +897,17 @@ def flow(*funcs):
 
     .. versionchanged:: 2.3.1
         Added :func:`pipe` as alias.
+
+    .. versionchanged:: 3.4.0
+        Flatten nested compositions and added `hook` argument.
     """
-    return Compose(*funcs, from_right=False)
+    return Compose(*funcs, from_right=False, hook=kargs.get('hook'))
 
 
 pipe = flow
 
 
-def flow_right(*funcs):
+def flow_right(*funcs, **kargs):
     """This function is like :func:`flow` except that it creates a function
     that invokes the provided functions from right to left. For example,
     composing the functions ``f()``, ``g()``, and ``h()`` produces
@@ -653,6 +915,8 @@ def flow_right(*funcs):
 
     Args:
         *funcs (function): Function(s) to compose.
+        hook (function, optional): Function called after each composed
+            function. See :func:`flow`. Passed as a keyword argument.
 
     Returns:
         Compose: Function(s) wrapped in a :class:`Compose` context.
@@ -678,8 +942,11 @@ def flow_right(*funcs):
 
     .. versionchanged:: 2.3.1
         Added :func:`pipe_right` as alias.
+
+    .. versionchanged:: 3.4.0
+        Flatten nested compositions and added `hook` argument.
     """
-    return Compose(*funcs, from_right=True)
+    return Compose(*funcs, from_right=True, hook=kargs.get('hook'))
 
 
 compose = flow_right
@@ -905,21 +1172,34 @@ def spread(func):
     return Spread(func)
 
 
-def throttle(func, wait):
+def throttle(func, wait, leading=True, trailing=True, scheduler=None):
     """Creates a function that, when executed, will only call the `func`
     function at most once per every `wait` milliseconds. Subsequent calls to
     the throttled function will return the result of the last `func` call.
+    The edges and scheduling of the calls work like :func:`debounce` with a
+    `max_wait` of `wait`.
 
     Args:
         func (function): Function to throttle.
         wait (int): Milliseconds to wait before calling `func` again.
+        leading (bool, optional): Whether to execute `func` on the leading
+            edge of the wait period. Defaults to ``True``.
+        trailing (bool, optional): Whether to execute `func` on the trailing
+            edge of the wait period. Defaults to ``True``.
+        scheduler (optional): Scheduler of the trailing calls. See
+            :func:`debounce`.
 
     Returns:
-        mixed: Results of last `func` call.
+        Throttle: Function wrapped in a :class:`Throttle` context.
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `leading`, `trailing`, and `scheduler` arguments and execute
+        pending calls on the trailing edge.
     """
-    return Throttle(func, wait)
+    return Throttle(func, wait, leading=leading, trailing=trailing,
+                    scheduler=scheduler)
 
 
 def wrap(value, func):
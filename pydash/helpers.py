@@ -4,14 +4,21 @@
 
 from __future__ import absolute_import
 
-from collections import Iterable
+from collections import Iterable, deque, namedtuple
 from functools import wraps
+import heapq
 import inspect
+from itertools import count
 import re
+from threading import Condition, Event, Lock, RLock, Thread
+from timeit import default_timer
+from types import BuiltinFunctionType, ModuleType
 import warnings
+from weakref import WeakKeyDictionary
 
 import pydash as pyd
-from ._compat import iteritems
+from ._compat import (asyncio, ensure_future, integer_types, iteritems,
+                      string_types)
 
 
 class _NoValue(object):
@@ -26,11 +33,85 @@ class _NoValue(object):
 NoValue = _NoValue()
 
 
+#: Cache of resolved callback argument counts keyed weakly by callback so
+#: that introspection only happens once per callback.
+_ARGCOUNT_CACHE = WeakKeyDictionary()
+
+#: Cache of resolved argument counts for module level builtin functions which
+#: don't support weak references but live for the life of the interpreter.
+_BUILTIN_ARGCOUNT_CACHE = {}
+
+
 def call_callback(callback, *args):
     """Inspect argspec of `callback` function and only pass the supported
     arguments when calling it.
     """
-    maxargs = len(args)
+    return callback(*args[:getargcount(callback, len(args))])
+
+
+def getargcount(callback, maxargs):
+    """Return the number of arguments that can be passed to `callback` capped
+    at `maxargs`. The inspected argument count is cached per `callback` so
+    that repeated calls don't pay the cost of introspection.
+
+    Args:
+        callback (callable): Callback to inspect.
+        maxargs (int): Maximum number of arguments available to pass.
+
+    Returns:
+        int: Number of arguments to pass to `callback`.
+    """
+    argcount = _get_cached_argcount(callback)
+
+    if argcount is None:
+        return maxargs
+
+    return min(argcount, maxargs)
+
+
+def _get_cached_argcount(callback):
+    """Return cached argument count of `callback` or inspect and cache it.
+    Returns ``None`` when `callback` accepts a variable number of arguments or
+    its argument count can't be determined.
+    """
+    # Bound methods are created anew on each attribute access so key off of
+    # the underlying function instead which has the same argspec.
+    key = getattr(callback, '__func__', callback)
+
+    if isinstance(key, BuiltinFunctionType):
+        owner = getattr(key, '__self__', None)
+
+        if isinstance(owner, (ModuleType, type(None))):
+            cache = _BUILTIN_ARGCOUNT_CACHE
+        else:
+            # Builtin methods are bound to an instance which we shouldn't keep
+            # alive so skip caching these.
+            return _inspect_argcount(callback)
+    else:
+        cache = _ARGCOUNT_CACHE
+
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Callback isn't hashable or doesn't support weak references.
+        return _inspect_argcount(callback)
+
+    argcount = _inspect_argcount(callback)
+
+    try:
+        cache[key] = argcount
+    except TypeError:  # pragma: no cover
+        pass
+
+    return argcount
+
+
+def _inspect_argcount(callback):
+    """Inspect and return the number of arguments supported by `callback` or
+    ``None`` if it accepts any number of arguments.
+    """
     argspec = None
 
     try:
@@ -40,25 +121,23 @@ def call_callback(callback, *args):
             argspec = inspect.getargspec(getattr(callback, '__call__', None))
         except TypeError:  # pragma: no cover
             pass
-    finally:
-        if isinstance(callback, type):
-            # Only pass single argument to type callbacks. This is for things
-            # like int(), float(), str(), etc.
-            argcount = 1
-        elif pyd.is_builtin(callback):
-            argcount = guess_builtin_argcount(callback) or maxargs
-        elif argspec and argspec.varargs:
-            # Callback supports variable arguments.
-            argcount = maxargs
-        elif argspec:
-            # Use inspected arg count.
-            argcount = len(argspec.args)
-        else:  # pragma: no cover
-            argcount = maxargs
 
-    argstop = min([maxargs, argcount])
+    if isinstance(callback, type):
+        # Only pass single argument to type callbacks. This is for things
+        # like int(), float(), str(), etc.
+        argcount = 1
+    elif pyd.is_builtin(callback):
+        argcount = guess_builtin_argcount(callback)
+    elif argspec and argspec.varargs:
+        # Callback supports variable arguments.
+        argcount = None
+    elif argspec:
+        # Use inspected arg count.
+        argcount = len(argspec.args)
+    else:  # pragma: no cover
+        argcount = None
 
-    return callback(*args[:argstop])
+    return argcount
 
 
 def guess_builtin_argcount(obj):
@@ -87,8 +166,22 @@ def itercallback(obj, callback=None, reverse=False):
     if reverse:
         items = reversed(tuple(items))
 
-    for key, item in items:
-        yield (call_callback(cbk, item, key, obj), item, key, obj)
+    # Resolve the callback's supported argument count once and then use a loop
+    # specialized for that count instead of inspecting it for every item.
+    argcount = getargcount(cbk, 3)
+
+    if argcount == 1:
+        for key, item in items:
+            yield (cbk(item), item, key, obj)
+    elif argcount == 2:
+        for key, item in items:
+            yield (cbk(item, key), item, key, obj)
+    elif argcount == 3:
+        for key, item in items:
+            yield (cbk(item, key, obj), item, key, obj)
+    else:
+        for key, item in items:
+            yield (cbk(), item, key, obj)
 
 
 def iterator(obj):
@@ -105,6 +198,67 @@ def iterator(obj):
         return iteritems(getattr(obj, '__dict__', {}))
 
 
+def base_get(obj, key, default=NoValue):
+    """Return the value of `key` from `obj` or `default` if it doesn't exist.
+    Unlike ``obj[key]``, misses are detected without raising exceptions for
+    the common object types: ``dict`` values are fetched using ``dict.get``,
+    ``list`` and ``tuple`` indexes are bounds checked, and objects that don't
+    support item access have `key` looked up as an attribute. Any other object
+    falls back to ``obj[key]``.
+
+    Args:
+        obj (mixed): Object to retrieve value from.
+        key (mixed): Key, index, or attribute name identifying which value to
+            retrieve.
+        default (mixed, optional): Value to return if `key` not found in
+            `obj`. Defaults to :data:`NoValue`.
+
+    Returns:
+        mixed: Value of `key` in `obj` or `default`.
+    """
+    obj_type = type(obj)
+
+    if obj_type is dict:
+        try:
+            return obj.get(key, default)
+        except TypeError:
+            # Unhashable key.
+            return default
+
+    if obj_type is list or obj_type is tuple:
+        if isinstance(key, integer_types):
+            index = key
+        elif isinstance(key, string_types):
+            # It's possible that a string integer is being used to access a
+            # list index.
+            try:
+                index = int(key)
+            except ValueError:
+                return default
+        else:
+            index = None
+
+        if index is not None:
+            if -len(obj) <= index < len(obj):
+                return obj[index]
+            return default
+
+    if not hasattr(obj_type, '__getitem__'):
+        if isinstance(key, string_types):
+            return getattr(obj, key, default)
+        return default
+
+    try:
+        try:
+            return obj[key]
+        except TypeError:
+            # It's possible that a string integer is being used to access a
+            # list index. Re-try object access using casted integer.
+            return obj[int(key)]
+    except (KeyError, IndexError, TypeError, ValueError, AttributeError):
+        return default
+
+
 def get_item(obj, key, default=NoValue):
     """Safely get an item by `key` from a sequence or mapping object when
     `default` provided.
@@ -114,8 +268,6 @@ def get_item(obj, key, default=NoValue):
         key (mixed): Key or index identifying which item to retrieve.
 
     Keyword Args:
-        use_default (bool, optional): Whether to use `default` value when
-            `key` doesn't exist in `obj`.
         default (mixed, optional): Default value to return if `key` not
             found in `obj`.
 
@@ -123,21 +275,15 @@ def get_item(obj, key, default=NoValue):
         mixed: `obj[key]` or `default`.
 
     Raises:
-        KeyError|IndexError|TypeError|AttributeError: If `obj` is missing key
-            or index and no default value provided.
+        KeyError: If `obj` is missing key or index and no default value
+            provided.
     """
-    try:
-        try:
-            ret = obj[key]
-        except TypeError:
-            # It's possible that a string integer is being used to access a
-            # list index. Re-try object access using casted integer.
-            ret = obj[int(key)]
-    except (KeyError, IndexError, TypeError, AttributeError):
-        if default is not NoValue:
-            ret = default
-        else:  # pragma: no cover
-            raise
+    ret = base_get(obj, key)
+
+    if ret is NoValue:
+        if default is NoValue:
+            raise KeyError(key)
+        ret = default
 
     return ret
 
@@ -178,6 +324,584 @@ def set_item(obj, key, value, allow_override=True):
             obj[key] = value
 
 
+#: Markers used to tag frozen containers so that they can't compare equal to
+#: a user supplied tuple containing the same items.
+_FROZEN_LIST = _NoValue()
+_FROZEN_DICT = _NoValue()
+
+
+def freeze(obj):
+    """Return a hashable representation of `obj` which compares equal to the
+    representation of another object when the two objects compare equal.
+    Lists are frozen to tuples, dicts to frozensets of their items, and sets
+    to frozensets.
+
+    Raises:
+        TypeError: If `obj` contains a value that can't be frozen.
+    """
+    if isinstance(obj, dict):
+        return (_FROZEN_DICT,
+                frozenset((key, freeze(value))
+                          for key, value in iteritems(obj)))
+    elif isinstance(obj, list):
+        return (_FROZEN_LIST,) + tuple(freeze(item) for item in obj)
+    elif isinstance(obj, (set, frozenset)):
+        return frozenset(obj)
+    elif isinstance(obj, tuple):
+        return tuple(freeze(item) for item in obj)
+    else:
+        hash(obj)
+        return obj
+
+
+class SeenSet(object):
+    """Set-like record of seen items that supports unhashable items. Hashable
+    items are tracked in a ``set``, unhashable items that can be frozen (see
+    :func:`freeze`) are tracked by their frozen value, and only items that
+    can't be frozen fall back to a linear scan.
+    """
+    def __init__(self):
+        self.hashed = set()
+        self.unhashable = []
+
+    def add(self, item):
+        """Add `item` and return whether it hadn't been seen before."""
+        hashed = self.hashed
+
+        try:
+            if item in hashed:
+                return False
+            hashed.add(item)
+            return True
+        except TypeError:
+            pass
+
+        try:
+            key = freeze(item)
+        except TypeError:
+            if item in self.unhashable:
+                return False
+            self.unhashable.append(item)
+            return True
+
+        if key in hashed:
+            return False
+
+        hashed.add(key)
+        return True
+
+
+#: Statistics of a :class:`LRUCache` returned by :meth:`LRUCache.info`.
+CacheInfo = namedtuple('CacheInfo',
+                       ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class LRUCache(object):
+    """Thread-safe mapping that holds at most `maxsize` items and evicts the
+    least recently used item when full. A `maxsize` of ``None`` means the cache
+    is unbounded. The number of lookups that found or missed a cached item and
+    the number of evicted or expired items are counted in `hits`, `misses`,
+    and `evictions`.
+
+    If `ttl` is given, items expire `ttl` seconds after being set. If `weight`
+    is given, it is called with each value to get the value's size and
+    `maxsize` bounds the total size of the cached values instead of their
+    number.
+    """
+    # Indexes into the [prev, next, key, value, expires, weight] links of the
+    # linked list.
+    PREV, NEXT, KEY, VALUE, EXPIRES, WEIGHT = 0, 1, 2, 3, 4, 5
+
+    def __init__(self, maxsize=128, ttl=None, weight=None, timer=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.weight = weight
+        self.timer = timer or default_timer
+        self.data = {}
+        self.lock = RLock()
+        self.currsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Circular doubly linked list of links ordered from least to most
+        # recently used with root being a sentinel link.
+        self.root = []
+        self.root[:] = [self.root, self.root, None, None, None, None]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __contains__(self, key):
+        link = self.data.get(key)
+        return link is not None and not self._is_expired(link)
+
+    def __getitem__(self, key):
+        value = self.get(key, NoValue)
+
+        if value is NoValue:
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key, value):
+        size = 1 if self.weight is None else self.weight(value)
+
+        if self.maxsize is not None and size > self.maxsize:
+            # The value could never fit so don't evict everything else for it.
+            with self.lock:
+                if key in self.data:
+                    self._remove(self.data[key])
+            return
+
+        expires = None if self.ttl is None else self.timer() + self.ttl
+
+        with self.lock:
+            link = self.data.get(key)
+
+            if link is not None:
+                self.currsize += size - link[self.WEIGHT]
+                link[self.VALUE] = value
+                link[self.EXPIRES] = expires
+                link[self.WEIGHT] = size
+                self._move_to_end(link)
+            else:
+                root = self.root
+                last = root[self.PREV]
+                link = [last, root, key, value, expires, size]
+                last[self.NEXT] = root[self.PREV] = self.data[key] = link
+                self.currsize += size
+
+            if self.ttl is not None:
+                self._expire()
+
+            if self.maxsize is not None:
+                while self.currsize > self.maxsize:
+                    self._evict()
+
+    def __delitem__(self, key):
+        with self.lock:
+            self._remove(self.data[key])
+
+    def get(self, key, default=None):
+        """Return cached value for `key` and mark it as most recently used or
+        return `default` if `key` isn't cached.
+        """
+        with self.lock:
+            link = self.data.get(key)
+
+            if link is None:
+                self.misses += 1
+                return default
+
+            if self.ttl is not None and self._is_expired(link):
+                self._remove(link)
+                self.evictions += 1
+                self.misses += 1
+                return default
+
+            self.hits += 1
+
+            if link is not self.root[self.PREV]:
+                self._move_to_end(link)
+
+            return link[self.VALUE]
+
+    def keys(self):
+        """Return list of cached keys from least to most recently used."""
+        return [key for key, _ in self.items()]
+
+    def values(self):
+        """Return list of cached values from least to most recently used."""
+        return [value for _, value in self.items()]
+
+    def items(self):
+        """Return list of cached ``(key, value)`` pairs from least to most
+        recently used. Unlike :meth:`get`, listing items doesn't count as using
+        them.
+        """
+        with self.lock:
+            items = []
+            link = self.root[self.NEXT]
+
+            while link is not self.root:
+                if not self._is_expired(link):
+                    items.append((link[self.KEY], link[self.VALUE]))
+                link = link[self.NEXT]
+
+            return items
+
+    def clear(self):
+        """Remove all items from the cache and reset its counters."""
+        with self.lock:
+            self.currsize = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.data.clear()
+            self.root[:] = [self.root, self.root, None, None, None, None]
+
+    def info(self):
+        """Return :data:`CacheInfo` of the cache's counters and size."""
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, self.currsize)
+
+    def _is_expired(self, link):
+        """Return whether `link` has expired."""
+        return (link[self.EXPIRES] is not None and
+                link[self.EXPIRES] <= self.timer())
+
+    def _expire(self):
+        """Remove expired items from the least recently used end. Stops at the
+        first unexpired item so only items that haven't been used since they
+        expired are removed.
+        """
+        link = self.root[self.NEXT]
+
+        while link is not self.root and self._is_expired(link):
+            self._remove(link)
+            self.evictions += 1
+            link = self.root[self.NEXT]
+
+    def _evict(self):
+        """Remove the least recently used item."""
+        link = self.root[self.NEXT]
+        self._remove(link)
+        self.evictions += 1
+        return link
+
+    def _remove(self, link):
+        """Remove the item of `link`."""
+        self._unlink(link)
+        del self.data[link[self.KEY]]
+        self.currsize -= link[self.WEIGHT]
+
+    def _unlink(self, link):
+        """Remove `link` from the linked list."""
+        prev, nxt = link[self.PREV], link[self.NEXT]
+        prev[self.NEXT] = nxt
+        nxt[self.PREV] = prev
+
+    def _move_to_end(self, link):
+        """Mark `link` as the most recently used."""
+        self._unlink(link)
+        root = self.root
+        last = root[self.PREV]
+        link[self.PREV], link[self.NEXT] = last, root
+        last[self.NEXT] = root[self.PREV] = link
+
+
+class ScheduledCall(object):
+    """Handle of a call scheduled by :meth:`Scheduler.call_later`. The call can
+    be cancelled until it starts running and the handle works as a future of
+    its result.
+    """
+    PENDING, RUNNING, CANCELLED, FINISHED = range(4)
+
+    def __init__(self, when, callback, args):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.state = self.PENDING
+        self.value = None
+        self.error = None
+        self.lock = Lock()
+        self.finished = Event()
+
+    def cancel(self):
+        """Cancel the call unless it already started and return whether it's
+        cancelled.
+        """
+        with self.lock:
+            if self.state == self.PENDING:
+                self.state = self.CANCELLED
+                self.finished.set()
+
+            return self.state == self.CANCELLED
+
+    def cancelled(self):
+        """Return whether the call was cancelled."""
+        return self.state == self.CANCELLED
+
+    def done(self):
+        """Return whether the call finished or was cancelled."""
+        return self.finished.is_set()
+
+    def wait(self, timeout=None):
+        """Wait at most `timeout` seconds for the call to finish or be
+        cancelled and return whether it did.
+        """
+        self.finished.wait(timeout)
+        return self.finished.is_set()
+
+    def result(self):
+        """Wait for the call to finish and return its result or raise the
+        exception it raised.
+
+        Raises:
+            CancelledError: If the call was cancelled.
+        """
+        self.finished.wait()
+
+        if self.state == self.CANCELLED:
+            raise pyd.CancelledError()
+
+        if self.error is not None:
+            raise self.error
+
+        return self.value
+
+    def exception(self):
+        """Wait for the call to finish and return the exception it raised or
+        ``None``.
+
+        Raises:
+            CancelledError: If the call was cancelled.
+        """
+        self.finished.wait()
+
+        if self.state == self.CANCELLED:
+            raise pyd.CancelledError()
+
+        return self.error
+
+    def run(self):
+        """Run the call unless it was cancelled and store its outcome."""
+        with self.lock:
+            if self.state != self.PENDING:
+                return
+            self.state = self.RUNNING
+
+        try:
+            self.value = self.callback(*self.args)
+        except BaseException as exc:  # pylint: disable=broad-except
+            self.error = exc
+
+            if not isinstance(exc, Exception):
+                raise
+        finally:
+            self.state = self.FINISHED
+            self.finished.set()
+
+
+class Scheduler(object):
+    """Scheduler that runs callbacks after a delay. Pending callbacks are kept
+    in a heap ordered by their due time and waited on by a single daemon
+    thread which is started on first use, so any number of them only cost one
+    thread while they wait. Due callbacks are handed to a pool of at most
+    `max_workers` daemon worker threads which are started as needed so that a
+    slow callback doesn't hold up the ones due after it unless every worker is
+    busy. Its :meth:`call_later` has the same signature as the one of an
+    :mod:`asyncio` event loop so either can be used to schedule callbacks.
+    """
+    def __init__(self, max_workers=4):
+        self.queue = []
+        self.counter = count()
+        self.condition = Condition()
+        self.thread = None
+        self.max_workers = max_workers
+        self.due = deque()
+        self.workers = []
+        self.idle_workers = 0
+        self.work_condition = Condition()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def call_later(self, delay, callback, *args):
+        """Schedule `callback` to be called with `args` after `delay` seconds
+        and return its :class:`ScheduledCall`.
+        """
+        call = ScheduledCall(default_timer() + delay, callback, args)
+
+        with self.condition:
+            # The counter breaks ties between calls that are due at the same
+            # time so that they start in the order they were scheduled.
+            heapq.heappush(self.queue, (call.when, next(self.counter), call))
+
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = Thread(target=self.run,
+                                     name='pydash-scheduler')
+                self.thread.daemon = True
+                self.thread.start()
+
+            self.condition.notify()
+
+        return call
+
+    def run(self):
+        """Hand due calls to the worker threads forever."""
+        while True:
+            self.dispatch(self.next_due())
+
+    def dispatch(self, call):
+        """Queue `call` for the workers and start another worker if every
+        running one is busy and there are fewer than :attr:`max_workers`.
+        """
+        with self.work_condition:
+            self.due.append(call)
+            self.workers = [worker for worker in self.workers
+                            if worker.is_alive()]
+
+            if (self.idle_workers < len(self.due) and
+                    len(self.workers) < self.max_workers):
+                worker = Thread(target=self.work,
+                                name='pydash-scheduler-worker')
+                worker.daemon = True
+                worker.start()
+                self.workers.append(worker)
+
+            self.work_condition.notify()
+
+    def work(self):
+        """Run queued calls forever. Their outcome is stored in their
+        :class:`ScheduledCall`.
+        """
+        while True:
+            with self.work_condition:
+                self.idle_workers += 1
+
+                while not self.due:
+                    self.work_condition.wait()
+
+                self.idle_workers -= 1
+                call = self.due.popleft()
+
+            call.run()
+
+    def next_due(self):
+        """Wait for the next uncancelled call to be due and return it."""
+        queue = self.queue
+
+        with self.condition:
+            while True:
+                if not queue:
+                    self.condition.wait()
+                    continue
+
+                call = queue[0][2]
+
+                if call.cancelled():
+                    heapq.heappop(queue)
+                    continue
+
+                delay = call.when - default_timer()
+
+                if delay <= 0:
+                    heapq.heappop(queue)
+                    return call
+
+                self.condition.wait(delay)
+
+
+class AsyncioScheduler(object):
+    """Scheduler that runs callbacks after a delay on an :mod:`asyncio` event
+    loop. Its :meth:`call_later` returns an :mod:`asyncio` future of the
+    callback's result which cancels the callback when cancelled. If the
+    callback returns a coroutine, the future resolves to the coroutine's
+    result.
+    """
+    def __init__(self, loop=None):
+        self.loop = loop or asyncio.get_event_loop()
+
+    def call_later(self, delay, callback, *args):
+        """Schedule `callback` to be called with `args` after `delay` seconds
+        and return a future of its result.
+        """
+        loop = self.loop
+
+        if hasattr(loop, 'create_future'):
+            future = loop.create_future()
+        else:  # pragma: no cover
+            future = asyncio.Future(loop=loop)
+
+        timer = loop.call_later(delay, self.run, future, callback, args)
+
+        def cancel_timer(future):  # pylint: disable=missing-docstring
+            if future.cancelled():
+                timer.cancel()
+
+        future.add_done_callback(cancel_timer)
+
+        return future
+
+    @staticmethod
+    def run(future, callback, args):
+        """Run `callback` with `args` and set its outcome on `future`."""
+        if future.cancelled():
+            return
+
+        try:
+            result = callback(*args)
+        except Exception as exc:  # pylint: disable=broad-except
+            future.set_exception(exc)
+            return
+
+        if not (asyncio.iscoroutine(result) or
+                isinstance(result, asyncio.Future)):
+            future.set_result(result)
+            return
+
+        task = ensure_future(result)
+
+        def set_outcome(task):  # pylint: disable=missing-docstring
+            if future.cancelled():
+                return
+            elif task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
+
+        def cancel_task(future):  # pylint: disable=missing-docstring
+            if future.cancelled():
+                task.cancel()
+
+        task.add_done_callback(set_outcome)
+        future.add_done_callback(cancel_task)
+
+
+def get_running_loop():
+    """Return the :mod:`asyncio` event loop running in the current thread or
+    ``None``.
+    """
+    if asyncio is None:
+        return None
+
+    try:
+        return asyncio.get_running_loop()
+    except (AttributeError, RuntimeError):
+        # There's no running loop or no way to find it before PY37.
+        return None
+
+
+def get_scheduler(func=None):
+    """Return the scheduler to run delayed calls of `func` with. This is an
+    :class:`AsyncioScheduler` of the event loop running in the current thread
+    if there is one, or of the current event loop if `func` is a coroutine
+    function, and :data:`SCHEDULER` otherwise.
+    """
+    loop = get_running_loop()
+
+    if (loop is None and asyncio is not None and
+            asyncio.iscoroutinefunction(func)):
+        loop = asyncio.get_event_loop()
+
+    if loop is not None:
+        return AsyncioScheduler(loop)
+
+    return SCHEDULER
+
+
+#: Shared :class:`Scheduler` used by default for delayed function calls.
+SCHEDULER = Scheduler()
+
+
 def deprecated(func):  # pragma: no cover
     """This is a decorator which can be used to mark functions as deprecated.
     It will result in a warning being emitted when the function is used.
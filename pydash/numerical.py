@@ -6,14 +6,20 @@
 
 from __future__ import absolute_import, division
 
+from collections import deque
+from itertools import islice
 import math
+import operator
+import random
 
 import pydash as pyd
 from .helpers import itercallback, iterator
-from ._compat import _range
+from ._compat import _range, izip
 
 
 __all__ = (
+    'QuantileSketch',
+    'Stats',
     'add',
     'average',
     'avg',
@@ -24,12 +30,21 @@ __all__ = (
     'median',
     'moving_average',
     'moving_avg',
+    'moving_iter',
+    'moving_max',
+    'moving_min',
+    'moving_sum',
+    'moving_variance',
+    'percentile',
     'pow_',
     'power',
+    'quantile_sketch',
+    'quantiles',
     'round_',
     'scale',
     'sigma',
     'slope',
+    'stats',
     'std_deviation',
     'sum_',
     'transpose',
@@ -41,6 +56,305 @@ __all__ = (
 INFINITY = float('inf')
 
 
+class QuantileSketch(object):
+    """Approximate quantiles of an arbitrarily large stream of numbers in
+    bounded memory using a KLL sketch. Values are buffered in a hierarchy of
+    compactors where each level holds values of twice the weight of the level
+    below it. When the sketch is full, the first full level is sorted and every
+    other value is promoted to the next level so that at most ``O(k)`` values
+    are retained. Until the first compaction the sketch holds every value and
+    its quantiles are exact.
+
+    Sketches of separate streams can be combined with :meth:`merge`.
+
+    Args:
+        k (int, optional): Accuracy parameter. The rank error of a quantile is
+            roughly ``1.7 / k`` of the number of values. Defaults to ``200``.
+
+    Raises:
+        ValueError: If `k` is less than ``2``.
+    """
+    def __init__(self, k=200):
+        k = int(k)
+
+        if k < 2:
+            raise ValueError('k must be at least 2')
+
+        self.k = k
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._compactors = [[]]
+        self._size = 0
+        self._max_size = 0
+        self._random = random.Random()
+        self._update_max_size()
+
+    def __repr__(self):
+        return ('{0}(k={1!r}, count={2!r}, min={3!r}, max={4!r})'
+                .format(self.__class__.__name__,
+                        self.k,
+                        self.count,
+                        self.min,
+                        self.max))
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    def _capacity(self, level):
+        """Return the number of values `level` can hold before compaction."""
+        depth = len(self._compactors) - level - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def _update_max_size(self):
+        self._max_size = sum(self._capacity(level)
+                             for level in _range(len(self._compactors)))
+
+    def _compress(self):
+        """Compact full levels until the sketch is below its maximum size."""
+        for level in _range(len(self._compactors)):
+            items = self._compactors[level]
+
+            if len(items) < self._capacity(level):
+                continue
+
+            if level + 1 == len(self._compactors):
+                self._compactors.append([])
+                self._update_max_size()
+
+            items.sort()
+            leftover = items[:len(items) % 2]
+            offset = len(leftover) + self._random.getrandbits(1)
+            self._compactors[level + 1].extend(items[offset::2])
+            self._compactors[level] = leftover
+            self._size = sum(len(items) for items in self._compactors)
+
+            if self._size < self._max_size:
+                break
+
+    def add(self, value):
+        """Add `value` to sketch."""
+        self.update((value,))
+
+    def update(self, values):
+        """Add each value of `values` to sketch."""
+        values = iter(values)
+
+        while True:
+            chunk = list(islice(values, max(self._max_size - self._size, 1)))
+
+            if not chunk:
+                break
+
+            low = min(chunk)
+            high = max(chunk)
+
+            if self.min is None or low < self.min:
+                self.min = low
+
+            if self.max is None or high > self.max:
+                self.max = high
+
+            self._compactors[0].extend(chunk)
+            self.count += len(chunk)
+            self._size += len(chunk)
+
+            if self._size >= self._max_size:
+                self._compress()
+
+    def merge(self, other):
+        """Return new :class:`QuantileSketch` that summarizes the values of
+        this sketch and `other`.
+        """
+        merged = self.__class__(self.k)
+        merged._compactors = [list(items) for items in self._compactors]
+
+        for level, items in enumerate(other._compactors):
+            if level == len(merged._compactors):
+                merged._compactors.append([])
+            merged._compactors[level].extend(items)
+
+        merged.count = self.count + other.count
+        merged.min = self.min if other.min is None else other.min
+        merged.max = self.max if other.max is None else other.max
+
+        if self.min is not None and other.min is not None:
+            merged.min = min(self.min, other.min)
+            merged.max = max(self.max, other.max)
+
+        merged._size = sum(len(items) for items in merged._compactors)
+        merged._update_max_size()
+
+        while merged._size >= merged._max_size:
+            merged._compress()
+
+        return merged
+
+    def quantiles(self, quants):
+        """Return approximate quantile of sketched values for each quantile
+        (between ``0`` and ``1``) in `quants`.
+
+        Raises:
+            ValueError: If sketch is empty or a quantile is out of range.
+        """
+        if len(self._compactors) == 1:
+            return interpolate_quantiles(self._compactors[0], quants)
+
+        check_quantiles(quants, self.count)
+
+        weighted = sorted((value, 1 << level)
+                          for level, items in enumerate(self._compactors)
+                          for value in items)
+        targets = sorted((quant * self.count, idx)
+                         for idx, quant in enumerate(quants))
+        results = [None] * len(quants)
+        cumulative = 0
+        position = 0
+
+        for target, idx in targets:
+            while position < len(weighted) and cumulative < target:
+                cumulative += weighted[position][1]
+                position += 1
+            results[idx] = weighted[max(position - 1, 0)][0]
+
+        for idx, quant in enumerate(quants):
+            if quant == 0:
+                results[idx] = self.min
+            elif quant == 1:
+                results[idx] = self.max
+
+        return results
+
+    def quantile(self, quant):
+        """Return approximate quantile (between ``0`` and ``1``) of sketched
+        values.
+        """
+        return self.quantiles([quant])[0]
+
+    def percentile(self, percent):
+        """Return approximate percentile (between ``0`` and ``100``) of
+        sketched values.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError('percent must be between 0 and 100')
+
+        return self.quantile(percent / 100)
+
+
+class Stats(object):
+    """Accumulate the count, sum, mean, variance, minimum, and maximum of
+    numbers in a single pass. Variance is accumulated with Welford's algorithm
+    and two :class:`Stats` instances can be combined with Chan's parallel
+    algorithm via :meth:`merge` so that statistics can be computed over
+    chunks of data separately (e.g. in different processes) and then merged.
+    """
+    def __init__(self):
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+        self._mean = 0
+        self._sqdiff = 0
+
+    def __repr__(self):
+        return ('{0}(count={1!r}, sum={2!r}, min={3!r}, max={4!r})'
+                .format(self.__class__.__name__,
+                        self.count,
+                        self.sum,
+                        self.min,
+                        self.max))
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    @property
+    def mean(self):
+        """Arithmetic mean of values."""
+        return self.sum / self.count
+
+    @property
+    def variance(self):
+        """Population variance of values."""
+        return self._sqdiff / self.count
+
+    @property
+    def std_deviation(self):
+        """Population standard deviation of values."""
+        return math.sqrt(self.variance)
+
+    def add(self, value):
+        """Add `value` to statistics."""
+        self.update((value,))
+
+    def update(self, values):
+        """Add each value of `values` to statistics."""
+        count = self.count
+        total = self.sum
+        minimum = self.min
+        maximum = self.max
+        mean = self._mean
+        sqdiff = self._sqdiff
+
+        for value in values:
+            count += 1
+            total += value
+            delta = value - mean
+            mean += delta / count
+            sqdiff += delta * (value - mean)
+
+            if minimum is None or value < minimum:
+                minimum = value
+
+            if maximum is None or value > maximum:
+                maximum = value
+
+        self.count = count
+        self.sum = total
+        self.min = minimum
+        self.max = maximum
+        self._mean = mean
+        self._sqdiff = sqdiff
+
+    def merge(self, other):
+        """Return new :class:`Stats` that combines these statistics with
+        `other`.
+        """
+        merged = self.__class__()
+        merged.count = self.count + other.count
+        merged.sum = self.sum + other.sum
+        merged.min = self.min if other.min is None else other.min
+        merged.max = self.max if other.max is None else other.max
+
+        if self.min is not None and other.min is not None:
+            merged.min = min(self.min, other.min)
+            merged.max = max(self.max, other.max)
+
+        if not self.count or not other.count:
+            source = self if self.count else other
+            merged._mean = source._mean
+            merged._sqdiff = source._sqdiff
+        else:
+            delta = other._mean - self._mean
+            merged._mean = self._mean + delta * other.count / merged.count
+            merged._sqdiff = (self._sqdiff + other._sqdiff +
+                              delta * delta * self.count * other.count /
+                              merged.count)
+
+        return merged
+
+    def to_dict(self):
+        """Return statistics as a ``dict``."""
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.mean,
+            'variance': self.variance,
+            'std_deviation': self.std_deviation,
+            'min': self.min,
+            'max': self.max,
+        }
+
+
 def add(collection, callback=None):
     """Sum each element in `collection`. If callback is passed, each element of
     `collection` is passed through a callback before the summation is computed.
@@ -107,8 +421,12 @@ def average(collection, callback=None):
         - :func:`mean` (alias)
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: 3.4.0
+        Support any iterable by computing the mean in a single pass with
+        :func:`stats`.
     """
-    return add(collection, callback) / pyd.size(collection)
+    return stats(collection, callback).mean
 
 
 avg = average
@@ -175,6 +493,9 @@ def median(collection, callback=None):
     Returns:
         float: Result of median.
 
+    Raises:
+        ValueError: If `collection` is empty.
+
     Example:
 
         >>> median([1, 2, 3, 4, 5])
@@ -183,22 +504,29 @@ def median(collection, callback=None):
         2.5
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: 3.4.0
+        Select middle elements in linear time instead of sorting and apply
+        `callback` before selecting.
     """
-    length = len(collection)
-    middle = (length + 1) / 2
-    collection = [ret[0] for ret in itercallback(sorted(collection), callback)]
+    values = list(itercallbackvalues(collection, callback))
+    length = len(values)
+
+    if not length:
+        raise ValueError('median() of empty collection')
+
+    middle = length // 2
 
     if pyd.is_odd(length):
-        result = collection[int(middle - 1)]
+        result = select_ranks(values, [middle])[middle]
     else:
-        left = int(middle - 1.5)
-        right = int(middle - 0.5)
-        result = (collection[left] + collection[right]) / 2
+        selected = select_ranks(values, [middle - 1, middle])
+        result = (selected[middle - 1] + selected[middle]) / 2
 
     return result
 
 
-def moving_average(array, size):
+def moving_average(array, size, callback=None):
     """Calculate moving average of each element of `array`. If callback is
     passed, each element of `array` is passed through a callback before the
     moving average is computed.
@@ -206,6 +534,7 @@ def moving_average(array, size):
     Args:
         array (list): List to process.
         size (int): Window size.
+        callback (mixed, optional): Callback applied per iteration.
 
     Returns:
         list: Result of moving average.
@@ -218,26 +547,192 @@ def moving_average(array, size):
         [2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
         >>> moving_average(range(10), 10)
         [4.5]
+        >>> moving_average([{'a': 1}, {'a': 3}, {'a': 5}], 2, 'a')
+        [2.0, 4.0]
 
     See Also:
         - :func:`moving_averge` (main definition)
         - :func:`moving_avg` (alias)
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: 3.4.0
+        Compute averages from a running window sum in ``O(n)``, support any
+        iterable, and add `callback` argument.
     """
-    result = []
-    size = int(size)
+    return list(moving_iter(array, size, 'average', callback))
 
-    for i in _range(size - 1, len(array) + 1):
-        window = array[i - size:i]
 
-        if len(window) == size:
-            result.append(average(window))
+moving_avg = moving_average
 
-    return result
 
+def moving_iter(array, size, aggregate='average', callback=None):
+    """Like the ``moving_*`` functions except returns a generator that yields
+    each window's aggregate as soon as the window is filled. Supported
+    aggregates are ``'sum'``, ``'average'``, ``'min'``, ``'max'``, and
+    ``'variance'``. Each aggregate is computed in ``O(n)`` by updating the
+    previous window's result as values enter and leave the window. If callback
+    is passed, each element of `array` is passed through a callback before the
+    aggregate is computed.
 
-moving_avg = moving_average
+    Args:
+        array (iterable): Iterable to process.
+        size (int): Window size.
+        aggregate (str, optional): Aggregate to compute for each window.
+            Defaults to ``'average'``.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        generator: Aggregate of each window.
+
+    Raises:
+        ValueError: If `aggregate` isn't supported.
+
+    Example:
+
+        >>> gen = moving_iter(iter([1, 5, 2, 8, 3]), 3, 'max')
+        >>> next(gen)
+        5
+        >>> list(gen)
+        [8, 8]
+
+    .. versionadded:: 3.4.0
+    """
+    if aggregate not in MOVING_AGGREGATES:
+        raise ValueError('Invalid moving aggregate: {0}'.format(aggregate))
+
+    return MOVING_AGGREGATES[aggregate](itercallbackvalues(array, callback),
+                                        int(size))
+
+
+def moving_max(array, size, callback=None):
+    """Calculate moving maximum of each window of `size` elements of `array`.
+    If callback is passed, each element of `array` is passed through a
+    callback before the moving maximum is computed.
+
+    Args:
+        array (list): List to process.
+        size (int): Window size.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        list: Result of moving maximum.
+
+    Example:
+
+        >>> moving_max([1, 5, 2, 8, 3, 1], 3)
+        [5, 8, 8, 8]
+
+    .. versionadded:: 3.4.0
+    """
+    return list(moving_iter(array, size, 'max', callback))
+
+
+def moving_min(array, size, callback=None):
+    """Calculate moving minimum of each window of `size` elements of `array`.
+    If callback is passed, each element of `array` is passed through a
+    callback before the moving minimum is computed.
+
+    Args:
+        array (list): List to process.
+        size (int): Window size.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        list: Result of moving minimum.
+
+    Example:
+
+        >>> moving_min([1, 5, 2, 8, 3, 1], 3)
+        [1, 2, 2, 1]
+
+    .. versionadded:: 3.4.0
+    """
+    return list(moving_iter(array, size, 'min', callback))
+
+
+def moving_sum(array, size, callback=None):
+    """Calculate moving sum of each window of `size` elements of `array`. If
+    callback is passed, each element of `array` is passed through a callback
+    before the moving sum is computed.
+
+    Args:
+        array (list): List to process.
+        size (int): Window size.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        list: Result of moving sum.
+
+    Example:
+
+        >>> moving_sum([1, 2, 3, 4, 5], 2)
+        [3, 5, 7, 9]
+
+    .. versionadded:: 3.4.0
+    """
+    return list(moving_iter(array, size, 'sum', callback))
+
+
+def moving_variance(array, size, callback=None):
+    """Calculate moving variance of each window of `size` elements of `array`.
+    If callback is passed, each element of `array` is passed through a
+    callback before the moving variance is computed.
+
+    Args:
+        array (list): List to process.
+        size (int): Window size.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        list: Result of moving variance.
+
+    Example:
+
+        >>> [round(v, 4) for v in moving_variance([1, 2, 3, 4, 6], 3)]
+        [0.6667, 0.6667, 1.5556]
+
+    .. versionadded:: 3.4.0
+    """
+    return list(moving_iter(array, size, 'variance', callback))
+
+
+def percentile(collection, percent, callback=None):
+    """Calculate the `percent` percentile of the elements in `collection` using
+    linear interpolation between the closest ranks. If callback is passed,
+    each element of `collection` is passed through a callback before the
+    percentile is computed.
+
+    Args:
+        collection (list|dict): Collection to process.
+        percent (float): Percentile to compute between ``0`` and ``100``.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        float: Calculated percentile.
+
+    Raises:
+        ValueError: If `collection` is empty or `percent` is out of range.
+
+    Example:
+
+        >>> percentile([1, 2, 3, 4, 5], 50)
+        3
+        >>> percentile([1, 2, 3, 4], 25)
+        1.75
+        >>> percentile([{'ms': 30}, {'ms': 10}, {'ms': 20}], 100, 'ms')
+        30
+
+    See Also:
+        - :func:`quantiles`
+        - :class:`QuantileSketch`
+
+    .. versionadded:: 3.4.0
+    """
+    if not 0 <= percent <= 100:
+        raise ValueError('percent must be between 0 and 100')
+
+    return quantiles(collection, [percent / 100], callback)[0]
 
 
 def power(x, n):
@@ -276,6 +771,71 @@ def power(x, n):
 pow_ = power
 
 
+def quantile_sketch(collection, callback=None, k=200):
+    """Summarize the elements in `collection` with a bounded-memory
+    :class:`QuantileSketch`. If callback is passed, each element of
+    `collection` is passed through a callback before it is added to the
+    sketch.
+
+    Args:
+        collection (list|dict|iterable): Collection to process.
+        callback (mixed, optional): Callback applied per iteration.
+        k (int, optional): Accuracy parameter of the sketch. Defaults to
+            ``200``.
+
+    Returns:
+        QuantileSketch: Sketch which can be queried for approximate quantiles
+            and merged with sketches of other collections.
+
+    Example:
+
+        >>> sketch = quantile_sketch(iter([5, 1, 4, 2, 3]))
+        >>> sketch.quantiles([0, 0.5, 1])
+        [1, 3, 5]
+        >>> sketch.merge(quantile_sketch([6, 7, 8])).percentile(50)
+        4.5
+
+    .. versionadded:: 3.4.0
+    """
+    sketch = QuantileSketch(k)
+    sketch.update(itercallbackvalues(collection, callback))
+    return sketch
+
+
+def quantiles(collection, quants, callback=None):
+    """Calculate each quantile in `quants` of the elements in `collection`
+    using linear interpolation between the closest ranks. All quantiles are
+    selected together in expected linear time. If callback is passed, each
+    element of `collection` is passed through a callback before the
+    quantiles are computed.
+
+    Args:
+        collection (list|dict): Collection to process.
+        quants (list): Quantiles to compute between ``0`` and ``1``.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        list: Calculated quantiles in the same order as `quants`.
+
+    Raises:
+        ValueError: If `collection` is empty or a quantile is out of range.
+
+    Example:
+
+        >>> quantiles([4, 1, 5, 2, 3], [0.5, 0.25, 1])
+        [3, 2, 5]
+
+    See Also:
+        - :func:`percentile`
+        - :class:`QuantileSketch`
+
+    .. versionadded:: 3.4.0
+    """
+    return interpolate_quantiles(list(itercallbackvalues(collection,
+                                                         callback)),
+                                 quants)
+
+
 def round_(x, precision=0):
     """Round number to precision.
 
@@ -360,11 +920,14 @@ def slope(point1, point2):
     return result
 
 
-def std_deviation(array):
-    """Calculate standard deviation of list of numbers.
+def std_deviation(array, callback=None):
+    """Calculate standard deviation of list of numbers. If callback is passed,
+    each element of `array` is passed through a callback before the standard
+    deviation is computed.
 
     Args:
         array (list): List to process.
+        callback (mixed, optional): Callback applied per iteration.
 
     Returns:
         float: Calculated standard deviation.
@@ -379,43 +942,121 @@ def std_deviation(array):
         - :func:`sigma` (alias)
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: 3.4.0
+        Compute in a single pass with :func:`stats` and add `callback`
+        argument.
     """
-    return math.sqrt(variance(array))
+    return stats(array, callback).std_deviation
 
 
 sigma = std_deviation
 
 
+def stats(collection, callback=None):
+    """Calculate summary statistics of the elements in `collection` in a
+    single pass without holding the elements in memory. If callback is passed,
+    each element of `collection` is passed through a callback before the
+    statistics are computed.
+
+    Args:
+        collection (list|dict|iterable): Collection to process.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        Stats: Accumulated statistics which can be merged with the statistics
+            of other collections.
+
+    Example:
+
+        >>> summary = stats([1, 18, 20, 4])
+        >>> summary.count, summary.sum, summary.min, summary.max
+        (4, 43, 1, 20)
+        >>> summary.mean
+        10.75
+        >>> summary.variance
+        69.6875
+        >>> combined = stats([1, 18]).merge(stats(iter([20, 4])))
+        >>> combined.variance
+        69.6875
+
+    .. versionadded:: 3.4.0
+    """
+    summary = Stats()
+    summary.update(itercallbackvalues(collection, callback))
+    return summary
+
+
 def transpose(array):
-    """Transpose the elements of `array`.
+    """Transpose the elements of `array`. Rows may have different lengths in
+    which case the cells missing from shorter rows are filled with ``None``,
+    like :func:`itertools.zip_longest`, so that every value stays at its
+    row's index. If the rows are dicts, the result is a dict keyed by column
+    key, and if `array` is a dict, each transposed row is a dict keyed by row
+    key which only contains the rows that have that column.
 
     Args:
-        array (list): List to process.
+        array (list|dict): List or dict of rows to process.
 
     Returns:
-        list: Transposed list.
+        list|dict: Transposed list or dict.
 
     Example:
 
         >>> transpose([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
         [[1, 4, 7], [2, 5, 8], [3, 6, 9]]
+        >>> transpose([[1, 2, 3], [4], [7, 8]])
+        [[1, 4, 7], [2, None, 8], [3, None, None]]
+        >>> transpose([{'a': 1, 'b': 2}, {'a': 3}]) == {'a': [1, 3],\
+                                                        'b': [2, None]}
+        True
+        >>> transpose({'x': [1, 2], 'y': [3, 4]}) == [{'x': 1, 'y': 3},\
+                                                      {'x': 2, 'y': 4}]
+        True
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: 3.4.0
+        Build transposed rows in a single pass over the values, pad ragged
+        rows with ``None``, and support dicts.
     """
-    trans = []
+    rows = [row for _, row in iterator(array)]
+
+    if (not isinstance(array, dict) and
+            all(isinstance(row, (list, tuple)) for row in rows) and
+            len(set(len(row) for row in rows)) <= 1):
+        # Rectangular matrix so the builtin zip can do all the work.
+        return [list(row) for row in izip(*rows)]
+
+    is_dict_row = isinstance(array, dict)
+    trans = {}
+    columns = []
 
     for y, row in iterator(array):
-        for x, col in iterator(row):
-            trans = pyd.set_path(trans, col, [x, y])
+        for x, value in iterator(row):
+            trans_row = trans.get(x)
+
+            if trans_row is None:
+                trans_row = trans[x] = ({} if is_dict_row
+                                        else [None] * len(rows))
+                columns.append(x)
 
-    return trans
+            trans_row[y] = value
 
+    if rows and all(isinstance(row, dict) for row in rows):
+        return trans
 
-def variance(array):
-    """Calculate the variance of the elements in `array`.
+    return [trans[x] for x in columns]
+
+
+def variance(array, callback=None):
+    """Calculate the variance of the elements in `array`. If callback is
+    passed, each element of `array` is passed through a callback before the
+    variance is computed.
 
     Args:
         array (list): List to process.
+        callback (mixed, optional): Callback applied per iteration.
 
     Returns:
         float: Calculated variance.
@@ -426,12 +1067,12 @@ def variance(array):
         69.6875
 
     .. versionadded:: 2.1.0
-    """
-    ave = average(array)
 
-    def var(x): return power(x - ave, 2)  # pylint: disable=missing-docstring
-
-    return pyd._(array).map_(var).average().value()
+    .. versionchanged:: 3.4.0
+        Compute in a single pass with :func:`stats` and add `callback`
+        argument.
+    """
+    return stats(array, callback).variance
 
 
 def zscore(collection, callback=None):
@@ -453,18 +1094,233 @@ def zscore(collection, callback=None):
         # [-1.224744871391589, 0.0, 1.224744871391589]
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: 3.4.0
+        Compute mean and standard deviation in a single pass with
+        :func:`stats`.
     """
     array = pyd.map_(collection, callback)
-    ave = average(array)
-    sig = sigma(array)
+    summary = stats(array)
+    ave = summary.mean
+    sig = summary.std_deviation
 
-    return pyd.map_(array, lambda item: (item - ave) / sig)
+    return [(item - ave) / sig for item in array]
 
 
 #
 # Utility methods not a part of the main API
 #
 
+def itercallbackvalues(collection, callback=None):
+    """Return iterator of `collection` values passed through `callback`."""
+    if callback is None:
+        return (item for _, item in iterator(collection))
+    return (result[0] for result in itercallback(collection, callback))
+
+
+def check_quantiles(quants, count):
+    """Raise ValueError if `quants` cannot be computed over `count` values."""
+    if not count:
+        raise ValueError('quantiles of empty collection')
+
+    for quant in quants:
+        if not 0 <= quant <= 1:
+            raise ValueError('quantiles must be between 0 and 1')
+
+
+def interpolate_quantiles(values, quants):
+    """Return each quantile in `quants` of `values` using linear interpolation
+    between closest ranks.
+    """
+    check_quantiles(quants, len(values))
+
+    positions = [quant * (len(values) - 1) for quant in quants]
+    ranks = set()
+
+    for position in positions:
+        rank = int(position)
+        ranks.add(rank)
+
+        if position > rank:
+            ranks.add(rank + 1)
+
+    selected = select_ranks(values, sorted(ranks))
+    results = []
+
+    for position in positions:
+        rank = int(position)
+        result = selected[rank]
+
+        if position > rank:
+            result += (selected[rank + 1] - result) * (position - rank)
+
+        results.append(result)
+
+    return results
+
+
+#: Partitions at or below this size are sorted by :func:`select_ranks` since
+#: the builtin sort outperforms partitioning on smaller lists.
+SELECT_SORT_THRESHOLD = 10000
+
+
+def select_ranks(values, ranks):
+    """Return dictionary mapping each rank in `ranks` to the value which would
+    be at that index if `values` were sorted. Uses quickselect with three-way
+    partitioning so that all ranks are found in expected linear time.
+    """
+    selected = {}
+    stack = [(values, ranks, 0)]
+
+    while stack:
+        values, ranks, base = stack.pop()
+
+        if len(values) <= SELECT_SORT_THRESHOLD:
+            values = sorted(values)
+            for rank in ranks:
+                selected[rank] = values[rank - base]
+            continue
+
+        pivot = sorted(random.sample(values, 3))[1]
+        lows = [value for value in values if value < pivot]
+        highs = [value for value in values if pivot < value]
+        high_base = len(values) - len(highs) + base
+        low_ranks = []
+        high_ranks = []
+
+        for rank in ranks:
+            if rank < base + len(lows):
+                low_ranks.append(rank)
+            elif rank >= high_base:
+                high_ranks.append(rank)
+            else:
+                selected[rank] = pivot
+
+        if low_ranks:
+            stack.append((lows, low_ranks, base))
+
+        if high_ranks:
+            stack.append((highs, high_ranks, high_base))
+
+    return selected
+
+
+def itermoving_sum(values, size):
+    """Yield sum of each window of `size` values. The running sum is
+    recalculated from scratch each time the window has fully turned over to
+    keep floating point error from accumulating.
+    """
+    if size < 1:
+        return
+
+    window = deque()
+    total = 0
+    turnover = 0
+
+    for value in values:
+        window.append(value)
+        total += value
+
+        if len(window) > size:
+            total -= window.popleft()
+            turnover += 1
+
+            if turnover == size:
+                total = sum(window)
+                turnover = 0
+
+        if len(window) == size:
+            yield total
+
+
+def itermoving_average(values, size):
+    """Yield average of each window of `size` values."""
+    for total in itermoving_sum(values, size):
+        yield total / size
+
+
+def itermoving_variance(values, size):
+    """Yield variance of each window of `size` values using Welford's
+    algorithm updated for values leaving the window. The mean and sum of
+    squared differences are recalculated each time the window has fully
+    turned over to keep floating point error from accumulating.
+    """
+    if size < 1:
+        return
+
+    window = deque()
+    mean = 0
+    sqdiff = 0
+    turnover = 0
+
+    for value in values:
+        window.append(value)
+
+        if len(window) <= size:
+            # Window is still filling up.
+            delta = value - mean
+            mean += delta / len(window)
+            sqdiff += delta * (value - mean)
+        else:
+            old = window.popleft()
+            old_mean = mean
+            mean += (value - old) / size
+            sqdiff += (value - old) * (value - mean + old - old_mean)
+            turnover += 1
+
+            if turnover == size:
+                mean = sum(window) / size
+                sqdiff = sum((item - mean) ** 2 for item in window)
+                turnover = 0
+
+        if len(window) == size:
+            yield max(sqdiff, 0) / size
+
+
+def itermoving_extreme(values, size, is_dominated):
+    """Yield the extreme of each window of `size` values using a monotonic
+    deque. A value is discarded from the deque once a newer value dominates it
+    according to `is_dominated(old, new)` since it can never be the window's
+    extreme again.
+    """
+    if size < 1:
+        return
+
+    window = deque()
+
+    for index, value in enumerate(values):
+        while window and is_dominated(window[-1][1], value):
+            window.pop()
+
+        window.append((index, value))
+
+        if window[0][0] <= index - size:
+            window.popleft()
+
+        if index >= size - 1:
+            yield window[0][1]
+
+
+def itermoving_min(values, size):
+    """Yield minimum of each window of `size` values."""
+    return itermoving_extreme(values, size, operator.ge)
+
+
+def itermoving_max(values, size):
+    """Yield maximum of each window of `size` values."""
+    return itermoving_extreme(values, size, operator.le)
+
+
+#: Generators used by :func:`moving_iter` for each supported aggregate.
+MOVING_AGGREGATES = {
+    'sum': itermoving_sum,
+    'average': itermoving_average,
+    'min': itermoving_min,
+    'max': itermoving_max,
+    'variance': itermoving_variance,
+}
+
+
 def rounder(func, x, precision):
     precision = pow(10, precision)
 
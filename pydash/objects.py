@@ -12,12 +12,14 @@ import re
 
 import pydash as pyd
 from .helpers import (
+    base_get,
     iterator,
     itercallback,
     get_item,
     set_item,
     NoValue,
-    call_callback
+    call_callback,
+    LRUCache
 )
 from ._compat import iteritems, text_type
 
@@ -27,6 +29,7 @@ __all__ = (
     'callables',
     'clone',
     'clone_deep',
+    'compile_path',
     'deep_get',
     'deep_has',
     'deep_set',
@@ -70,6 +73,30 @@ __all__ = (
 )
 
 
+class CompiledPath(object):
+    """Wrap an object path that has been parsed once into its list of keys so
+    that it can be used for repeated lookups without being parsed again.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.keys = tuple(path_keys(path))
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self.path)
+
+    def get(self, obj, default=None):
+        """Return value at path of `obj`. See :func:`get`."""
+        return get(obj, self, default=default)
+
+    def has(self, obj):
+        """Return whether path exists in `obj`. See :func:`has`."""
+        return has(obj, self)
+
+    def set(self, obj, value, mode=None):
+        """Set value at path of `obj`. See :func:`set_`."""
+        return set_(obj, self, value, mode=mode)
+
+
 def assign(obj, *sources, **kargs):
     """Assigns own enumerable properties of source object(s) to the destination
     object. If `callback` is supplied, it is invoked with two arguments:
@@ -233,6 +260,40 @@ def clone_deep(value, callback=None):
     return clone(value, is_deep=True, callback=callback)
 
 
+def compile_path(path):
+    """Parse `path` into a :class:`CompiledPath` which can be used to
+    repeatedly get, check, or set the path on objects without parsing the path
+    each time. A :class:`CompiledPath` can also be passed as the path argument
+    to :func:`get`, :func:`has`, and :func:`set_`.
+
+    Args:
+        path (str|list): List or ``.`` delimited string of path describing
+            path.
+
+    Returns:
+        CompiledPath: Parsed path.
+
+    Example:
+
+        >>> path = compile_path('a.b.[0].c')
+        >>> path.keys
+        ('a', 'b', 0, 'c')
+        >>> path.get({'a': {'b': [{'c': 1}]}})
+        1
+        >>> path.has({'a': {'b': []}})
+        False
+        >>> path.set({'a': {'b': [{}]}}, 1)
+        {'a': {'b': [{'c': 1}]}}
+        >>> get({'a': {'b': [{'c': 2}]}}, path)
+        2
+
+    .. versionadded:: 3.4.0
+    """
+    if isinstance(path, CompiledPath):
+        return path
+    return CompiledPath(path)
+
+
 def deep_map_values(obj, callback=None, property_path=NoValue):
     """Map all non-object values in `obj` with return values from `callback`.
     The callback is invoked with two arguments: ``(obj_value, property_path)``
@@ -484,11 +545,18 @@ def get(obj, path, default=None):
 
         - Added :func:`get` as main definition and :func:`get_path` as alias.
         - Made :func:`deep_get` an alias.
+
+    .. versionchanged:: 3.4.0
+
+        - Return `default` when any part of the path doesn't exist.
+        - Support attribute access for objects that don't support item
+          access.
     """
     for key in path_keys(path):
-        obj = get_item(obj, key, default=default)
-        if obj is None:
-            break
+        obj = base_get(obj, key)
+
+        if obj is NoValue:
+            return default
 
     return obj
 
@@ -535,14 +603,18 @@ def has(obj, path):
 
         - Added :func:`deep_has` as alias.
         - Added :func:`has_path` as alias.
+
+    .. versionchanged:: 3.4.0
+        Check path without raising and catching exceptions and support
+        attribute access for objects that don't support item access.
     """
-    try:
-        get(obj, path, default=NoValue)
-        exists = True
-    except (KeyError, IndexError, TypeError, ValueError):
-        exists = False
+    for key in path_keys(path):
+        obj = base_get(obj, key)
+
+        if obj is NoValue:
+            return False
 
-    return exists
+    return True
 
 
 deep_has = has
@@ -925,7 +997,7 @@ def rename_keys(obj, key_map):
                 for key, value in iteritems(obj))
 
 
-def set_(obj, path, value):
+def set_(obj, path, value, mode=None):
     """Sets the value of an object described by `path`. If any part of the
     object path doesn't exist, it will be created.
 
@@ -933,6 +1005,9 @@ def set_(obj, path, value):
         obj (list|dict): Object to modify.
         path (str | list): Target path to set value to.
         value (mixed): Value to set.
+        mode (str, optional): How `obj` is copied before it is modified. See
+            :func:`update_path` for the supported modes. Defaults to
+            ``'deep'``.
 
     Returns:
         mixed: Modified `obj`.
@@ -950,14 +1025,17 @@ def set_(obj, path, value):
 
     .. versionchanged:: 3.3.0
         Added :func:`set_` as main definition and :func:`deep_set` as alias.
+
+    .. versionchanged:: 3.4.0
+        Added `mode` argument.
     """
-    return set_path(obj, value, path_keys(path))
+    return set_path(obj, value, path_keys(path), mode=mode)
 
 
 deep_set = set_
 
 
-def set_path(obj, value, keys, default=None):
+def set_path(obj, value, keys, default=None, mode=None):
     """Sets the value of an object described by `keys`. If any part of the
     object path doesn't exist, it will be created with `default`.
 
@@ -968,6 +1046,9 @@ def set_path(obj, value, keys, default=None):
         default (callable, optional): Callable that returns default value to
             assign if path part is not set. Defaults to ``{}`` if `obj` is a
             ``dict`` or ``[]`` if `obj` is a ``list``.
+        mode (str, optional): How `obj` is copied before it is modified. See
+            :func:`update_path` for the supported modes. Defaults to
+            ``'deep'``.
 
     Returns:
         mixed: Modified `obj`.
@@ -980,9 +1061,12 @@ def set_path(obj, value, keys, default=None):
         True
 
     .. versionadded:: 2.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `mode` argument.
     """
     # pylint: disable=redefined-outer-name
-    return update_path(obj, lambda *_: value, keys, default=default)
+    return update_path(obj, lambda *_: value, keys, default=default, mode=mode)
 
 
 def to_boolean(obj, true_values=('true', '1'), false_values=('false', '0')):
@@ -1182,12 +1266,22 @@ def transform(obj, callback=None, accumulator=None):
     return accumulator
 
 
-def update_path(obj, callback, keys, default=None):
+def update_path(obj, callback, keys, default=None, mode=None):
     """Update the value of an object described by `keys` using `callback`. If
     any part of the object path doesn't exist, it will be created with
     `default`. The callback is invoked with the last key value of `obj`:
     ``(value)``
 
+    The `mode` argument controls how `obj` is copied before it is modified:
+
+    - ``'deep'``: `obj` is deep cloned before being modified. This is the
+      default.
+    - ``'path'``: Only the containers along `keys` are shallow copied while
+      everything else is shared with `obj` (i.e. structural sharing). This
+      is much faster for large objects but the result shares its untouched
+      subtrees with `obj` so mutating them also mutates `obj`.
+    - ``'inplace'``: `obj` is modified in place.
+
     Args:
         obj (list|dict): Object to modify.
         callback (function): Function that returns updated value.
@@ -1196,20 +1290,45 @@ def update_path(obj, callback, keys, default=None):
         default (mixed, optional): Default value to assign if path part is not
             set. Defaults to ``{}`` if `obj` is a ``dict`` or ``[]`` if `obj`
             is a ``list``.
+        mode (str, optional): How `obj` is copied before it is modified.
+            Defaults to ``'deep'``.
 
     Returns:
         mixed: Updated `obj`.
 
+    Raises:
+        ValueError: If `mode` isn't a supported mode.
+
     Example:
 
         >>> update_path({}, lambda value: value, ['a', 'b'])
         {'a': {'b': None}}
         >>> update_path([], lambda value: value, [0, 0])
         [[None]]
+        >>> obj = {'a': {'b': 1}, 'c': {'d': 2}}
+        >>> new_obj = update_path(obj, lambda value: value + 1, ['a', 'b'],\
+                                  mode='path')
+        >>> new_obj['a'] is not obj['a'] and new_obj['c'] is obj['c']
+        True
+        >>> obj['a']['b']
+        1
+        >>> new_obj = update_path(obj, lambda value: 5, ['a', 'b'],\
+                                  mode='inplace')
+        >>> new_obj is obj and obj['a']['b'] == 5
+        True
 
     .. versionadded:: 2.0.0
+
+    .. versionchanged:: 3.4.0
+        Added `mode` argument.
     """
     # pylint: disable=redefined-outer-name
+    if mode is None:
+        mode = 'deep'
+
+    if mode not in UPDATE_PATH_MODES:
+        raise ValueError('Invalid update_path mode: {0}'.format(mode))
+
     if default is None:
         default = {} if isinstance(obj, dict) else []
 
@@ -1217,16 +1336,30 @@ def update_path(obj, callback, keys, default=None):
         keys = [keys]
 
     last_key = pyd.last(keys)
-    obj = clone_deep(obj)
+
+    if mode == 'deep':
+        obj = clone_deep(obj)
+    elif mode == 'path':
+        obj = copy.copy(obj)
+
     target = obj
 
     for key in pyd.initial(keys):
         set_item(target, key, clone_deep(default), allow_override=False)
 
         try:
-            target = target[key]
+            child = target[key]
         except TypeError:
-            target = target[int(key)]
+            key = int(key)
+            child = target[key]
+
+        if mode == 'path':
+            # Copy each container along the path so that the modification
+            # doesn't leak into the original object.
+            child = copy.copy(child)
+            target[key] = child
+
+        target = child
 
     set_item(target, last_key, callback(get_item(target,
                                                  last_key,
@@ -1271,25 +1404,40 @@ values_in = values
 # Helper functions not a part of main API
 #
 
+#: Supported values for the `mode` argument of :func:`update_path`.
+UPDATE_PATH_MODES = ('deep', 'path', 'inplace')
+
+
+#: Matches "." as delimiter unless it is escaped by "//".
+RE_PATH_KEY_DELIM = re.compile(r'(?<!\\)(?:\\\\)*\.')
+
+#: Since we can't tell whether a bare number is supposed to be dict key or a
+#: list index, we support a special syntax where any string-integer surrounded
+#: by brackets is treated as a list index and converted to an integer.
+RE_PATH_LIST_INDEX = re.compile(r'\[[\d\]]')
+
+#: Cache of parsed string paths so that each distinct path string is only
+#: parsed once.
+PATH_KEYS_CACHE = LRUCache(maxsize=1024)
+
 
 def path_keys(keys):
     """Convert keys used to access an object's path into the standard form: a
     list of keys.
     """
     # pylint: disable=redefined-outer-name
-    if pyd.is_string(keys):
-        # This matches "." as delimiter unless it is escaped by "//".
-        re_dot_delim = re.compile(r'(?<!\\)(?:\\\\)*\.')
-
-        # Since we can't tell whether a bare number is supposed to be dict key
-        # or a list index, we support a special syntax where any string-integer
-        # surrounded by brackets is treated as a list index and converted to an
-        # integer.
-        re_list_index = re.compile(r'\[[\d\]]')
-
-        keys = [int(key[1:-1]) if re_list_index.match(key)
-                else unescape_path_key(key)
-                for key in re_dot_delim.split(keys)]
+    if isinstance(keys, CompiledPath):
+        keys = list(keys.keys)
+    elif pyd.is_string(keys):
+        parsed = PATH_KEYS_CACHE.get(keys)
+
+        if parsed is None:
+            parsed = tuple(int(key[1:-1]) if RE_PATH_LIST_INDEX.match(key)
+                           else unescape_path_key(key)
+                           for key in RE_PATH_KEY_DELIM.split(keys))
+            PATH_KEYS_CACHE[keys] = parsed
+
+        keys = list(parsed)
     elif pyd.is_number(keys):
         keys = [keys]
     elif keys is NoValue:
@@ -9,12 +9,13 @@ import re
 import unicodedata
 
 import pydash as pyd
-from .helpers import NoValue
+from .helpers import LRUCache, NoValue
 from ._compat import (
     html_unescape,
     iteritems,
     parse_qsl,
     text_type,
+    unichr,
     urlencode,
     urlsplit,
     urlunsplit,
@@ -24,6 +25,7 @@ from ._compat import (
 
 __all__ = (
     'camel_case',
+    'camel_case_many',
     'capitalize',
     'chop',
     'chop_right',
@@ -41,18 +43,21 @@ __all__ = (
     'explode',
     'has_substr',
     'human_case',
+    'human_case_many',
     'implode',
     'insert_substr',
     'join',
     'js_match',
     'js_replace',
     'kebab_case',
+    'kebab_case_many',
     'lines',
     'number_format',
     'pad',
     'pad_left',
     'pad_right',
     'pascal_case',
+    'pascal_case_many',
     'predecessor',
     'prune',
     'quote',
@@ -60,12 +65,16 @@ __all__ = (
     'repeat',
     'replace',
     'separator_case',
+    'separator_case_many',
     'series_phrase',
     'series_phrase_serial',
     'slugify',
+    'slugify_many',
     'snake_case',
+    'snake_case_many',
     'split',
     'start_case',
+    'start_case_many',
     'starts_with',
     'strip_tags',
     'substr_left',
@@ -165,12 +174,34 @@ DEBURRED_LETTERS = {
     '\xF7': ' '
 }
 
+#: Latin Extended-A letters which don't decompose to ASCII letters mapped to
+#: their deburred equivalents.
+DEBURRED_EXTENDED_LETTERS = {
+    0x110: 'D',
+    0x111: 'd',
+    0x126: 'H',
+    0x127: 'h',
+    0x131: 'i',
+    0x138: 'k',
+    0x141: 'L',
+    0x142: 'l',
+    0x149: "'n",
+    0x14A: 'N',
+    0x14B: 'n',
+    0x152: 'Oe',
+    0x153: 'oe',
+    0x166: 'T',
+    0x167: 't',
+    0x17F: 's'
+}
+
 # Use Javascript style regex to make Lo-Dash compatibility easier.
 UPPER = '[A-Z\\xC0-\\xD6\\xD8-\\xDE]'
 LOWER = '[a-z\\xDf-\\xF6\\xF8-\\xFF]+'
 RE_WORDS = ('/{upper}+(?={upper}{lower})|{upper}?{lower}|{upper}+|[0-9]+/g'
             .format(upper=UPPER, lower=LOWER))
 RE_LATIN1 = '/[\xC0-\xFF]/g'
+RE_NON_ASCII = re.compile('[^\x00-\x7F]')
 
 
 def camel_case(text):
@@ -193,6 +224,29 @@ def camel_case(text):
     return text[:1].lower() + text[1:]
 
 
+def camel_case_many(iterable, maxsize=1024):
+    """Converts each string in `iterable` to camel case like
+    :func:`camel_case`. Results of repeated strings are memoized in a cache
+    that holds at most `maxsize` strings.
+
+    Args:
+        iterable (list|iterable): Strings to convert.
+        maxsize (int, optional): Maximum number of memoized strings. Defaults
+            to ``1024``.
+
+    Returns:
+        generator: Generator of converted strings.
+
+    Example:
+
+        >>> list(camel_case_many(['FOO BAR_bAz', 'foo_bar', 'FOO BAR_bAz']))
+        ['fooBarBAz', 'fooBar', 'fooBarBAz']
+
+    .. versionadded:: 3.4.0
+    """
+    return itermemoize(camel_case, iterable, maxsize)
+
+
 def capitalize(text, strict=True):
     """Capitalizes the first character of `text`.
 
@@ -360,8 +414,18 @@ def deburr(text):
         # 'deja vu'
 
     .. versionadded:: 2.0.0
+
+    .. versionchanged:: 3.4.0
+        Deburr Latin Extended-A letters and translate letters with
+        :data:`DEBURR_TABLE` instead of a regular expression.
     """
     text = pyd.to_string(text)
+
+    if isinstance(text, text_type):
+        if RE_NON_ASCII.search(text):
+            text = text.translate(DEBURR_TABLE)
+        return text
+
     return js_replace(text,
                       RE_LATIN1,
                       lambda match: DEBURRED_LETTERS.get(match.group(),
@@ -566,12 +630,31 @@ def human_case(text):
 
     .. versionadded:: 3.0.0
     """
-    return (pyd.chain(text)
-            .snake_case()
-            .re_replace('_id$', '')
-            .replace('_', ' ')
-            .capitalize()
-            .value())
+    text = re_replace(snake_case(text), '_id$', '')
+    return capitalize(replace(text, '_', ' '))
+
+
+def human_case_many(iterable, maxsize=1024):
+    """Converts each string in `iterable` to human case like
+    :func:`human_case`. Results of repeated strings are memoized in a cache
+    that holds at most `maxsize` strings.
+
+    Args:
+        iterable (list|iterable): Strings to convert.
+        maxsize (int, optional): Maximum number of memoized strings. Defaults
+            to ``1024``.
+
+    Returns:
+        generator: Generator of converted strings.
+
+    Example:
+
+        >>> list(human_case_many(['abc-def_hij lmn', 'user_id']))
+        ['Abc def hij lmn', 'User']
+
+    .. versionadded:: 3.4.0
+    """
+    return itermemoize(human_case, iterable, maxsize)
 
 
 def insert_substr(text, index, subtext):
@@ -716,6 +799,29 @@ def kebab_case(text):
     return separator_case(text, '-')
 
 
+def kebab_case_many(iterable, maxsize=1024):
+    """Converts each string in `iterable` to kebab case like
+    :func:`kebab_case`. Results of repeated strings are memoized in a cache
+    that holds at most `maxsize` strings.
+
+    Args:
+        iterable (list|iterable): Strings to convert.
+        maxsize (int, optional): Maximum number of memoized strings. Defaults
+            to ``1024``.
+
+    Returns:
+        generator: Generator of converted strings.
+
+    Example:
+
+        >>> list(kebab_case_many(['fooBar', 'foo_bar', 'fooBar']))
+        ['foo-bar', 'foo-bar', 'foo-bar']
+
+    .. versionadded:: 3.4.0
+    """
+    return itermemoize(kebab_case, iterable, maxsize)
+
+
 def lines(text):
     r"""Split lines in `text` into an array.
 
@@ -908,6 +1014,33 @@ def pascal_case(text, strict=True):
     return capitalize(camel_case(text), strict=False)
 
 
+def pascal_case_many(iterable, strict=True, maxsize=1024):
+    """Converts each string in `iterable` to pascal case like
+    :func:`pascal_case`. Results of repeated strings are memoized in a cache
+    that holds at most `maxsize` strings.
+
+    Args:
+        iterable (list|iterable): Strings to convert.
+        strict (bool, optional): Whether to cast rest of string to lower
+            case. Defaults to ``True``.
+        maxsize (int, optional): Maximum number of memoized strings. Defaults
+            to ``1024``.
+
+    Returns:
+        generator: Generator of converted strings.
+
+    Example:
+
+        >>> list(pascal_case_many(['FOO BAR_bAz', 'foo_bar']))
+        ['FooBarBaz', 'FooBar']
+
+    .. versionadded:: 3.4.0
+    """
+    return itermemoize(lambda text: pascal_case(text, strict),
+                       iterable,
+                       maxsize)
+
+
 def predecessor(char):
     """Return the predecessor character of `char`.
 
@@ -1150,8 +1283,33 @@ def separator_case(text, separator):
 
     .. versionadded:: 3.0.0
     """
-    return separator.join(word.lower()
-                          for word in words(text) if word)
+    return separator.join([word.lower() for word in words(text) if word])
+
+
+def separator_case_many(iterable, separator, maxsize=1024):
+    """Converts each string in `iterable` to words joined by `separator` like
+    :func:`separator_case`. Results of repeated strings are memoized in a cache
+    that holds at most `maxsize` strings.
+
+    Args:
+        iterable (list|iterable): Strings to convert.
+        separator (str): Separator to join words with.
+        maxsize (int, optional): Maximum number of memoized strings. Defaults
+            to ``1024``.
+
+    Returns:
+        generator: Generator of converted strings.
+
+    Example:
+
+        >>> list(separator_case_many(['a!!b___c.d', 'fooBar'], '-'))
+        ['a-b-c-d', 'foo-bar']
+
+    .. versionadded:: 3.4.0
+    """
+    return itermemoize(lambda text: separator_case(text, separator),
+                       iterable,
+                       maxsize)
 
 
 def series_phrase(items, separator=', ', last_separator=' and ', serial=False):
@@ -1245,12 +1403,45 @@ def slugify(text, separator='-'):
         True
 
     .. versionadded:: 3.0.0
+
+    .. versionchanged:: 3.4.0
+        Letters without an ``NFKD`` decomposition like ``ß`` and ``ø`` are
+        deburred with :data:`DEBURR_TABLE` instead of being dropped.
     """
-    normalized = (unicodedata.normalize('NFKD', text_type(pyd.to_string(text)))
+    text = deburr(text_type(pyd.to_string(text)))
+    normalized = (unicodedata.normalize('NFKD', text)
                   .encode('ascii', 'ignore')
                   .decode('utf8'))
 
-    return separator_case(normalized, separator)
+    return separator.join([word.lower()
+                           for word in WORDS_RE.find(normalized)])
+
+
+def slugify_many(iterable, separator='-', maxsize=1024):
+    """Converts each string in `iterable` into an ASCII slug like
+    :func:`slugify`. Results of repeated strings are memoized in a cache that
+    holds at most `maxsize` strings.
+
+    Args:
+        iterable (list|iterable): Strings to slugify.
+        separator (str, optional): Separator to use. Defaults to ``'-'``.
+        maxsize (int, optional): Maximum number of memoized strings. Defaults
+            to ``1024``.
+
+    Returns:
+        generator: Generator of slugified strings.
+
+    Example:
+
+        >>> slugs = list(slugify_many(['This is a slug.', 'Cafe Creme']))
+        >>> slugs == ['this-is-a-slug', 'cafe-creme']
+        True
+
+    .. versionadded:: 3.4.0
+    """
+    return itermemoize(lambda text: slugify(text, separator),
+                       iterable,
+                       maxsize)
 
 
 def snake_case(text):
@@ -1279,6 +1470,29 @@ def snake_case(text):
 underscore_case = snake_case
 
 
+def snake_case_many(iterable, maxsize=1024):
+    """Converts each string in `iterable` to snake case like
+    :func:`snake_case`. Results of repeated strings are memoized in a cache
+    that holds at most `maxsize` strings.
+
+    Args:
+        iterable (list|iterable): Strings to convert.
+        maxsize (int, optional): Maximum number of memoized strings. Defaults
+            to ``1024``.
+
+    Returns:
+        generator: Generator of converted strings.
+
+    Example:
+
+        >>> list(snake_case_many(['fooBar', 'Foo Bar!', 'fooBar']))
+        ['foo_bar', 'foo_bar', 'foo_bar']
+
+    .. versionadded:: 3.4.0
+    """
+    return itermemoize(snake_case, iterable, maxsize)
+
+
 def split(text, separator=NoValue):
     """Splits `text` on `separator`. If `separator` not provided, then `text`
     is split on whitespace. If `separator` is falsey, then `text` is split on
@@ -1344,6 +1558,29 @@ def start_case(text):
     return ' '.join(word.capitalize() for word in words(text))
 
 
+def start_case_many(iterable, maxsize=1024):
+    """Converts each string in `iterable` to start case like
+    :func:`start_case`. Results of repeated strings are memoized in a cache
+    that holds at most `maxsize` strings.
+
+    Args:
+        iterable (list|iterable): Strings to convert.
+        maxsize (int, optional): Maximum number of memoized strings. Defaults
+            to ``1024``.
+
+    Returns:
+        generator: Generator of converted strings.
+
+    Example:
+
+        >>> list(start_case_many(['fooBar', 'foo_bar']))
+        ['Foo Bar', 'Foo Bar']
+
+    .. versionadded:: 3.4.0
+    """
+    return itermemoize(start_case, iterable, maxsize)
+
+
 def starts_with(text, target, position=0):
     """Checks if `text` starts with a given target string.
 
@@ -1824,7 +2061,10 @@ def words(text, pattern=None):
     .. verionchanged:: 3.2.0
         Improved matching for one character words.
     """
-    return js_match(text, pattern or RE_WORDS)
+    if not pattern:
+        return WORDS_RE.find(pyd.to_string(text))
+
+    return js_match(text, pattern)
 
 
 #
@@ -1832,18 +2072,54 @@ def words(text, pattern=None):
 #
 
 
-def js_to_py_re_find(reg_exp):
-    """Return Python regular expression matching function based on Javascript
-    style regexp.
+def itermemoize(func, iterable, maxsize):
+    """Yield result of `func` for each item of `iterable` while memoizing
+    results of repeated items in a :class:`pydash.helpers.LRUCache` of at
+    most `maxsize` items. Items are cached by their type and value so that
+    equal items of different types like ``1`` and ``True`` aren't confused.
     """
-    pattern, options = reg_exp[1:].rsplit('/', 1)
-    flags = re.I if 'i' in options else 0
+    cache = LRUCache(maxsize=maxsize)
+
+    for item in iterable:
+        key = (type(item), item)
 
-    def find(text):  # pylint: disable=missing-docstring
-        if 'g' in options:
-            results = re.findall(pattern, text, flags=flags)
+        try:
+            result = cache.get(key, NoValue)
+        except TypeError:
+            result = func(item)
         else:
-            results = re.search(pattern, text, flags=flags)
+            if result is NoValue:
+                result = cache[key] = func(item)
+
+        yield result
+
+
+class JSRegExp(object):
+    """Javascript style regular expression compiled to a Python regular
+    expression. The ``g`` flag controls whether all matches are found or
+    replaced while the ``i`` and ``m`` flags are translated to
+    :data:`re.IGNORECASE` and :data:`re.MULTILINE`.
+    """
+    def __init__(self, reg_exp):
+        pattern, options = reg_exp[1:].rsplit('/', 1)
+        flags = re.IGNORECASE if 'i' in options else 0
+
+        if 'm' in options:
+            flags |= re.MULTILINE
+
+        self.reg_exp = reg_exp
+        self.is_global = 'g' in options
+        self.pattern = re.compile(pattern, flags)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self.reg_exp)
+
+    def find(self, text):
+        """Return list of matches found in `text`."""
+        if self.is_global:
+            results = self.pattern.findall(text)
+        else:
+            results = self.pattern.search(text)
 
             if results:
                 results = [results.group()]
@@ -1852,25 +2128,76 @@ def js_to_py_re_find(reg_exp):
 
         return results
 
-    return find
+    def replace(self, text, repl):
+        """Replace matches found in `text` with `repl`."""
+        text = pyd.to_string(text)
+
+        if not pyd.is_function(repl):
+            repl = pyd.to_string(repl)
+
+        return self.pattern.sub(repl, text, count=0 if self.is_global else 1)
+
+
+#: Cache of compiled :class:`JSRegExp` objects keyed by Javascript style
+#: regular expression.
+JS_RE_CACHE = LRUCache(maxsize=512)
+
+#: Compiled :data:`RE_WORDS` used to split text into words.
+WORDS_RE = JSRegExp(RE_WORDS)
+
+
+def js_to_py_re(reg_exp):
+    """Return compiled :class:`JSRegExp` for Javascript style regexp. Each
+    regexp is only parsed and compiled once while it remains in
+    :data:`JS_RE_CACHE`.
+    """
+    compiled = JS_RE_CACHE.get(reg_exp)
+
+    if compiled is None:
+        compiled = JS_RE_CACHE[reg_exp] = JSRegExp(reg_exp)
+
+    return compiled
+
+
+def js_to_py_re_find(reg_exp):
+    """Return Python regular expression matching function based on Javascript
+    style regexp.
+    """
+    return js_to_py_re(reg_exp).find
 
 
 def js_to_py_re_replace(reg_exp):
     """Return Python regular expression substitution function based on
     Javascript style regexp.
     """
-    pattern, options = reg_exp[1:].rsplit('/', 1)
-    count = 0 if 'g' in options else 1
-    ignore_case = 'i' in options
+    return js_to_py_re(reg_exp).replace
+
+
+def deburr_table():
+    """Return translation table which maps Latin-1 Supplement and Latin
+    Extended-A letters to their ASCII equivalents.
+    """
+    # Values must be unicode so that unicode.translate() accepts them on
+    # Python 2 where the letters in DEBURRED_LETTERS are byte strings.
+    table = dict((ord(letter), text_type(deburred))
+                 for letter, deburred in iteritems(DEBURRED_LETTERS))
+
+    for codepoint in _range(0x100, 0x180):
+        deburred = DEBURRED_EXTENDED_LETTERS.get(codepoint)
+
+        if deburred is None:
+            deburred = (unicodedata.normalize('NFKD', unichr(codepoint))
+                        .encode('ascii', 'ignore')
+                        .decode('ascii'))
+
+        if deburred:
+            table[codepoint] = text_type(deburred)
+
+    return table
 
-    def _replace(text, repl):  # pylint: disable=missing-docstring
-        return re_replace(text,
-                          pattern,
-                          repl,
-                          ignore_case=ignore_case,
-                          count=count)
 
-    return _replace
+#: Translation table used by :func:`deburr`.
+DEBURR_TABLE = deburr_table()
 
 
 def delimitedpathjoin(delimiter, *paths):
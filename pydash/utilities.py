@@ -8,10 +8,12 @@ from __future__ import absolute_import, division
 
 from datetime import datetime
 from random import uniform, randint
+from threading import Event, Lock
 
 import pydash as pyd
-from .helpers import get_item
-from ._compat import _range, string_types
+from .helpers import LRUCache, NoValue, base_get, freeze, get_item
+from ._compat import (_range, asyncio, ensure_future, iteritems,
+                      string_types)
 
 
 __all__ = (
@@ -113,7 +115,11 @@ def deep_property(path):
         - :func:`deep_prop` (alias)
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Parse `path` once using :func:`pydash.objects.compile_path`.
     """
+    path = pyd.compile_path(path)
     return lambda obj: pyd.get(obj, path)
 
 
@@ -270,20 +276,50 @@ def matches_property(key, value):
 
     .. versionadded:: 3.1.0
     """
-    return lambda obj: matches(value)(prop(key)(obj))
+    getter = prop(key)
+    matcher = matches(value)
+    return lambda obj: matcher(getter(obj))
 
 
-def memoize(func, resolver=None):
+def memoize(func, resolver=None, maxsize=None, ttl=None, weight=None):
     """Creates a function that memoizes the result of `func`. If `resolver` is
     provided it will be used to determine the cache key for storing the result
     based on the arguments provided to the memoized function. By default, all
     arguments provided to the memoized function are used as the cache key.
-    The result cache is exposed as the cache property on the memoized function.
+    The result cache is exposed as the cache property on the memoized function
+    and can be iterated like a dict with ``keys()``, ``values()``, and
+    ``items()``.
+
+    The default cache key is the tuple of positional arguments followed by
+    the sorted keyword arguments and the types of all argument values so that
+    equal values of different types like ``1``, ``1.0``, and ``True`` are
+    cached separately. Unhashable arguments like lists and dicts are
+    frozen into hashable equivalents, and calls whose arguments can't be
+    frozen aren't cached. The cache is safe to share between threads and its
+    statistics are returned by ``cache_info()`` on the memoized function while
+    ``cache_clear()`` empties it.
+
+    Concurrent calls with the same cache key are deduplicated: the first
+    caller computes the result while the others wait for it instead of
+    calling `func` again. If `func` is an ``async def`` coroutine function,
+    the memoized function returns an awaitable and concurrent callers share
+    the same pending :mod:`asyncio` task. If `func` raises an exception, every
+    waiting caller gets the exception but it isn't cached so the next call
+    tries again.
 
     Args:
         func (function): Function to memoize.
         resolver (function, optional): Function that returns the cache key to
             use.
+        maxsize (int, optional): Maximum number of cached results (or their
+            total weight if `weight` is given). The least recently used result
+            is evicted when the cache is full. Defaults to ``None`` which
+            doesn't limit the cache.
+        ttl (int|float, optional): Number of seconds before a cached result
+            expires. Defaults to ``None`` which never expires results.
+        weight (function, optional): Function that returns the weight of a
+            result counted against `maxsize`. Defaults to ``None`` which
+            weighs every result as ``1``.
 
     Returns:
         function: Memoized function.
@@ -293,26 +329,125 @@ def memoize(func, resolver=None):
         >>> ident = memoize(identity)
         >>> ident(1)
         1
-        >>> ident.cache['(1,){}'] == 1
-        True
         >>> ident(1, 2, 3)
         1
-        >>> ident.cache['(1, 2, 3){}'] == 1
+        >>> ident(1)
+        1
+        >>> ident(True)
         True
+        >>> ident.cache_info()
+        CacheInfo(hits=1, misses=3, evictions=0, maxsize=None, currsize=3)
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Use tuple cache keys instead of string formatted arguments and add
+        `maxsize`, `ttl`, and `weight` arguments and ``cache_info()`` and
+        ``cache_clear()`` functions.
+
+    .. versionchanged:: 3.4.0
+        Deduplicate concurrent calls with the same cache key and support
+        coroutine functions.
     """
-    def memoized(*args, **kargs):  # pylint: disable=missing-docstring
+    cache = LRUCache(maxsize=maxsize, ttl=ttl, weight=weight)
+    lock = Lock()
+    pending = {}
+
+    def cache_key(args, kargs):
+        """Return hashable cache key of `args` and `kargs` or ``NoValue`` if
+        there isn't one.
+        """
         if resolver:
             key = resolver(*args, **kargs)
         else:
-            key = '{0}{1}'.format(args, kargs)
+            key = memoize_key(args, kargs)
+
+        try:
+            hash(key)
+        except TypeError:
+            try:
+                key = freeze(key)
+            except TypeError:
+                key = NoValue
+
+        return key
+
+    def memoized(*args, **kargs):  # pylint: disable=missing-docstring
+        key = cache_key(args, kargs)
+
+        if key is NoValue:
+            return func(*args, **kargs)
+
+        with lock:
+            result = cache.get(key, NoValue)
+
+            if result is not NoValue:
+                return result
+
+            call = pending.get(key)
+
+            if call is not None:
+                is_leader = False
+            else:
+                is_leader = True
+                call = pending[key] = PendingCall()
+
+        if not is_leader:
+            return call.wait()
+
+        try:
+            result = func(*args, **kargs)
+        except BaseException as exc:
+            with lock:
+                del pending[key]
+            call.fail(exc)
+            raise
+
+        with lock:
+            cache[key] = result
+            del pending[key]
+        call.finish(result)
+
+        return result
+
+    def memoized_async(*args, **kargs):  # pylint: disable=missing-docstring
+        key = cache_key(args, kargs)
+
+        if key is NoValue:
+            return func(*args, **kargs)
+
+        with lock:
+            result = cache.get(key, NoValue)
 
-        if key not in memoized.cache:
-            memoized.cache[key] = func(*args, **kargs)
+            if result is not NoValue:
+                future = asyncio.Future()
+                future.set_result(result)
+                return future
 
-        return memoized.cache[key]
-    memoized.cache = {}
+            task = pending.get(key)
+
+            if task is None:
+                task = pending[key] = ensure_future(func(*args, **kargs))
+                task.add_done_callback(lambda task: finish_async(key, task))
+
+        # Shield the shared task so that cancelling one caller doesn't cancel
+        # it for every other caller.
+        return asyncio.shield(task)
+
+    def finish_async(key, task):
+        """Cache the result of the completed `task` for `key`."""
+        with lock:
+            del pending[key]
+
+            if not task.cancelled() and task.exception() is None:
+                cache[key] = task.result()
+
+    if asyncio is not None and asyncio.iscoroutinefunction(func):
+        memoized = memoized_async
+
+    memoized.cache = cache
+    memoized.cache_info = cache.info
+    memoized.cache_clear = cache.clear
 
     return memoized
 
@@ -438,8 +573,11 @@ def property_(key):
         - :func:`prop` (alias)
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: 3.4.0
+        Support attribute access for objects that don't support item access.
     """
-    return lambda obj: get_item(obj, key, default=None)
+    return lambda obj: base_get(obj, key, default=None)
 
 
 prop = property_
@@ -647,3 +785,58 @@ def unique_id(prefix=None):
 
     return '{0}{1}'.format(pyd.to_string('' if prefix is None else prefix),
                            pyd.to_string(ID_COUNTER))
+
+
+#
+# Utility methods not a part of the main API
+#
+
+#: Marker that separates positional from keyword arguments in the cache keys
+#: of :func:`memoize`.
+MEMOIZE_KWARGS_MARK = object()
+
+
+class PendingCall(object):
+    """Pending call of a function memoized by :func:`memoize` which concurrent
+    callers with the same cache key wait on.
+    """
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+    def finish(self, result):
+        """Set `result` of the call and wake up the waiting callers."""
+        self.result = result
+        self.done.set()
+
+    def fail(self, error):
+        """Set `error` raised by the call and wake up the waiting callers."""
+        self.error = error
+        self.done.set()
+
+    def wait(self):
+        """Wait for the call to finish and return its result or raise its
+        error.
+        """
+        self.done.wait()
+
+        if self.error is not None:
+            raise self.error
+
+        return self.result
+
+
+def memoize_key(args, kargs):
+    """Return the :func:`memoize` cache key of `args` and `kargs`. Like
+    ``functools.lru_cache(typed=True)``, the key includes the type of each
+    value since values of different types can be equal.
+    """
+    key = values = args
+
+    if kargs:
+        items = tuple(sorted(iteritems(kargs)))
+        key += (MEMOIZE_KWARGS_MARK,) + items
+        values += tuple(value for _, value in items)
+
+    return key + tuple(type(value) for value in values)
@@ -92,7 +92,8 @@ def test_drop_right_while(case, expected):
 @parametrize('case,expected', [
     (([1, 2, 3, 2, 1, 5, 6, 5, 5, 5],), [2, 1, 5]),
     ((['A', 'b', 'C', 'a', 'B', 'c'], lambda letter: letter.lower()),
-     ['a', 'B', 'c'])
+     ['a', 'B', 'c']),
+    (([[1], {'a': 1}, [1], {'a': 1}, (1,), [1]],), [[1], {'a': 1}])
 ])
 def test_duplicates(case, expected):
     assert _.duplicates(*case) == expected
@@ -399,6 +400,75 @@ def test_sort_comparison_key_exception():
     assert raised
 
 
+@parametrize('case,callback,expected', [
+    ([3, 1, 2, 1], None, [1, 1, 2, 3]),
+    ([3, 1, 2, 1], lambda x: -x, [3, 2, 1, 1]),
+    ([{'x': 2, 'y': 1}, {'x': 1}, {'x': 2, 'y': 2}],
+     'x',
+     [{'x': 1}, {'x': 2, 'y': 1}, {'x': 2, 'y': 2}]),
+    ([], None, []),
+])
+def test_sorted_list(case, callback, expected):
+    array = _.SortedList(case, callback)
+    assert list(array) == expected
+    assert len(array) == len(expected)
+    assert list(reversed(array)) == list(reversed(expected))
+    assert array[:] == expected
+
+
+@parametrize('load', [1, 2, 1000])
+def test_sorted_list_operations(load):
+    array = _.SortedList()
+    array.load = load
+    expected = []
+
+    for value in [5, 3, 8, 3, 1, 9, 7, 3, 2, 6]:
+        array.add(value)
+        expected = sorted(expected + [value])
+        assert list(array) == expected
+
+    assert [array[i] for i in range(len(array))] == expected
+    assert array[-1] == 9
+    assert array[2:5] == expected[2:5]
+    assert array[::2] == expected[::2]
+    assert array.bisect_left(3) == 2
+    assert array.bisect_right(3) == 5
+    assert array.count(3) == 3
+    assert array.index(5) == 5
+    assert 7 in array
+    assert 4 not in array
+    assert list(array.irange(3, 7)) == [3, 3, 3, 5, 6, 7]
+    assert list(array.irange(3, 7, (False, False))) == [5, 6]
+    assert list(array.irange(maximum=2)) == [1, 2]
+
+    array.remove(3)
+    array.discard(4)
+    assert array.pop() == 9
+    assert array.pop(0) == 1
+    del array[0]
+    assert list(array) == [3, 3, 5, 6, 7, 8]
+
+    array.update([4, 10])
+    assert list(array) == [3, 3, 4, 5, 6, 7, 8, 10]
+
+    array.clear()
+    assert list(array) == []
+
+
+def test_sorted_list_missing_value():
+    array = _.SortedList([1, 2, 3])
+
+    for method in (array.remove, array.index):
+        raised = False
+
+        try:
+            method(4)
+        except ValueError:
+            raised = True
+
+        assert raised
+
+
 @parametrize('case,expected', [
     (([4, 4, 5, 5, 6, 6], 5), 2),
     (([20, 30, 40, 40, 50], 40), 2),
@@ -408,7 +478,11 @@ def test_sort_comparison_key_exception():
     ((['twenty', 'thirty', 'fifty'],
       'fourty',
       lambda x: {'twenty': 20, 'thirty': 30, 'fourty': 40, 'fifty': 50}[x]),
-     2)
+     2),
+    ((_.SortedList([6, 5, 4, 6, 5, 4]), 5), 2),
+    ((_.SortedList([{'x': 50}, {'x': 20}, {'x': 30}], 'x'), {'x': 40}), 2),
+    ((_.SortedList([{'x': 50}, {'x': 20}, {'x': 30}], 'x'), {'x': 40}, 'x'),
+     2),
 ])
 def test_sorted_index(case, expected):
     assert _.sorted_index(*case) == expected
@@ -422,7 +496,9 @@ def test_sorted_index(case, expected):
     ((['twenty', 'thirty', 'fifty'],
       'fourty',
       lambda x: {'twenty': 20, 'thirty': 30, 'fourty': 40, 'fifty': 50}[x]),
-     2)
+     2),
+    ((_.SortedList([6, 5, 4, 6, 5, 4]), 5), 4),
+    ((_.SortedList([{'x': 50}, {'x': 20}, {'x': 30}], 'x'), {'x': 30}), 2),
 ])
 def test_sorted_last_index(case, expected):
     assert _.sorted_last_index(*case) == expected
@@ -496,6 +572,13 @@ def test_take_right_while(case, expected):
 @parametrize('case,filter_by,expected', [
     ([1, 2, 1, 3, 1], None, [1, 2, 3]),
     ([dict(a=1), dict(a=2), dict(a=1)], None, [dict(a=1), dict(a=2)]),
+    ([[1, 2], (1, 2), [1, 2], set([1, 2]), frozenset([1, 2]), {'a': [1]},
+      {'a': [1]}],
+     None,
+     [[1, 2], (1, 2), set([1, 2]), {'a': [1]}]),
+    ([[bytearray(b'a')], [bytearray(b'a')], bytearray(b'b'), bytearray(b'b')],
+     None,
+     [[bytearray(b'a')], bytearray(b'b')]),
     ([1, 2, 1.5, 3, 2.5], lambda num: math.floor(num), [1, 2, 3]),
     ([{'name': 'banana', 'type': 'fruit'},
       {'name': 'apple', 'type': 'fruit'},
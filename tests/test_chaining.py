@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from copy import deepcopy
+import pickle
 
 import pydash as _
 
@@ -174,3 +175,232 @@ def test_tap(value, interceptor, expected):
 ])
 def test_thru(value, func, expected):
     assert _.chain(value).initial().thru(func).last().value()
+
+
+@parametrize('value,callback,reverse,n,expected', [
+    ([3, 1, 2, 5, 4], None, False, 2, [1, 2]),
+    ([3, 1, 2, 5, 4], None, True, 2, [5, 4]),
+    ([{'a': 2, 'b': 1}, {'a': 1}, {'a': 2, 'b': 2}], 'a', False, 2,
+     [{'a': 1}, {'a': 2, 'b': 1}]),
+    ([{'a': 2, 'b': 1}, {'a': 1}, {'a': 2, 'b': 2}], 'a', True, 2,
+     [{'a': 2, 'b': 1}, {'a': 2, 'b': 2}]),
+    ({'x': 3, 'y': 1, 'z': 2}, None, False, 5, [1, 2, 3]),
+    ([3, 1, 2], None, False, 0, []),
+])
+def test_chaining_sort_by_take(value, callback, reverse, n, expected):
+    chain = _.chain(value).sort_by(callback, reverse=reverse).take(n)
+    assert chain.value() == expected
+    assert chain.value() == _.take(_.sort_by(value, callback, reverse), n)
+
+    wrapper = chain._value._generate()
+    wrapper.fuse()
+    expected_method = _.nlargest_by if reverse else _.nsmallest_by
+    assert wrapper.method is expected_method
+
+
+@parametrize('n,expected', [
+    (1.5, [1, 2]),
+    (-1, []),
+])
+def test_chaining_sort_by_take_not_index(n, expected):
+    chain = _.chain([3, 1, 2]).sort_by().take(n)
+
+    assert chain.value() == expected
+    assert chain.value(lazy=True) == expected
+
+    wrapper = chain._value._generate()
+    wrapper.fuse()
+    assert wrapper.method is _.take
+
+
+@parametrize('method,n,expected', [
+    ('take', 1.5, [1, 2]),
+    ('drop', 1.5, [3]),
+])
+def test_chaining_lazy_not_int(method, n, expected):
+    chain = getattr(_.chain([1, 2, 3]).map_(_.identity), method)(n)
+
+    assert chain.value(lazy=True) == expected == chain.value()
+
+
+def test_chaining_sort_by_take_late_value():
+    chain = _.chain().sort_by().take(2)
+    assert chain([3, 1, 2]) == [1, 2]
+    assert chain(iter([6, 4, 5])) == [4, 5]
+
+
+@parametrize('value,methods', [
+    ([1, 2, 3, 4, 5, 6], [('map_', (lambda x: x * 2,)),
+                          ('filter_', (lambda x: x % 4,)),
+                          ('take', (2,))]),
+    ([1, 0, 2, None, 3], [('compact', ()), ('reject', (lambda x: x == 2,))]),
+    ([[1, [2]], [3], 4], [('flatten', ()), ('uniq', ())]),
+    ([[1, [2]], [3], 4], [('flatten', (True,)), ('drop', (1,))]),
+    ([3, 1, 2, 1, 3], [('uniq', ()), ('take_while', (lambda x: x > 1,))]),
+    ([3, 1, 2, 1, 3], [('drop_while', (lambda x: x > 1,)), ('drop', (-1,))]),
+    ([1, 2, 3], [('mapcat', (lambda x: [x] * x,)), ('take', (4,))]),
+    ([{'a': 1}, {'a': 2}, {'b': 3}], [('map_', ('a',)),
+                                      ('compact', ()),
+                                      ('sum_', ())]),
+    ([{'a': 2}, {'a': 1}, {'a': 3}], [('filter_', ({'a': 1},)),
+                                      ('sort_by', ('a',)),
+                                      ('take', (1,))]),
+    ([5, 3, 4, 1], [('map_', (lambda x: x + 1,)),
+                    ('sort_by', ()),
+                    ('take', (2,)),
+                    ('map_', (lambda x, i: x * i,))]),
+    ({'a': 1, 'b': 2}, [('map_', (lambda x: x * 3,)), ('take', (1,))]),
+    ('abcd', [('take', (2,)), ('drop', (1,))]),
+    ((1, 2, 3), [('take', (2,)), ('map_', (lambda x: x * 2,))]),
+    ([1, 2, 3], [('take', (0,))]),
+])
+def test_chaining_lazy_value(value, methods):
+    expected = deepcopy(value)
+    chain = _.chain(deepcopy(value))
+
+    for method, args in methods:
+        expected = getattr(_, method)(expected, *args)
+        chain = getattr(chain, method)(*args)
+
+    assert chain.value(lazy=True) == expected
+    assert chain.value() == expected
+
+
+def test_chaining_lazy_short_circuit():
+    calls = []
+
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    def naturals():
+        n = 0
+        while True:
+            yield n
+            n += 1
+
+    chain = _.chain().map(double).filter(lambda x: x % 3 == 0).take(3)
+
+    assert chain(naturals(), lazy=True) == [0, 6, 12]
+    assert calls == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_chaining_lazy_late_value():
+    chain = _.chain([1, 2, 3]).map(lambda x: x * 2).take(2)
+
+    assert chain([4, 5, 6], lazy=True) == [8, 10]
+    assert chain.value(lazy=True) == [2, 4]
+    assert chain.plant(iter([7])).value(lazy=True) == [14]
+
+
+def test_chaining_compile():
+    chain = _.chain([3, 1, 2]).map_(lambda x: x * 2).sort_by().take(2)
+    compiled = chain.compile()
+
+    assert compiled() == [2, 4]
+    assert compiled([6, 5, 4]) == [8, 10]
+    assert compiled(iter([7, 9, 8])) == [14, 16]
+    assert chain.value() == [2, 4]
+    assert ([method for method, _, _ in compiled.steps] ==
+            [_.map_, _.nsmallest_by])
+
+
+def test_chaining_compile_lazy():
+    compiled = _.chain().map_(lambda x: x + 1).take(2).compile(lazy=True)
+
+    assert compiled(iter(range(10 ** 9))) == [1, 2]
+    assert compiled([5]) == [6]
+
+
+def test_chaining_compile_no_methods():
+    assert _.chain([1, 2]).compile()() == [1, 2]
+    assert _.chain().compile()(5) == 5
+
+
+def test_chaining_compile_pickle():
+    compiled = (_.chain()
+                .filter_({'active': True})
+                .map_('name')
+                .map_(_.capitalize)
+                .compile())
+    restored = pickle.loads(pickle.dumps(compiled))
+    value = [{'name': 'fred', 'active': True},
+             {'name': 'barney', 'active': False},
+             {'name': 'wilma', 'active': True}]
+
+    assert restored(value) == compiled(value) == ['Fred', 'Wilma']
+
+
+def test_chaining_profile():
+    events = []
+    chain = _.chain([3, 1, 2]).map_(lambda x: x * 2).sort_by().take(2)
+    profile = chain.profile(hook=events.append)
+    report = profile.report()
+
+    assert profile.value == [2, 4]
+    assert [record['method'] for record in report] == ['map_',
+                                                       'nsmallest_by']
+    assert [record['index'] for record in report] == [0, 1]
+    assert [record['calls'] for record in report] == [1, 1]
+    assert [record['input_size'] for record in report] == [3, 3]
+    assert [record['output_size'] for record in report] == [3, 2]
+    assert all(record['time'] >= 0 for record in report)
+    assert all(record['memory_peak'] is None for record in report)
+    assert [event['method'] for event in events] == ['map_', 'nsmallest_by']
+    assert 'calls' not in events[0]
+
+
+def test_chaining_profile_unsized():
+    report = _.chain(iter([1, 2])).map_(lambda x: x).profile().report()
+
+    assert report[0]['input_size'] is None
+    assert report[0]['output_size'] == 2
+
+
+def test_chaining_profile_trace_memory():
+    if not hasattr(_._compat.tracemalloc, 'reset_peak'):  # pragma: no cover
+        return
+
+    profile = (_.chain(range(1000))
+               .map_(lambda x: [x] * 10)
+               .profile(trace_memory=True))
+
+    assert profile.report()[0]['memory_peak'] > 0
+    assert not _._compat.tracemalloc.is_tracing()
+
+
+def test_chaining_profile_trace_memory_already_tracing():
+    tracemalloc = _._compat.tracemalloc
+
+    if not hasattr(tracemalloc, 'reset_peak'):  # pragma: no cover
+        return
+
+    tracemalloc.start()
+
+    try:
+        data = [[x] * 10 for x in range(1000)]
+        del data
+        peak = tracemalloc.get_traced_memory()[1]
+
+        profile = (_.chain([1, 2])
+                   .map_(lambda x: x)
+                   .profile(trace_memory=True))
+
+        assert profile.report()[0]['memory_peak'] is None
+        assert tracemalloc.is_tracing()
+        assert tracemalloc.get_traced_memory()[1] >= peak
+    finally:
+        tracemalloc.stop()
+
+
+def test_chaining_compile_profile():
+    compiled = _.chain().map_(lambda x: x + 1).compact().compile(profile=True)
+
+    assert compiled([0, -1, 1]) == [1, 2]
+    assert compiled([5]) == [6]
+
+    report = compiled.profile.report()
+
+    assert compiled.profile.value is _.helpers.NoValue
+    assert [record['calls'] for record in report] == [2, 2]
+    assert [record['output_size'] for record in report] == [1, 1]
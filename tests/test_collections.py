@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import math
+import multiprocessing.pool
 
 import pydash as _
 
@@ -239,6 +240,52 @@ def test_min_(case, expected):
     assert _.min_(*case) == expected
 
 
+@parametrize('case,expected', [
+    (([4, 1, 3, 2], 2), [4, 3]),
+    (([4, 1, 3, 2], 10), [4, 3, 2, 1]),
+    (([4, 1, 3, 2], 0), []),
+    ((iter([{'a': 1}, {'a': 3}, {'a': 2}]), 2, 'a'), [{'a': 3}, {'a': 2}]),
+    (([{'a': 1, 'b': 1}, {'a': 2}, {'a': 1, 'b': 2}], 2, 'a'),
+     [{'a': 2}, {'a': 1, 'b': 1}]),
+    (([{'a': 1, 'b': 1}, {'a': 2}, {'a': 1, 'b': 2}], 1, {'a': 1}),
+     [{'a': 1, 'b': 1}]),
+    (({'x': 1, 'y': 3, 'z': 2}, 2), [3, 2]),
+    ((range(1000), 3, lambda x: -x), [0, 1, 2]),
+])
+def test_nlargest_by(case, expected):
+    assert _.nlargest_by(*case) == expected
+
+
+@parametrize('case', [
+    _.top_k
+])
+def test_nlargest_by_aliases(case):
+    assert _.nlargest_by is case
+
+
+@parametrize('case,expected', [
+    (([4, 1, 3, 2], 2), [1, 2]),
+    (([4, 1, 3, 2], 10), [1, 2, 3, 4]),
+    (([4, 1, 3, 2], 0), []),
+    ((iter([{'a': 1}, {'a': 3}, {'a': 2}]), 2, 'a'), [{'a': 1}, {'a': 2}]),
+    (([{'a': 1, 'b': 1}, {'a': 2}, {'a': 1, 'b': 2}], 2, 'a'),
+     [{'a': 1, 'b': 1}, {'a': 1, 'b': 2}]),
+    (([{'a': 1, 'b': 1}, {'a': 2}, {'a': 1, 'b': 2}], 1, {'a': 1}),
+     [{'a': 2}]),
+    (({'x': 1, 'y': 3, 'z': 2}, 2), [1, 2]),
+    ((range(1000), 3, lambda x: -x), [999, 998, 997]),
+])
+def test_nsmallest_by(case, expected):
+    assert _.nsmallest_by(*case) == expected
+
+
+@parametrize('case', [
+    _.bottom_k
+])
+def test_nsmallest_by_aliases(case):
+    assert _.nsmallest_by is case
+
+
 @parametrize('case,expected', [
     (([1, 2, 3], lambda item: item % 2), [[1, 3], [2]]),
     (([1.2, 2.3, 3.4], lambda item: math.floor(item) % 2),
@@ -602,6 +649,68 @@ def test_sort_by_all(case, expected):
     assert _.sort_by_all(*case) == expected
 
 
+@parametrize('case,expected', [
+    (([{'a': 1, 'b': 1, 'c': 'x'},
+       {'a': 1, 'b': 2, 'c': 'y'},
+       {'a': 2, 'b': 2, 'c': 'x'},
+       {'a': 1, 'b': 2, 'c': 'x'}],
+      ['a', '-b', 'c']),
+     [{'a': 1, 'b': 2, 'c': 'x'},
+      {'a': 1, 'b': 2, 'c': 'y'},
+      {'a': 1, 'b': 1, 'c': 'x'},
+      {'a': 2, 'b': 2, 'c': 'x'}]),
+    (([{'a': 1, 'b': 1, 'c': 'x'},
+       {'a': 1, 'b': 2, 'c': 'y'},
+       {'a': 2, 'b': 2, 'c': 'x'},
+       {'a': 1, 'b': 2, 'c': 'x'}],
+      ['a', 'b', 'c'],
+      [False, True, False]),
+     [{'a': 2, 'b': 2, 'c': 'x'},
+      {'a': 1, 'b': 1, 'c': 'x'},
+      {'a': 1, 'b': 2, 'c': 'y'},
+      {'a': 1, 'b': 2, 'c': 'x'}]),
+    (([{'a': 1, 'id': 1}, {'a': 0, 'id': 2}, {'a': 1, 'id': 3}], ['a']),
+     [{'a': 0, 'id': 2}, {'a': 1, 'id': 1}, {'a': 1, 'id': 3}]),
+    (([{'a': 1, 'id': 1}, {'a': 0, 'id': 2}, {'a': 1, 'id': 3}], ['a'], True),
+     [{'a': 1, 'id': 1}, {'a': 1, 'id': 3}, {'a': 0, 'id': 2}]),
+    (([{'a': {'b': 2}}, {'a': {'b': 1}}], ['a.b']),
+     [{'a': {'b': 1}}, {'a': {'b': 2}}]),
+    (([3, 1, 2], []), [3, 1, 2]),
+])
+def test_sort_by_all_stable(case, expected):
+    assert _.sort_by_all(*case) == expected
+
+
+@parametrize('case,expected', [
+    (([{'a': None}, {'a': 2}, {'a': 1}], ['a'], None, False, 'first'),
+     [{'a': None}, {'a': 1}, {'a': 2}]),
+    (([{'a': None}, {'a': 2}, {'a': 1}], ['a'], None, False, 'last'),
+     [{'a': 1}, {'a': 2}, {'a': None}]),
+    (([{'a': None}, {'a': 2}, {'a': 1}], ['-a'], None, False, 'first'),
+     [{'a': None}, {'a': 2}, {'a': 1}]),
+    (([{'a': None}, {'a': 2}, {'a': 1}], ['-a'], None, False, 'last'),
+     [{'a': 2}, {'a': 1}, {'a': None}]),
+    (([{'a': None}, {'a': 2}, {'a': 1}], ['a'], None, True, 'last'),
+     [{'a': 2}, {'a': 1}, {'a': None}]),
+    (([{'a': 1, 'b': None}, {'a': 1, 'b': 'x'}, {'b': 'y'}],
+      ['a', '-b'], None, False, 'last'),
+     [{'a': 1, 'b': 'x'}, {'a': 1, 'b': None}, {'b': 'y'}]),
+])
+def test_sort_by_all_none_position(case, expected):
+    assert _.sort_by_all(*case) == expected
+
+
+def test_sort_by_all_invalid_none_position():
+    raised = False
+
+    try:
+        _.sort_by_all([{'a': 1}], ['a'], none_position='middle')
+    except ValueError:
+        raised = True
+
+    assert raised
+
+
 @parametrize('case', [
     _.sort_by_order
 ])
@@ -624,3 +733,100 @@ def test_to_list(case, expected):
 ])
 def test_where(case, filter_by, expected):
     assert _.where(case, filter_by) == expected
+
+
+@parametrize('method,case', [
+    (_.map_, ([1.1, 2.1, 3.1] * 20, int)),
+    (_.map_, ({'one': 1, 'two': 2, 'three': 3}, str)),
+    (_.map_, ([{'name': 'moe'}, {'name': 'larry'}] * 20, 'name')),
+    (_.filter_, ([0, 1, 2, None, 3, False] * 20,)),
+    (_.filter_, ([{'a': 1}, {'b': 2}, {'a': 1, 'b': 3}] * 20, {'a': 1})),
+    (_.group_by, ([4.2, 6.1, 6.4, 5.0, 4.9] * 20, int)),
+    (_.group_by, ([{'a': 1}, {'a': 3}, {'a': 1, 'b': 2}] * 20, 'a')),
+    (_.count_by, ([4.2, 6.1, 6.4, 5.0, 4.9] * 20, int)),
+    (_.count_by, ({1: 0, 2: 0, 4: 3},)),
+    (_.partition, ([0, 1, 2, None, 3, False] * 20, bool)),
+    (_.partition, ([{'a': 1}, {'b': 2}, {'a': 1, 'b': 3}] * 20, 'b')),
+    (_.map_, ([],)),
+])
+def test_parallel(method, case):
+    expected = method(*case)
+
+    assert method(*case, parallel=2) == expected
+
+
+@parametrize('method,callback', [
+    (_.map_, lambda value, key, collection: len(collection)),
+    (_.filter_, lambda value, key, collection: value in collection),
+    (_.count_by, lambda value, key, collection: collection[key]),
+    (_.partition, lambda *args: len(args) > 2),
+])
+def test_parallel_collection_callback(method, callback):
+    raised = False
+
+    try:
+        method([1, 2, 3], callback, parallel=2)
+    except ValueError:
+        raised = True
+
+    assert raised
+
+
+@parametrize('method,case', [
+    (_.reduce_, (list(range(100)), fixtures.reduce_callback0)),
+    (_.reduce_, (list(range(100)), fixtures.reduce_callback0, 10)),
+    (_.reduce_, ([[1], [2, 3], [4]] * 10, fixtures.reduce_callback0, [])),
+    (_.reduce_, ([5], fixtures.reduce_callback0)),
+    (_.reduce_, ([], fixtures.reduce_callback0, 1)),
+    (_.reduce_, ([1, 2, 3], None)),
+    (_.reduce_right, ([[1], [2, 3], [4]] * 10, fixtures.reduce_callback0)),
+    (_.reductions, (list(range(100)), fixtures.reduce_callback0)),
+    (_.reductions, (list(range(100)), fixtures.reduce_callback0, 10)),
+    (_.reductions, ({'a': 1, 'b': 2, 'c': 3}, fixtures.reduce_callback0)),
+    (_.reductions, ([5], fixtures.reduce_callback0)),
+    (_.reductions, ([1, 2, 3], None)),
+    (_.reductions_right, (['a', 'b', 'c'] * 10, fixtures.reduce_callback0)),
+])
+def test_parallel_reduce(method, case):
+    expected = method(*case)
+
+    assert method(*case, parallel=2) == expected
+
+
+@parametrize('method', [
+    _.reduce_,
+    _.reductions
+])
+def test_parallel_reduce_empty(method):
+    raised = False
+
+    try:
+        method([], fixtures.reduce_callback0, parallel=2)
+    except TypeError:
+        raised = True
+
+    assert raised
+
+
+def test_parallel_pool():
+    pool = multiprocessing.pool.ThreadPool(2)
+
+    try:
+        assert (_.map_(range(100), lambda x, i: x * i, parallel=pool) ==
+                [x * x for x in range(100)])
+        assert (_.partition(range(10), lambda x: x % 3, parallel=pool) ==
+                [[1, 2, 4, 5, 7, 8], [0, 3, 6, 9]])
+        assert (_.reduce_([set([x % 7]) for x in range(100)],
+                          lambda x, y: x | y,
+                          parallel=pool) ==
+                set(range(7)))
+        assert (_.reductions(range(10), lambda x, y: x + y, parallel=pool) ==
+                [1, 3, 6, 10, 15, 21, 28, 36, 45])
+    finally:
+        pool.close()
+        pool.join()
+
+
+def test_parallel_chain():
+    assert (_.chain([1.5, 2.5]).map_(int, parallel=2).value(lazy=True) ==
+            [1, 2])
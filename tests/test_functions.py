@@ -1,4 +1,6 @@
 
+import sys
+import threading
 import time
 
 import pydash as _
@@ -149,16 +151,345 @@ def test_debounce_max_wait():
     assert result > expected
 
 
+def test_debounce_trailing():
+    calls = []
+    debounced = _.debounce(lambda x: calls.append(x) or x, 50)
+
+    assert debounced(1) == 1
+    assert debounced(2) == 1
+    assert debounced(3) == 1
+    assert debounced.pending()
+
+    time.sleep(0.15)
+
+    assert calls == [1, 3]
+    assert not debounced.pending()
+    assert debounced(4) == 4
+
+
+def test_debounce_leading_false():
+    calls = []
+    debounced = _.debounce(calls.append, 50, leading=False)
+
+    debounced(1)
+    debounced(2)
+
+    assert calls == []
+
+    time.sleep(0.15)
+
+    assert calls == [2]
+
+
+def test_debounce_trailing_false():
+    calls = []
+    debounced = _.debounce(calls.append, 50, trailing=False)
+
+    debounced(1)
+    debounced(2)
+    time.sleep(0.15)
+
+    assert calls == [1]
+
+
+def test_debounce_max_wait_trailing():
+    calls = []
+    debounced = _.debounce(calls.append, 100, max_wait=150, leading=False)
+    start = time.time()
+
+    while time.time() - start < 0.25:
+        debounced(1)
+        time.sleep(0.01)
+
+    assert calls == [1]
+
+
+def test_debounce_cancel():
+    calls = []
+    debounced = _.debounce(calls.append, 50)
+
+    debounced(1)
+    debounced(2)
+    debounced.cancel()
+
+    assert not debounced.pending()
+
+    time.sleep(0.1)
+
+    assert calls == [1]
+
+
+def test_debounce_flush():
+    calls = []
+    debounced = _.debounce(lambda x: calls.append(x) or x, 1000)
+
+    debounced(1)
+    debounced(2)
+
+    assert debounced.flush() == 2
+    assert calls == [1, 2]
+    assert not debounced.pending()
+    assert debounced.flush() == 2
+
+
+def test_debounce_trailing_exception():
+    errors = []
+    calls = []
+
+    def func(x):
+        calls.append(x)
+        if x == 2:
+            raise ValueError(x)
+        return x
+
+    excepthook = sys.excepthook
+    sys.excepthook = lambda *exc_info: errors.append(exc_info[1])
+
+    try:
+        debounced = _.debounce(func, 20)
+        debounced(1)
+        debounced(2)
+        time.sleep(0.1)
+    finally:
+        sys.excepthook = excepthook
+
+    assert calls == [1, 2]
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)
+    assert not debounced.pending()
+    assert debounced(3) == 3
+
+
+def test_debounce_slow_trailing_call():
+    finished = {}
+
+    def slow(x):
+        time.sleep(0.5)
+        finished['slow'] = _.now()
+
+    def fast(x):
+        finished['fast'] = _.now()
+
+    slow_debounced = _.debounce(slow, 10, leading=False)
+    fast_debounced = _.debounce(fast, 20, leading=False)
+
+    start = _.now()
+    slow_debounced(1)
+    fast_debounced(1)
+    time.sleep(0.2)
+
+    assert finished['fast'] - start < 150
+    assert 'slow' not in finished
+
+    time.sleep(0.5)
+
+    assert 'slow' in finished
+
+
+def test_scheduler_bounded_workers():
+    scheduler = _.helpers.Scheduler(max_workers=3)
+    running = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def func(x):
+        with lock:
+            running.append(x)
+            peak[0] = max(peak[0], len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(x)
+        return x
+
+    calls = [scheduler.call_later(0, func, x) for x in range(50)]
+
+    assert [call.result() for call in calls] == list(range(50))
+    assert peak[0] <= 3
+    assert len(scheduler.workers) <= 3
+
+    workers = [thread for thread in threading.enumerate()
+               if thread.name == 'pydash-scheduler-worker']
+
+    # Only this scheduler's and the shared scheduler's workers are running.
+    assert len(workers) <= 3 + _.helpers.SCHEDULER.max_workers
+
+
+def test_debounce_scheduler():
+    scheduled = []
+
+    class Scheduler(object):
+        def call_later(self, delay, callback, *args):
+            scheduled.append(delay)
+            return _.helpers.SCHEDULER.call_later(delay, callback, *args)
+
+    calls = []
+    debounced = _.debounce(calls.append, 20, scheduler=Scheduler())
+
+    debounced(1)
+    debounced(2)
+    time.sleep(0.1)
+
+    assert scheduled[0] == 0.02
+    assert calls == [1, 2]
+
+
+def test_debounce_asyncio():
+    asyncio = _._compat.asyncio
+
+    if asyncio is None:  # pragma: no cover
+        return
+
+    calls = []
+    loop = asyncio.new_event_loop()
+    debounced = _.debounce(calls.append, 20, scheduler=loop)
+
+    def burst():
+        debounced(1)
+        debounced(2)
+
+    loop.call_soon(burst)
+    loop.run_until_complete(asyncio.sleep(0.1))
+    loop.close()
+
+    assert calls == [1, 2]
+
+
 @parametrize('func,wait,args,kargs,expected', [
     (lambda a, b, c: (a, b, c), 250, (1, 2), {'c': 3}, (1, 2, 3))
 ])
 def test_delay(func, wait, args, kargs, expected):
     start = time.time() * 1000
-    result = _.delay(func, wait, *args, **kargs)
+    call = _.delay(func, wait, *args, **kargs)
+
+    assert (time.time() * 1000 - start) < wait
+    assert not call.done()
+
+    result = call.result()
     stop = time.time() * 1000
 
-    assert (wait - 5) <= (stop - start) <= (wait + 5)
+    assert (wait - 5) <= (stop - start) <= (wait + 50)
     assert result == expected
+    assert call.done()
+
+
+def test_delay_order():
+    calls = []
+    handles = [_.delay(calls.append, wait, wait) for wait in [30, 10, 20, 10]]
+
+    for handle in handles:
+        handle.result()
+
+    assert calls == [10, 10, 20, 30]
+
+
+def test_delay_cancel():
+    calls = []
+    call = _.delay(calls.append, 20, 1)
+
+    assert call.cancel()
+    assert call.cancelled()
+    assert call.done()
+
+    time.sleep(0.05)
+
+    assert calls == []
+
+    raised = False
+
+    try:
+        call.result()
+    except _.CancelledError:
+        raised = True
+
+    assert raised
+
+
+def test_delay_exception():
+    def func():
+        raise ValueError()
+
+    call = _.delay(func, 0)
+
+    assert call.wait(1)
+    assert isinstance(call.exception(), ValueError)
+    assert not call.cancel()
+
+    raised = False
+
+    try:
+        call.result()
+    except ValueError:
+        raised = True
+
+    assert raised
+
+
+def test_delay_base_exception():
+    class Stop(BaseException):
+        pass
+
+    def func():
+        raise Stop()
+
+    call = _.helpers.ScheduledCall(0, func, ())
+    raised = False
+
+    try:
+        call.run()
+    except Stop:
+        raised = True
+
+    assert raised
+    assert call.done()
+
+    raised = False
+
+    try:
+        call.result()
+    except Stop:
+        raised = True
+
+    assert raised
+
+
+def test_delay_many():
+    calls = [_.delay(_.identity, 20, i) for i in range(2000)]
+
+    assert [call.result() for call in calls] == list(range(2000))
+    assert (len(_.helpers.SCHEDULER.workers) <=
+            _.helpers.SCHEDULER.max_workers)
+
+
+def test_delay_asyncio():
+    asyncio = _._compat.asyncio
+
+    if asyncio is None or sys.version_info < (3, 5):  # pragma: no cover
+        return
+
+    namespace = {'asyncio': asyncio, '_': _}
+    # Defined with exec since async def isn't valid syntax before Python 3.5.
+    exec('async def double(x):\n'
+         '    await asyncio.sleep(0.01)\n'
+         '    return x * 2\n'
+         'async def main():\n'
+         '    cancelled = _.delay(double, 10, 1)\n'
+         '    cancelled.cancel()\n'
+         '    return await asyncio.gather(_.delay(lambda x: x + 1, 10, 1),\n'
+         '                                _.delay(double, 10, 2),\n'
+         '                                _.defer(double, 3))\n',
+         namespace)
+    loop = asyncio.new_event_loop()
+
+    try:
+        assert loop.run_until_complete(namespace['main']()) == [2, 4, 6]
+    finally:
+        loop.close()
+
+
+def test_defer():
+    thread = _.defer(threading.current_thread).result()
+
+    assert thread is not threading.current_thread()
 
 
 @parametrize('case,arg,expected', [
@@ -195,6 +526,41 @@ def test_flow_right(case, args, expected):
     assert _.flow_right(*case)(*args) == expected
 
 
+def test_flow_nested():
+    def double(x):
+        return x * 2
+
+    def inc(x):
+        return x + 1
+
+    ops = _.flow(_.flow(inc, double), _.flow_right(inc, double), inc)
+
+    assert ops.stages == (inc, double, double, inc, inc)
+    assert ops(1) == 10
+    assert _.flow_right(ops, _.flow(double, inc))(1) == 18
+    assert _.flow(_.flow(), str)(1) == 'None'
+    assert _.flow()(1) is None
+
+
+def test_flow_kargs():
+    ops = _.flow(lambda x, y=0: x - y, lambda x: x * 2)
+
+    assert ops(5, y=2) == 6
+
+
+def test_flow_hook():
+    stages = []
+    hooked = _.flow(lambda x: x + 1, lambda x: x * 2, hook=stages.append)
+    ops = _.flow_right(str, hooked)
+
+    assert ops(1) == '4'
+    assert ops.stages == (hooked, str)
+    assert [stage['index'] for stage in stages] == [0, 1]
+    assert [stage['result'] for stage in stages] == [2, 4]
+    assert all(stage['time'] >= 0 for stage in stages)
+    assert stages[1]['func'] is hooked.stages[1]
+
+
 @parametrize('case', [
     _.pipe
 ])
@@ -338,6 +704,40 @@ def test_throttle():
     assert throttled() > expected
 
 
+def test_throttle_trailing():
+    calls = []
+    throttled = _.throttle(calls.append, 100)
+    start = time.time()
+
+    args = []
+
+    while time.time() - start < 0.25:
+        args.append(len(args))
+        throttled(args[-1])
+        time.sleep(0.01)
+
+    time.sleep(0.15)
+
+    assert 3 <= len(calls) <= 4
+    assert calls[0] == args[0]
+    assert calls[-1] == args[-1]
+    assert not throttled.pending()
+
+
+def test_throttle_leading_false():
+    calls = []
+    throttled = _.throttle(calls.append, 50, leading=False)
+
+    throttled(1)
+    throttled(2)
+
+    assert calls == []
+
+    time.sleep(0.1)
+
+    assert calls == [2]
+
+
 @parametrize('case,args,expected', [
     ((lambda a: a.strip(), lambda func, text: '<p>{0}</p>'.format(func(text))),
      ('  hello world!  ',),
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import random
+
 import pydash as _
 from .fixtures import parametrize
 
@@ -27,6 +29,7 @@ def test_add_aliases(case):
     (([{'b': 4}, {'b': 5}, {'b': 6}], 'b'), 5),
     (([0, 0.5, 1],), 0.5),
     (({'one': {'a': 1}, 'two': {'a': 2}, 'three': {'a': 3}}, 'a'), 2),
+    ((iter([1, 2, 3, 4, 5]),), 3),
 ])
 def test_average(case, expected):
     assert _.average(*case) == expected
@@ -65,21 +68,52 @@ def test_floor(case, expected):
     (([0, 0, 1, 2, 5],), 1),
     (([0, 0, 1, 2],), 0.5),
     (([0, 0, 1, 2, 3, 4],), 1.5),
+    (([5, 3, 1, 4, 2],), 3),
+    (([{'a': 3}, {'a': 1}, {'a': 2}, {'a': 10}], 'a'), 2.5),
+    (({'x': 2, 'y': 4},), 3),
+    ((iter([3, 1, 2]),), 2),
+    ((list(range(30001, 0, -1)),), 15001),
+    ((list(range(30000)),), 14999.5),
 ])
 def test_median(case, expected):
     assert _.median(*case) == expected
 
 
+def test_median_empty():
+    raised = False
+
+    try:
+        _.median([])
+    except ValueError:
+        raised = True
+
+    assert raised
+
+
 @parametrize('case,expected', [
     (([1, 2, 3, 4, 5], 3), [2, 3, 4]),
     (([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 3), [2, 3, 4, 5, 6, 7, 8, 9]),
     (([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 4),
      [2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5]),
+    ((iter([1, 2, 3, 4, 5]), 2), [1.5, 2.5, 3.5, 4.5]),
+    (([{'a': 1}, {'a': 2}, {'a': 6}], 2, 'a'), [1.5, 4]),
+    (([1, 2, 3], 4), []),
+    (([0.1] * 10, 3), [(0.1 + 0.1 + 0.1) / 3] * 8),
 ])
 def test_moving_average(case, expected):
     assert _.moving_average(*case) == expected
 
 
+def test_moving_average_floats():
+    array = [0.4, 0.9, 0.3, 0.6, 0.8, 0.2, 0.1, 0.8]
+    expected = [_.average(array[i:i + 3]) for i in range(len(array) - 2)]
+
+    # The running window sum adds and subtracts values in a different order
+    # than summing each window so results may differ in the last bits.
+    assert _.map_(_.moving_average(array, 3), lambda v: round(v, 10)) == \
+        _.map_(expected, lambda v: round(v, 10))
+
+
 @parametrize('case', [
     _.moving_avg
 ])
@@ -87,6 +121,87 @@ def test_moving_average_aliases(case):
     assert _.moving_average is case
 
 
+@parametrize('case,expected', [
+    (([1, 5, 2, 8, 3, 1], 3, 'sum'), [8, 15, 13, 12]),
+    (([1, 5, 2, 8, 3, 1], 3, 'min'), [1, 2, 2, 1]),
+    (([1, 5, 2, 8, 3, 1], 3, 'max'), [5, 8, 8, 8]),
+    (([1, 5, 2, 8, 3, 1], 1, 'max'), [1, 5, 2, 8, 3, 1]),
+    (([2, 4, 4, 4, 6], 2, 'variance'), [1, 0, 0, 1]),
+    ((iter([{'a': 1}, {'a': 3}]), 2, 'average', 'a'), [2]),
+    (([1, 2, 3], 0, 'sum'), []),
+])
+def test_moving_iter(case, expected):
+    assert list(_.moving_iter(*case)) == expected
+
+
+def test_moving_iter_invalid_aggregate():
+    raised = False
+
+    try:
+        _.moving_iter([1, 2, 3], 2, 'invalid')
+    except ValueError:
+        raised = True
+
+    assert raised
+
+
+@parametrize('func,aggregate', [
+    (_.moving_sum, sum),
+    (_.moving_min, min),
+    (_.moving_max, max),
+    (_.moving_variance, _.variance),
+])
+def test_moving_aggregates(func, aggregate):
+    array = [3, -1, 4, 1, -5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9, 3, 2, 3]
+
+    for size in (1, 2, 3, 5, len(array)):
+        expected = [aggregate(array[i:i + size])
+                    for i in range(len(array) - size + 1)]
+        result = func(array, size)
+
+        assert _.map_(result, lambda v: round(v, 10)) == \
+            _.map_(expected, lambda v: round(v, 10))
+
+
+@parametrize('func', [
+    _.moving_sum,
+    _.moving_min,
+    _.moving_max,
+    _.moving_variance,
+])
+def test_moving_aggregates_callback(func):
+    array = [{'a': 3}, {'a': 1}, {'a': 4}, {'a': 1}, {'a': 5}]
+    assert func(array, 2, 'a') == func(_.pluck(array, 'a'), 2)
+
+
+@parametrize('case,expected', [
+    (([1, 2, 3, 4, 5], 50), 3),
+    (([1, 2, 3, 4], 25), 1.75),
+    (([4, 1, 3, 2], 0), 1),
+    (([4, 1, 3, 2], 100), 4),
+    (([{'ms': 30}, {'ms': 10}, {'ms': 20}], 50, 'ms'), 20),
+    ((list(range(100001)), 95), 95000),
+])
+def test_percentile(case, expected):
+    assert _.percentile(*case) == expected
+
+
+@parametrize('case', [
+    ([], 50),
+    ([1, 2], -1),
+    ([1, 2], 101),
+])
+def test_percentile_invalid(case):
+    raised = False
+
+    try:
+        _.percentile(*case)
+    except ValueError:
+        raised = True
+
+    assert raised
+
+
 @parametrize('case,expected', [
     ((2, 3), 8),
     ((3, 4), 81),
@@ -104,6 +219,84 @@ def test_power_aliases(case):
     assert _.power is case
 
 
+@parametrize('case,expected', [
+    (([1, 2, 3, 4, 5],), [1, 2, 3, 4, 5]),
+    ((iter([5, 1, 4, 2, 3]),), [1, 2, 3, 4, 5]),
+    (([{'a': 2}, {'a': 1}], 'a'), [1, 1.25, 1.5, 1.75, 2]),
+])
+def test_quantile_sketch_exact(case, expected):
+    sketch = _.quantile_sketch(*case)
+    assert sketch.quantiles([0, 0.25, 0.5, 0.75, 1]) == expected
+
+
+@parametrize('size,k', [
+    (20000, 50),
+    (20000, 200),
+])
+def test_quantile_sketch_approximate(size, k):
+    values = list(range(size))
+    random.shuffle(values)
+    sketch = _.quantile_sketch(iter(values), k=k)
+
+    assert sketch.count == size
+    assert sketch.min == 0
+    assert sketch.max == size - 1
+    assert sum(len(items) for items in sketch._compactors) < 4 * k
+
+    for quant in [0, 0.01, 0.25, 0.5, 0.75, 0.95, 0.99, 1]:
+        assert abs(sketch.quantile(quant) - quant * size) <= 0.05 * size
+
+
+def test_quantile_sketch_merge():
+    values = list(range(20000))
+    random.shuffle(values)
+    sketches = [_.quantile_sketch(values[i:i + 2000], k=100)
+                for i in range(0, len(values), 2000)]
+    merged = sketches[0]
+
+    for sketch in sketches[1:]:
+        merged = merged + sketch
+
+    assert merged.count == len(values)
+    assert merged.min == 0
+    assert merged.max == len(values) - 1
+    assert abs(merged.percentile(50) - 10000) <= 1000
+    assert abs(merged.percentile(99) - 19800) <= 1000
+
+
+def test_quantile_sketch_merge_exact():
+    sketch = _.quantile_sketch([1, 2]).merge(_.quantile_sketch([3, 4, 5]))
+    assert sketch.quantile(0.5) == 3
+    assert _.QuantileSketch().merge(sketch).percentile(100) == 5
+
+
+@parametrize('func,args', [
+    (_.QuantileSketch, (1,)),
+    (_.QuantileSketch().quantile, (0.5,)),
+    (_.quantile_sketch([1]).quantile, (2,)),
+    (_.quantile_sketch([1]).percentile, (-1,)),
+])
+def test_quantile_sketch_invalid(func, args):
+    raised = False
+
+    try:
+        func(*args)
+    except ValueError:
+        raised = True
+
+    assert raised
+
+
+@parametrize('case,expected', [
+    (([4, 1, 5, 2, 3], [0.5, 0.25, 1]), [3, 2, 5]),
+    (([1, 2, 3, 4], [0.5, 0]), [2.5, 1]),
+    (([{'a': 1}, {'a': 3}], [0.5], 'a'), [2]),
+    ((list(range(50001)), [0.99, 0.5, 0.95]), [49500, 25000, 47500]),
+])
+def test_quantiles(case, expected):
+    assert _.quantiles(*case) == expected
+
+
 @parametrize('case,expected', [
     ((2.51,), 3),
     ((2.499,), 2),
@@ -143,10 +336,68 @@ def test_slope(case, expected):
 
 
 @parametrize('case,expected', [
-    ([1, 2, 3], (2.0 / 3.0) ** 0.5),
+    (([1, 4, 8, 2],), {'count': 4,
+                       'sum': 15,
+                       'mean': 3.75,
+                       'variance': 7.1875,
+                       'std_deviation': 7.1875 ** 0.5,
+                       'min': 1,
+                       'max': 8}),
+    (([{'a': 3}, {'a': 1}], 'a'), {'count': 2,
+                                   'sum': 4,
+                                   'mean': 2,
+                                   'variance': 1,
+                                   'std_deviation': 1,
+                                   'min': 1,
+                                   'max': 3}),
+    ((iter([2, 2]),), {'count': 2,
+                       'sum': 4,
+                       'mean': 2,
+                       'variance': 0,
+                       'std_deviation': 0,
+                       'min': 2,
+                       'max': 2}),
+])
+def test_stats(case, expected):
+    assert _.stats(*case).to_dict() == expected
+
+
+@parametrize('left,right', [
+    ([1, 4], [8, 2]),
+    ([1, 4, 8], [2]),
+    ([], [1, 4, 8, 2]),
+    ([1, 4, 8, 2], []),
+])
+def test_stats_merge(left, right):
+    merged = _.stats(left).merge(_.stats(right))
+    expected = _.stats(left + right)
+
+    assert merged.to_dict() == expected.to_dict()
+    assert (_.stats(left) + _.stats(right)).to_dict() == expected.to_dict()
+
+
+def test_stats_merge_min_max():
+    merged = _.stats([0, 5]).merge(_.stats([-3, 0]))
+    assert merged.min == -3
+    assert merged.max == 5
+
+
+def test_stats_add():
+    summary = _.Stats()
+    summary.add(1)
+    summary.add(3)
+    assert summary.count == 2
+    assert summary.mean == 2
+    assert summary.variance == 1
+
+
+@parametrize('case,expected', [
+    (([1, 2, 3],), (2.0 / 3.0) ** 0.5),
+    ((iter([1, 2, 3]),), (2.0 / 3.0) ** 0.5),
+    (([{'a': 1}, {'a': 2}, {'a': 3}], 'a'), (2.0 / 3.0) ** 0.5),
 ])
 def test_std_deviation(case, expected):
-    assert _.std_deviation(case) == expected
+    assert _.std_deviation(*case) == expected
 
 
 @parametrize('case', [
@@ -158,16 +409,30 @@ def test_std_deviation_aliases(case):
 
 @parametrize('case,expected', [
     ([[1, 2, 3], [4, 5, 6], [7, 8, 9]], [[1, 4, 7], [2, 5, 8], [3, 6, 9]]),
+    ([(1, 2), (3, 4)], [[1, 3], [2, 4]]),
+    ([[1, 2, 3], [4], [7, 8]], [[1, 4, 7], [2, None, 8], [3, None, None]]),
+    ([[1, 2, 3], [4], [5, 6]], [[1, 4, 5], [2, None, 6], [3, None, None]]),
+    ([[1], [4, 5, 6]], [[1, 4], [None, 5], [None, 6]]),
+    ([[1, 2], []], [[1, None], [2, None]]),
+    ([{'a': 1, 'b': 2}, {'a': 3}], {'a': [1, 3], 'b': [2, None]}),
+    ([{'a': 1}, {'b': 2}], {'a': [1, None], 'b': [None, 2]}),
+    ([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}], {'a': [1, 3], 'b': [2, 4]}),
+    ({'x': [1, 2], 'y': [3]}, [{'x': 1, 'y': 3}, {'x': 2}]),
+    ({'x': {'a': 1}, 'y': {'a': 2, 'b': 3}},
+     {'a': {'x': 1, 'y': 2}, 'b': {'y': 3}}),
+    ([], []),
 ])
 def test_transpose(case, expected):
     assert _.transpose(case) == expected
 
 
 @parametrize('case,expected', [
-    ([1, 2, 3], 2.0 / 3.0),
+    (([1, 2, 3],), 2.0 / 3.0),
+    ((iter([1, 2, 3]),), 2.0 / 3.0),
+    (([{'a': 1}, {'a': 2}, {'a': 3}], 'a'), 2.0 / 3.0),
 ])
 def test_variance(case, expected):
-    assert _.variance(case) == expected
+    assert _.variance(*case) == expected
 
 
 @parametrize('case,expected', [
@@ -76,6 +76,30 @@ def test_clone_deep(case, kargs):
             assert value is not case[key]
 
 
+@parametrize('path,obj,expected', [
+    ('a.b.[0].c', {'a': {'b': [{'c': 1}]}}, 1),
+    ('a.b.[1].c', {'a': {'b': [{'c': 1}]}}, None),
+    ('a\\.b.c', {'a.b': {'c': 2}}, 2),
+    (['a', 'b'], {'a': {'b': 3}}, 3),
+    (0, [4], 4),
+])
+def test_compile_path(path, obj, expected):
+    compiled = _.compile_path(path)
+
+    assert compiled.get(obj) == expected
+    assert _.get(obj, compiled) == _.get(obj, path)
+    assert compiled.has(obj) is _.has(obj, path)
+    assert _.compile_path(compiled) is compiled
+
+
+@parametrize('path,obj,value,expected', [
+    ('a.b', {}, 1, {'a': {'b': 1}}),
+    ('[0].[1]', [[1]], 2, [[1, 2]]),
+])
+def test_compile_path_set(path, obj, value, expected):
+    assert _.compile_path(path).set(obj, value) == expected
+
+
 @parametrize('case,expected', [
     (({'level1': {
         'value': 'value 1',
@@ -232,6 +256,11 @@ def test_for_in_right_aliases(case):
     (({'lev.el1': {'lev\\el2': {'level3': ['value']}}},
       'lev\\.el1.lev\\\\el2.level3.[0]'),
      'value'),
+    (({'one': fixtures.Object(two={'three': 4})}, 'one.two.three'), 4),
+    (({'one': None}, 'one.two', 5), 5),
+    (({'one': [1, 2]}, 'one.two', 5), 5),
+    (({'one': [1, 2]}, 'one.5', 5), 5),
+    ((['one', 'two'], '-1'), 'two'),
 ])
 def test_get(case, expected):
     assert _.get(*case) == expected
@@ -267,6 +296,11 @@ def test_get_aliases(case):
     (({'lev.el1': {r'lev\el2': {'level3': ['value']}}},
       r'lev\.el1.lev\\el2.level3.[0]'),
      True),
+    (({'one': fixtures.Object(two={'three': 4})}, 'one.two.three'), True),
+    (({'one': fixtures.Object(two={'three': 4})}, 'one.three'), False),
+    (({'one': None}, 'one.two'), False),
+    (({'one': [1, 2]}, 'one.two'), False),
+    (({'one': {'two': None}}, 'one.two'), True),
 ])
 def test_has(case, expected):
     assert _.has(*case) == expected
@@ -540,6 +574,58 @@ def test_transform(case, expected):
     assert _.transform(*case) == expected
 
 
+@parametrize('obj,keys', [
+    ({'a': {'b': {'c': 1}}, 'd': {'e': 2}}, ['a', 'b', 'c']),
+    ({'a': [{'c': 1}, {'c': 2}], 'd': {'e': 2}}, ['a', '1', 'c']),
+])
+def test_set_path_shares_structure(obj, keys):
+    original = _.clone_deep(obj)
+    result = _.set_path(obj, 5, keys, mode='path')
+
+    assert obj == original
+    assert _.get(result, keys) == 5
+    assert result['d'] is obj['d']
+    assert result['a'] is not obj['a']
+
+
+@parametrize('mode', [None, 'deep'])
+def test_set_path_deep_mode(mode):
+    obj = {'a': {'b': 1}, 'd': {'e': 2}}
+    result = _.set_path(obj, 5, ['a', 'b'], mode=mode)
+
+    assert obj == {'a': {'b': 1}, 'd': {'e': 2}}
+    assert result == {'a': {'b': 5}, 'd': {'e': 2}}
+    assert result['d'] is not obj['d']
+
+
+def test_set_copies_by_default():
+    obj = {'a': {'b': 1}, 'x': {'y': 1}}
+    result = _.set_(obj, 'a.c', 2)
+
+    assert result['x'] is not obj['x']
+    assert result['a'] == {'b': 1, 'c': 2}
+    assert obj == {'a': {'b': 1}, 'x': {'y': 1}}
+
+
+def test_set_path_inplace_mode():
+    obj = {'a': {'b': 1}, 'd': {'e': 2}}
+    result = _.set_path(obj, 5, ['a', 'b'], mode='inplace')
+
+    assert result is obj
+    assert obj == {'a': {'b': 5}, 'd': {'e': 2}}
+
+
+def test_update_path_invalid_mode():
+    raised = False
+
+    try:
+        _.update_path({}, lambda value: value, ['a'], mode='invalid')
+    except ValueError:
+        raised = True
+
+    assert raised
+
+
 @parametrize('case,expected', [
     (({'rome': 'Republic'},
       lambda value: 'Empire' if value == 'Republic' else value,
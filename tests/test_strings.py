@@ -22,6 +22,44 @@ def test_camel_case(case, expected):
     assert _.camel_case(case) == expected
 
 
+@parametrize('func,case,expected', [
+    (_.camel_case_many, (['foo bar', None, 'foo bar'],),
+     ['fooBar', '', 'fooBar']),
+    (_.human_case_many, (['abc-def_hij lmn', 'user_id'],),
+     ['Abc def hij lmn', 'User']),
+    (_.kebab_case_many, (['fooBar', 5, 'fooBar'],),
+     ['foo-bar', '5', 'foo-bar']),
+    (_.kebab_case_many, ([1, True, 1.0, 1],), ['1', 'true', '1-0', '1']),
+    (_.pascal_case_many, (['FOO BAR_bAz'],), ['FooBarBaz']),
+    (_.pascal_case_many, (['FOO BAR_bAz'], False), ['FooBarBAz']),
+    (_.separator_case_many, (['a!!b___c.d', None], '+'), ['a+b+c+d', '']),
+    (_.snake_case_many, (iter(['fooBar', 'Foo Bar!', 'fooBar']),),
+     ['foo_bar', 'foo_bar', 'foo_bar']),
+    (_.start_case_many, (['fooBar', 'foo_bar', ['a', 'b']],),
+     ['Foo Bar', 'Foo Bar', 'A B']),
+    (_.snake_case_many, ([],), []),
+])
+def test_case_many(func, case, expected):
+    result = func(*case)
+    assert not isinstance(result, list)
+    assert list(result) == expected
+
+
+@parametrize('maxsize', [0, 1, 2, 1024])
+def test_case_many_memoize(maxsize):
+    calls = []
+    texts = ['a b', 'c d', 'a b', 'a b', 'c d']
+
+    def convert(text):
+        calls.append(text)
+        return _.snake_case(text)
+
+    result = list(_.strings.itermemoize(convert, texts, maxsize))
+
+    assert result == ['a_b', 'c_d', 'a_b', 'a_b', 'c_d']
+    assert len(calls) == {0: 5, 1: 4, 2: 2, 1024: 2}[maxsize]
+
+
 @parametrize('case,expected', [
     (('foo',), 'Foo'),
     (('foo bar',), 'Foo bar'),
@@ -124,6 +162,11 @@ def test_count_substr(case, expected):
      'aaaaaaaeceeeeiiii'
      'dnooooo ouuuuythy'),
     ('abcABC', 'abcABC'),
+    (u'\u0100\u0107\u010C\u0111\u0118\u011F\u0126\u0131\u0132\u0141'
+     u'\u0142\u0144\u0152\u0153\u015A\u0161\u0167\u016F\u017D\u017F',
+     'AcCdEgHiIJLlnOeoeSstuZs'),
+    (u'Cr\xe8me br\xfbl\xe9e \u0141\xf3d\u017a', 'Creme brulee Lodz'),
+    (u'\u4e2d\u6587', u'\u4e2d\u6587'),
     ('', ''),
     (None, ''),
 ])
@@ -131,6 +174,15 @@ def test_deburr(case, expected):
     assert _.deburr(case) == expected
 
 
+def test_deburr_unicode():
+    result = _.deburr(u'd\xe9j\xe0 vu \u0141\xf3d\u017a')
+
+    assert result == u'deja vu Lodz'
+    assert isinstance(result, _._compat.text_type)
+    assert all(isinstance(value, _._compat.text_type)
+               for value in _.strings.DEBURR_TABLE.values())
+
+
 @parametrize('case,expected', [
     ('Foo', 'foo'),
     ('Foo bar', 'foo bar'),
@@ -301,12 +353,36 @@ def test_join_aliases(case):
     (('hello world', '/[A-Z]/i'), ['h']),
     (('hello world', '/[A-Z]/gi'),
      ['h', 'e', 'l', 'l', 'o', 'w', 'o', 'r', 'l', 'd']),
-    (('12345', '/[A-Z]/'), [])
+    (('12345', '/[A-Z]/'), []),
+    (('a\nb\nc', '/^[a-z]$/gm'), ['a', 'b', 'c']),
+    (('a\nb\nc', '/^[a-z]$/g'), []),
 ])
 def test_js_match(case, expected):
     assert _.js_match(*case) == expected
 
 
+def test_js_regexp_cache():
+    cache = _.strings.JS_RE_CACHE
+    cache.clear()
+
+    assert _.js_match('aaBBcc', '/b+/gi') == ['BB']
+    assert cache.misses == 1
+    assert cache.hits == 0
+
+    assert _.js_replace('aaBBcc', '/b+/gi', 'X') == 'aaXcc'
+    assert _.js_match('xxbyy', '/b+/gi') == ['b']
+    assert cache.misses == 1
+    assert cache.hits == 2
+
+    assert _.strings.js_to_py_re('/b+/gi') is _.strings.js_to_py_re('/b+/gi')
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
 @parametrize('case,expected', [
     (('Hello World', '/[A-Z]/', '!'), '!ello World'),
     (('Hello World', '/[A-Z]/g', '!'), '!ello !orld'),
@@ -591,6 +667,8 @@ def test_series_phrase_serial(case, expected):
     ('Foo Bar', 'foo-bar'),
     (' foo bar ', 'foo-bar'),
     (u'Un éléphant à l\'orée du bois', 'un-elephant-a-l-oree-du-bois'),
+    (u'Stra\xdfe \xc6gir \u0141\xf3d\u017a', 'strasse-aegir-lodz'),
+    ('fooBar', 'foo-bar'),
     ('', ''),
     (5, '5'),
     (None, ''),
@@ -599,6 +677,23 @@ def test_slugify(case, expected):
     assert _.slugify(case) == expected
 
 
+def test_slugify_unicode():
+    result = _.slugify(u'H\xe9llo W\xf6rld')
+
+    assert result == u'hello-world'
+    assert isinstance(result, _._compat.text_type)
+
+
+@parametrize('case,expected', [
+    ((['Foo Bar', u'Stra\xdfe', 'Foo Bar', None],),
+     ['foo-bar', 'strasse', 'foo-bar', '']),
+    ((iter(['Foo Bar', 'Foo Bar']), '+'), ['foo+bar', 'foo+bar']),
+    (([],), []),
+])
+def test_slugify_many(case, expected):
+    assert list(_.slugify_many(*case)) == expected
+
+
 @parametrize('case,expected', [
     ('foo  bar baz', 'foo_bar_baz'),
     ('foo__bar_baz', 'foo_bar_baz'),
@@ -920,6 +1015,16 @@ def test_words(case, expected):
     assert _.words(case) == expected
 
 
+@parametrize('case,expected', [
+    (('a b', None), ['a', 'b']),
+    (('a b', ''), ['a', 'b']),
+    (('fred, barney, & pebbles', '/[^, ]+/g'),
+     ['fred', 'barney', '&', 'pebbles']),
+])
+def test_words_pattern(case, expected):
+    assert _.words(*case) == expected
+
+
 @parametrize('case,expected', [
     ('enable 24h format', 'enable24HFormat'),
 ])
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import functools
+import sys
+import threading
 import time
 
 import pydash as _
@@ -103,6 +106,36 @@ def test_iteratee_aliases(case):
     assert _.iteratee is case
 
 
+class ArgcountHelper(object):
+    def method(self, a, b):
+        pass
+
+
+@parametrize('callback,key,cache', [
+    (ArgcountHelper().method, ArgcountHelper.__dict__['method'],
+     '_ARGCOUNT_CACHE'),
+    (functools.partial(lambda a, b, c: None, 1), None, '_ARGCOUNT_CACHE'),
+    (_.curry(lambda a, b, c: None), None, '_ARGCOUNT_CACHE'),
+    (lambda *args: None, None, '_ARGCOUNT_CACHE'),
+    (len, len, '_BUILTIN_ARGCOUNT_CACHE'),
+    (max, max, '_BUILTIN_ARGCOUNT_CACHE'),
+    (int, int, '_ARGCOUNT_CACHE'),
+    ([].append, None, None),
+])
+def test_argcount_cache(callback, key, cache):
+    expected = _.helpers._inspect_argcount(callback)
+
+    assert _.helpers._get_cached_argcount(callback) == expected
+
+    if cache is not None:
+        if key is None:
+            key = callback
+        assert getattr(_.helpers, cache)[key] == expected
+
+    # Cache hits return the same count as inspecting the callback.
+    assert _.helpers._get_cached_argcount(callback) == expected
+
+
 @parametrize('case,arg,expected', [
     ({'age': 36}, {'name': 'barney', 'age': 36}, True),
     ({'age': 36}, {'name': 'barney', 'age': 40}, False),
@@ -123,8 +156,9 @@ def test_matches_property(case, arg, expected):
 
 
 @parametrize('case,args,kargs,key', [
-    ((lambda a, b: a + b,), (1, 2), {}, '(1, 2){}'),
-    ((lambda a, b: a + b,), (1,), {'b': 2}, "(1,){'b': 2}"),
+    ((lambda a, b: a + b,), (1, 2), {}, (1, 2, int, int)),
+    ((lambda a, b: a + b,), (1,), {'b': 2},
+     (1, _.utilities.MEMOIZE_KWARGS_MARK, ('b', 2), int, int)),
     ((lambda a, b: a + b, lambda a, b: a * b), (1, 2), {}, 2),
     ((lambda a, b: a + b, lambda a, b: a * b), (1,), {'b': 2}, 2),
 ])
@@ -136,6 +170,244 @@ def test_memoize(case, args, kargs, key):
     assert memoized.cache[key] == expected
 
 
+def test_memoize_typed():
+    memoized = _.memoize(repr)
+
+    assert ([memoized(1), memoized(True), memoized(1.0)] ==
+            ['1', 'True', '1.0'])
+    assert memoized(1) == '1'
+
+    memoized = _.memoize(lambda value=None: repr(value))
+
+    assert [memoized(value=1), memoized(value=True)] == ['1', 'True']
+
+
+def test_memoize_unhashable():
+    calls = []
+
+    def func(*args, **kargs):
+        calls.append(args)
+        return len(args)
+
+    memoized = _.memoize(func)
+
+    assert memoized([1, 2], {'a': [3]}) == 2
+    assert memoized([1, 2], {'a': [3]}) == 2
+    assert memoized((1, 2), {'a': [3]}) == 2
+    assert memoized(set([1])) == 1
+    assert len(calls) == 3
+    assert memoized.cache_info().hits == 1
+
+
+def test_memoize_maxsize():
+    memoized = _.memoize(lambda x: x * 2, maxsize=2)
+
+    memoized(1)
+    memoized(2)
+    memoized(1)
+    memoized(3)
+
+    assert (1, int) in memoized.cache
+    assert (2, int) not in memoized.cache
+    assert (3, int) in memoized.cache
+    assert memoized.cache_info() == (1, 3, 1, 2, 2)
+
+    memoized.cache_clear()
+
+    assert memoized.cache_info() == (0, 0, 0, 2, 0)
+    assert len(memoized.cache) == 0
+
+
+def test_memoize_cache_iteration():
+    memoized = _.memoize(lambda x: x * 2, maxsize=2)
+
+    memoized(1)
+    memoized(2)
+    memoized(1)
+    memoized(3)
+
+    assert list(memoized.cache) == [(1, int), (3, int)]
+    assert memoized.cache.keys() == [(1, int), (3, int)]
+    assert memoized.cache.values() == [2, 6]
+    assert memoized.cache.items() == [((1, int), 2), ((3, int), 6)]
+    assert dict(memoized.cache.items()) == {(1, int): 2, (3, int): 6}
+    # Listing the cache doesn't count as a lookup.
+    assert memoized.cache_info() == (1, 3, 1, 2, 2)
+
+
+def test_memoize_cache_iteration_ttl():
+    now = [0]
+    cache = _.helpers.LRUCache(maxsize=None, ttl=10, timer=lambda: now[0])
+
+    cache['a'] = 1
+    now[0] = 5
+    cache['b'] = 2
+    now[0] = 12
+
+    assert list(cache) == ['b']
+    assert cache.items() == [('b', 2)]
+
+
+def test_memoize_weight():
+    memoized = _.memoize(lambda n: 'x' * n, maxsize=10, weight=len)
+
+    memoized(4)
+    memoized(5)
+    memoized(3)
+
+    assert (4, int) not in memoized.cache
+    assert memoized.cache_info().currsize == 8
+
+    memoized(20)
+
+    assert (20, int) not in memoized.cache
+    assert memoized.cache_info().currsize == 8
+
+
+def test_memoize_ttl():
+    calls = []
+    memoized = _.memoize(lambda x: calls.append(x) or x, ttl=0.01)
+
+    memoized(1)
+    memoized(1)
+    time.sleep(0.02)
+    memoized(1)
+
+    assert calls == [1, 1]
+    assert memoized.cache_info().evictions == 1
+
+
+def test_memoize_threads():
+    memoized = _.memoize(lambda x: x * 2, maxsize=16)
+
+    def worker():
+        for i in range(1000):
+            assert memoized(i % 32) == (i % 32) * 2
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    info = memoized.cache_info()
+
+    assert info.hits + info.misses == 4000
+    assert info.currsize == len(memoized.cache) == 16
+
+
+def test_memoize_single_flight():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def func(x):
+        calls.append(x)
+        started.set()
+        release.wait()
+        return x * 2
+
+    memoized = _.memoize(func)
+    results = []
+
+    def worker():
+        results.append(memoized(1))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    threads[0].start()
+    started.wait()
+
+    for thread in threads[1:]:
+        thread.start()
+
+    time.sleep(0.05)
+    release.set()
+
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == [2] * 5
+
+
+def test_memoize_single_flight_error():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def func(x):
+        calls.append(x)
+        started.set()
+        release.wait()
+        if len(calls) == 1:
+            raise ValueError(x)
+        return x
+
+    memoized = _.memoize(func)
+    errors = []
+
+    def worker():
+        try:
+            memoized(1)
+        except ValueError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    threads[0].start()
+    started.wait()
+
+    for thread in threads[1:]:
+        thread.start()
+
+    time.sleep(0.05)
+    release.set()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3
+    assert memoized(1) == 1
+    assert calls == [1, 1]
+
+
+def test_memoize_async():
+    if _._compat.asyncio is None or sys.version_info < (3, 5):
+        return
+
+    namespace = {'asyncio': _._compat.asyncio, 'calls': []}
+    # Defined with exec since async def isn't valid syntax before Python 3.5.
+    exec('async def fetch(x):\n'
+         '    calls.append(x)\n'
+         '    await asyncio.sleep(0.01)\n'
+         '    if x < 0:\n'
+         '        raise ValueError(x)\n'
+         '    return x * 2\n'
+         'async def gather(func, args):\n'
+         '    return await asyncio.gather(*[func(arg) for arg in args],\n'
+         '                                return_exceptions=True)\n',
+         namespace)
+    memoized = _.memoize(namespace['fetch'])
+    loop = _._compat.asyncio.new_event_loop()
+
+    def run(*args):
+        return loop.run_until_complete(namespace['gather'](memoized, args))
+
+    try:
+        assert run(1, 1, 1, 1, 1) == [2] * 5
+        assert run(1, 2) == [2, 4]
+
+        errors = run(-1, -1)
+        assert all(isinstance(error, ValueError) for error in errors)
+        run(-1)
+    finally:
+        loop.close()
+
+    assert namespace['calls'] == [1, 2, -1, -1]
+    assert memoized.cache_info().currsize == 2
+
+
 @parametrize('case,args,kargs,expected', [
     (('a.b',), ({'a': {'b': lambda x, y: x + y}}, 1, 2), {}, 3),
     (('a.b',), ({'a': {'b': lambda x, y: x + y}}, 1,), {'y': 2}, 3),
@@ -172,6 +444,9 @@ def test_now():
      [{'name': 'fred', 'age': 40},
       {'name': 'barney', 'age': 36}],
      ['fred', 'barney']),
+    ('name',
+     [fixtures.Object(name='fred'), fixtures.Object(age=36)],
+     ['fred', None]),
 ])
 def test_property_(case, arg, expected):
     assert _.map_(arg, _.property_(case)) == expected